@@ -197,7 +197,8 @@ async def main():
         logger.info("Uploading documents to Qdrant...")
         await qdrant_service.upsert_documents(
             documents=SAMPLE_DOCUMENTS,
-            vectors=vectors
+            vectors=vectors,
+            wait=True,  # points_count below should reflect this upload
         )
 
         # Verify upload
@@ -1,13 +1,14 @@
 """Ticket processing endpoints."""
 
 import logging
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import BaseModel, Field
 
+from ...config import settings
 from ...models.ticket import TicketInput, TicketOutput
 from ...models.state import SupportTicketState
 from ...workflow import build_support_workflow
-from ...services import QdrantService, EmbeddingService
+from ...services import QdrantService, EmbeddingService, llm_response_cache
 from ...utils.metrics import Timer, metrics
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,77 @@ class ProcessResponse(BaseModel):
     result: TicketOutput
 
 
+class BatchProcessRequest(BaseModel):
+    """Request for batch ticket processing endpoint."""
+
+    tickets: list[TicketInput] = Field(..., min_length=1, max_length=100)
+
+
+class BatchItemResult(BaseModel):
+    """Result for a single ticket within a batch."""
+
+    success: bool
+    ticket_id: str
+    result: TicketOutput | None = None
+    error: str | None = None
+
+
+class BatchProcessResponse(BaseModel):
+    """Response for batch ticket processing endpoint."""
+
+    processed: int
+    failed: int
+    results: list[BatchItemResult]
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic-core's Rust JSON encoder.
+
+    Returning a Response directly skips FastAPI's response_model
+    re-validation and jsonable_encoder pass; response_model is still
+    declared on the routes for the OpenAPI schema.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json"
+    )
+
+
+def _build_initial_state(ticket: TicketInput) -> SupportTicketState:
+    """Build the initial workflow state for a ticket."""
+    return {
+        "ticket_id": ticket.ticket_id,
+        "raw_message": ticket.raw_message,
+        "customer_name": ticket.customer_name,
+        "customer_email": ticket.customer_email
+    }
+
+
+def _build_result(result: dict) -> TicketOutput:
+    """Wrap the workflow output in TicketOutput and record metrics.
+
+    validation_node already validated the output against TicketOutput (or
+    replaced it with its fallback), so the dict is trusted here and not
+    validated a second time.
+
+    Raises:
+        ValueError: If the workflow did not produce output
+    """
+    output_data = result.get("output")
+    if not output_data:
+        raise ValueError("Workflow did not produce output")
+
+    triage = output_data["triage"]
+    metrics.increment_counter("tickets_processed")
+    metrics.increment_counter(f"priority_{triage['priority']}")
+    metrics.increment_counter(f"category_{triage['category']}")
+    metrics.increment_counter(
+        f"compliance_{output_data['policy_check']['compliance']}"
+    )
+
+    return TicketOutput.model_construct(**output_data)
+
+
 @router.post(
     "/process",
     response_model=ProcessResponse,
@@ -58,7 +130,7 @@ class ProcessResponse(BaseModel):
         "draft response, and citations."
     )
 )
-async def process_ticket(ticket: TicketInput) -> ProcessResponse:
+async def process_ticket(ticket: TicketInput) -> Response:
     """Process a support ticket through the workflow.
 
     This endpoint:
@@ -82,46 +154,28 @@ async def process_ticket(ticket: TicketInput) -> ProcessResponse:
         initialize_workflow()
 
     # Build initial state
-    initial_state: SupportTicketState = {
-        "ticket_id": ticket.ticket_id,
-        "raw_message": ticket.raw_message,
-        "customer_name": ticket.customer_name,
-        "customer_email": ticket.customer_email
-    }
+    initial_state = _build_initial_state(ticket)
 
     try:
         # Execute workflow with timing
         with Timer(f"ticket_processing_{ticket.ticket_id}"):
             result = await workflow.ainvoke(initial_state)
 
-        # Extract output
-        output_data = result.get("output")
-        if not output_data:
-            raise ValueError("Workflow did not produce output")
-
-        # Validate output
-        validated_output = TicketOutput(**output_data)
-
-        # Record metrics
-        metrics.increment_counter("tickets_processed")
-        metrics.increment_counter(f"priority_{validated_output.triage.priority}")
-        metrics.increment_counter(f"category_{validated_output.triage.category}")
-        metrics.increment_counter(
-            f"compliance_{validated_output.policy_check.compliance}"
-        )
+        # Wrap output and record metrics
+        output = _build_result(result)
 
         logger.info(
             f"Ticket {ticket.ticket_id} processed successfully - "
-            f"Priority: {validated_output.triage.priority}, "
-            f"Category: {validated_output.triage.category}, "
-            f"Compliance: {validated_output.policy_check.compliance}"
+            f"Priority: {output.triage['priority']}, "
+            f"Category: {output.triage['category']}, "
+            f"Compliance: {output.policy_check['compliance']}"
         )
 
-        return ProcessResponse(
+        return _json_response(ProcessResponse(
             success=True,
             ticket_id=ticket.ticket_id,
-            result=validated_output
-        )
+            result=output
+        ))
 
     except Exception as e:
         logger.error(f"Failed to process ticket {ticket.ticket_id}: {e}", exc_info=True)
@@ -133,6 +187,76 @@ async def process_ticket(ticket: TicketInput) -> ProcessResponse:
         )
 
 
+@router.post(
+    "/process-batch",
+    response_model=BatchProcessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Process multiple support tickets",
+    description=(
+        "Process a batch of support tickets concurrently. Tickets are run "
+        "through the workflow with workflow.abatch() so their LLM, embedding "
+        "and Qdrant calls are in flight at the same time."
+    )
+)
+async def process_ticket_batch(request: BatchProcessRequest) -> Response:
+    """Process a batch of support tickets through the workflow.
+
+    ⚠️ max_concurrency must be set explicitly - without it the batch is
+    effectively serialized. Rate limits (HTTP 429) are handled by the
+    OpenAI client's built-in exponential backoff (OPENAI_MAX_RETRIES).
+
+    Args:
+        request: Batch of input tickets
+
+    Returns:
+        Per-ticket results; a failing ticket does not fail the whole batch
+    """
+    logger.info(f"Processing batch of {len(request.tickets)} tickets")
+
+    if workflow is None:
+        initialize_workflow()
+
+    states = [_build_initial_state(ticket) for ticket in request.tickets]
+
+    with Timer(f"ticket_batch_processing_{len(states)}"):
+        results = await workflow.abatch(
+            states,
+            config={"max_concurrency": settings.BATCH_MAX_CONCURRENCY},
+            return_exceptions=True
+        )
+
+    items: list[BatchItemResult] = []
+    for ticket, result in zip(request.tickets, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            items.append(BatchItemResult(
+                success=True,
+                ticket_id=ticket.ticket_id,
+                result=_build_result(result)
+            ))
+        except Exception as e:
+            logger.error(f"Failed to process ticket {ticket.ticket_id}: {e}")
+            metrics.increment_counter("tickets_failed")
+            items.append(BatchItemResult(
+                success=False,
+                ticket_id=ticket.ticket_id,
+                error=str(e)
+            ))
+
+    failed = sum(1 for item in items if not item.success)
+
+    logger.info(
+        f"Batch complete - Processed: {len(items) - failed}, Failed: {failed}"
+    )
+
+    return _json_response(BatchProcessResponse(
+        processed=len(items) - failed,
+        failed=failed,
+        results=items
+    ))
+
+
 @router.get(
     "/metrics",
     summary="Get processing metrics",
@@ -142,6 +266,9 @@ async def get_metrics() -> dict:
     """Get current processing metrics.
 
     Returns:
-        Metrics statistics including counters, timers, and gauges
+        Metrics statistics including counters, timers, gauges and
+        LLM response cache stats
     """
-    return metrics.get_stats()
+    stats = metrics.get_stats()
+    stats["llm_cache"] = llm_response_cache.get_stats()
+    return stats
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     API_WORKERS: int = 4
     API_TIMEOUT: int = 60
+    BATCH_MAX_CONCURRENCY: int = 20  # Concurrent workflows in /process-batch
 
     # OpenAI
     OPENAI_API_KEY: str
@@ -25,14 +26,26 @@ class Settings(BaseSettings):
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-large"
     OPENAI_MAX_RETRIES: int = 3
     OPENAI_TIMEOUT: int = 30
+    EMBEDDING_CACHE_SIZE: int = 10000  # Cached query embeddings (LRU)
+    LLM_CACHE_ENABLED: bool = True  # Exact-match response cache (temperature 0 only)
+    LLM_CACHE_SIZE: int = 1024
+    LLM_CACHE_TTL: int = 3600
+    LLM_BATCH_ENABLED: bool = False  # Coalesce concurrent intent-detection calls
+    LLM_BATCH_WINDOW_MS: int = 250
+    LLM_BATCH_MAX_SIZE: int = 8
 
     # Qdrant
     QDRANT_HOST: str = "localhost"
     QDRANT_PORT: int = 6333
     QDRANT_GRPC_PORT: int = 6334
+    QDRANT_PREFER_GRPC: bool = True  # Protobuf transport instead of REST/JSON
     QDRANT_COLLECTION: str = "support_knowledge_base"
     QDRANT_API_KEY: Optional[str] = None
     QDRANT_HTTPS: bool = False  # ⚠️ Default False for local dev!
+    QDRANT_BATCH_WINDOW_MS: int = 20  # Coalesce concurrent searches (0 = off)
+    QDRANT_BATCH_MAX_SIZE: int = 32
+    QDRANT_UPSERT_BATCH_SIZE: int = 256  # Points per upsert request
+    QDRANT_UPSERT_CONCURRENCY: int = 4  # Concurrent upsert requests
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
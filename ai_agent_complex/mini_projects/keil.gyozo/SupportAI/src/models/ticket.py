@@ -1,8 +1,9 @@
 """Ticket input/output models."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Annotated, Optional
 from pydantic import BaseModel, EmailStr, Field
+from typing_extensions import NotRequired, TypedDict  # pydantic needs these on Python < 3.12
 
 
 def utc_now() -> str:
@@ -39,52 +40,56 @@ class TicketInput(BaseModel):
     }
 
 
-class AnswerDraft(BaseModel):
+# Leaf output schemas are TypedDicts: they are only ever validated and
+# serialized through TicketOutput, and pydantic validates them as plain
+# dicts without constructing model instances.
+
+class AnswerDraft(TypedDict):
     """Draft response structure."""
 
-    greeting: str = Field(..., description="Personalized greeting")
-    body: str = Field(..., description="Main response body with [DOC-ID] citations")
-    closing: str = Field(..., description="Professional closing")
-    tone: str = Field(
-        default="empathetic_professional",
+    greeting: Annotated[str, Field(description="Personalized greeting")]
+    body: Annotated[str, Field(description="Main response body with [DOC-ID] citations")]
+    closing: Annotated[str, Field(description="Professional closing")]
+    tone: NotRequired[Annotated[str, Field(
         description="Response tone: empathetic_professional | formal | casual"
-    )
+    )]]
 
 
-class TriageOutput(BaseModel):
+class TriageOutput(TypedDict):
     """Triage classification output."""
 
-    category: str = Field(..., description="Main category")
-    subcategory: str = Field(..., description="Specific subcategory")
-    priority: str = Field(..., pattern="^P[1-3]$", description="Priority level: P1/P2/P3")
-    sla_hours: int = Field(..., ge=1, le=168, description="SLA in hours")
-    suggested_team: str = Field(..., description="Recommended team for assignment")
-    sentiment: str = Field(..., description="Customer sentiment")
-    confidence: float = Field(..., ge=0, le=1, description="Classification confidence")
+    category: Annotated[str, Field(description="Main category")]
+    subcategory: Annotated[str, Field(description="Specific subcategory")]
+    priority: Annotated[str, Field(pattern="^P[1-3]$", description="Priority level: P1/P2/P3")]
+    sla_hours: Annotated[int, Field(ge=1, le=168, description="SLA in hours")]
+    suggested_team: Annotated[str, Field(description="Recommended team for assignment")]
+    sentiment: Annotated[str, Field(description="Customer sentiment")]
+    confidence: Annotated[float, Field(ge=0, le=1, description="Classification confidence")]
 
 
-class CitationOutput(BaseModel):
+class CitationOutput(TypedDict):
     """Citation reference for knowledge base articles."""
 
-    doc_id: str = Field(..., description="Document ID")
-    chunk_id: str = Field(..., description="Specific chunk ID")
-    title: str = Field(..., description="Document title")
-    score: float = Field(..., ge=0, le=1, description="Relevance score")
-    url: str = Field(..., description="Knowledge base URL")
+    doc_id: Annotated[str, Field(description="Document ID")]
+    chunk_id: Annotated[str, Field(description="Specific chunk ID")]
+    title: Annotated[str, Field(description="Document title")]
+    score: Annotated[float, Field(ge=0, le=1, description="Relevance score")]
+    url: Annotated[str, Field(description="Knowledge base URL")]
 
 
-class PolicyCheckOutput(BaseModel):
+class PolicyCheckOutput(TypedDict):
     """Policy compliance validation result."""
 
-    refund_promise: bool = Field(..., description="Contains refund promise")
-    sla_mentioned: bool = Field(..., description="Mentions SLA/timeline")
-    escalation_needed: bool = Field(..., description="Requires escalation")
-    compliance: str = Field(
-        ...,
+    refund_promise: Annotated[bool, Field(description="Contains refund promise")]
+    sla_mentioned: Annotated[bool, Field(description="Mentions SLA/timeline")]
+    escalation_needed: Annotated[bool, Field(description="Requires escalation")]
+    compliance: Annotated[str, Field(
         pattern="^(passed|failed|warning)$",
         description="Overall compliance status"
-    )
-    issues: Optional[list[str]] = Field(default=None, description="Compliance issues found")
+    )]
+    issues: NotRequired[Annotated[Optional[list[str]], Field(
+        description="Compliance issues found"
+    )]]
 
 
 class TicketOutput(BaseModel):
@@ -72,7 +72,7 @@ async def draft_answer_node(state: SupportTicketState) -> dict:
     }
     tone_instruction = tone_guidance.get(sentiment, tone_guidance["neutral"])
 
-    llm = get_llm(temperature=0.3)  # Slightly creative for natural language
+    llm = get_llm(temperature=0.3, prompt_cache_key="draft_answer_v1")  # Slightly creative for natural language
     structured_llm = llm.with_structured_output(DraftWithCitations)
 
     prompt = ChatPromptTemplate.from_messages([
@@ -152,7 +152,7 @@ Draft a helpful response to this customer.""")
         )
 
         return {
-            "answer_draft": answer_draft.model_dump(),
+            "answer_draft": answer_draft,
             "citations": citations
         }
 
@@ -171,7 +171,7 @@ Draft a helpful response to this customer.""")
         )
 
         return {
-            "answer_draft": fallback_draft.model_dump(),
+            "answer_draft": fallback_draft,
             "citations": [],
             "errors": [f"Draft generation error: {str(e)}"]
         }
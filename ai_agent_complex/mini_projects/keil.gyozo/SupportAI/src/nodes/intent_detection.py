@@ -3,11 +3,13 @@
 import logging
 from datetime import datetime, timezone
 
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from ..config import settings
 from ..models.state import SupportTicketState
 from ..services import get_llm
+from ..services.llm_batcher import get_batched_llm
 
 logger = logging.getLogger(__name__)
 
@@ -29,25 +31,7 @@ class IntentResult(BaseModel):
     )
 
 
-async def intent_detection_node(state: SupportTicketState) -> dict:
-    """Detect problem type and customer sentiment.
-
-    This is the first node in the workflow. It analyzes the customer's message
-    to understand what type of problem they're experiencing and their emotional state.
-
-    Args:
-        state: Current workflow state containing raw_message
-
-    Returns:
-        Dictionary with problem_type and sentiment fields
-    """
-    logger.info(f"Detecting intent for ticket: {state.get('ticket_id')}")
-
-    llm = get_llm(temperature=0)
-    structured_llm = llm.with_structured_output(IntentResult)
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an expert at analyzing customer support messages.
+INTENT_SYSTEM_PROMPT = """You are an expert at analyzing customer support messages.
 
 Your task is to identify:
 1. **Problem Type**: What category does this issue fall into?
@@ -63,22 +47,49 @@ Your task is to identify:
 
 3. **Urgency Keywords**: Look for words like "urgent", "immediately", "ASAP", "critical", etc.
 
-Be objective and accurate. The sentiment detection will influence priority assignment."""),
-        ("human", """Ticket ID: {ticket_id}
+Be objective and accurate. The sentiment detection will influence priority assignment."""
+
+INTENT_HUMAN_TEMPLATE = """Ticket ID: {ticket_id}
 Customer: {customer_name}
 Message: {message}
 
-Analyze this support ticket and classify the problem type and sentiment.""")
-    ])
+Analyze this support ticket and classify the problem type and sentiment."""
 
-    chain = prompt | structured_llm
+
+async def intent_detection_node(state: SupportTicketState) -> dict:
+    """Detect problem type and customer sentiment.
+
+    This is the first node in the workflow. It analyzes the customer's message
+    to understand what type of problem they're experiencing and their emotional state.
+
+    Args:
+        state: Current workflow state containing raw_message
+
+    Returns:
+        Dictionary with problem_type and sentiment fields
+    """
+    logger.info(f"Detecting intent for ticket: {state.get('ticket_id')}")
 
     try:
-        result = await chain.ainvoke({
-            "ticket_id": state.get("ticket_id", "UNKNOWN"),
-            "customer_name": state.get("customer_name", "Customer"),
-            "message": state["raw_message"]
-        })
+        message = INTENT_HUMAN_TEMPLATE.format(
+            ticket_id=state.get("ticket_id", "UNKNOWN"),
+            customer_name=state.get("customer_name", "Customer"),
+            message=state["raw_message"]
+        )
+
+        if settings.LLM_BATCH_ENABLED:
+            # Coalesce with concurrent tickets into one LLM call
+            batcher = get_batched_llm(
+                "intent_detection_v1", INTENT_SYSTEM_PROMPT, IntentResult
+            )
+            result = await batcher.ainvoke(message)
+        else:
+            llm = get_llm(temperature=0, prompt_cache_key="intent_detection_v1")
+            structured_llm = llm.with_structured_output(IntentResult)
+            result = await structured_llm.ainvoke([
+                SystemMessage(content=INTENT_SYSTEM_PROMPT),
+                HumanMessage(content=message)
+            ])
 
         logger.info(
             f"Intent detected - Type: {result.problem_type}, "
@@ -41,6 +41,30 @@ class PolicyCheckResult(BaseModel):
     )
 
 
+# Compliance rules - never changes between calls, so it leads the prompt
+# (see TRIAGE_RUBRIC in triage_classify.py).
+POLICY_RUBRIC = """You are a compliance officer reviewing automated support responses.
+
+CHECK:
+1. REFUND PROMISE (needs manager approval): "we will refund", "you'll receive a refund", credits, compensation. Allowed: "may be eligible", "we'll review".
+2. SLA COMMITMENT (needs authorization): "within 24 hours", "by tomorrow", "same day". Allowed: "within our standard timeframe", "as quickly as possible".
+3. ESCALATION NEEDED: legal, security breach, privacy request, multiple unresolved issues, customer asked to escalate.
+4. OTHER: internal process/system details, policy exceptions, guaranteed outcomes.
+COMPLIANCE: passed=no violations | warning=1-2 soft violations, review suggested | failed=critical violation, human review required"""
+
+POLICY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", POLICY_RUBRIC),
+    ("human", """Category: {category}
+Priority: {priority}
+Sentiment: {sentiment}
+
+Draft Response:
+{response}
+
+Check this response for policy compliance.""")
+])
+
+
 async def policy_check_node(state: SupportTicketState) -> dict:
     """Validate draft response against company policies and business rules.
 
@@ -80,48 +104,10 @@ async def policy_check_node(state: SupportTicketState) -> dict:
     # Combine draft parts for analysis
     full_response = f"{answer_draft.get('body', '')} {answer_draft.get('closing', '')}"
 
-    llm = get_llm(temperature=0)
+    llm = get_llm(temperature=0, prompt_cache_key="policy_check_v1")
     structured_llm = llm.with_structured_output(PolicyCheckResult)
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a compliance officer reviewing automated support responses.
-
-**Check for these policy violations:**
-
-1. **Refund Promises** - Requires manager approval:
-   - Direct promises: "we will refund", "you'll receive a refund"
-   - Credits or compensation promises
-   - Flag as violation unless: "may be eligible", "we'll review"
-
-2. **SLA Commitments** - Specific timeframes require authorization:
-   - "within 24 hours", "by tomorrow", "same day"
-   - OK: "within our standard timeframe", "as quickly as possible"
-
-3. **Escalation Needed** - Complex issues requiring specialist:
-   - Legal matters, security breaches, privacy requests
-   - Multiple unresolved issues
-   - Customer explicitly requested escalation
-
-4. **Other Violations:**
-   - Sharing internal processes or system details
-   - Making exceptions to standard policy
-   - Guarantees of specific outcomes
-
-**Compliance Levels:**
-- passed: No violations found
-- warning: Minor issues, suggest review (1-2 soft violations)
-- failed: Critical violations, human review required"""),
-        ("human", """Category: {category}
-Priority: {priority}
-Sentiment: {sentiment}
-
-Draft Response:
-{response}
-
-Check this response for policy compliance.""")
-    ])
-
-    chain = prompt | structured_llm
+    chain = POLICY_PROMPT | structured_llm
 
     try:
         result = await chain.ainvoke({
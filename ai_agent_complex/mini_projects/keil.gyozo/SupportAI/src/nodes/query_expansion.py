@@ -43,7 +43,7 @@ async def query_expansion_node(state: SupportTicketState) -> dict:
     """
     logger.info(f"Expanding queries for ticket: {state.get('ticket_id')}")
 
-    llm = get_llm(temperature=0.3)  # Slightly higher temp for variation
+    llm = get_llm(temperature=0.3, prompt_cache_key="query_expansion_v1")  # Slightly higher temp for variation
     structured_llm = llm.with_structured_output(QueryExpansionResult)
 
     prompt = ChatPromptTemplate.from_messages([
@@ -3,13 +3,48 @@
 import logging
 from typing import Optional
 
+import numpy as np
+
 from ..models.state import SupportTicketState
-from ..models.rag import RAGDocument
 from ..services import QdrantService, EmbeddingService
 
 logger = logging.getLogger(__name__)
 
 
+def dedupe_by_chunk_id(docs: list[dict], top_k: int) -> list[dict]:
+    """Deduplicate hits by chunk_id (keeping the best score) and return top-k.
+
+    Scores are sorted once with NumPy; walking the descending order means the
+    first occurrence of each chunk_id is its highest-scoring hit.
+
+    Args:
+        docs: Search hits from all queries (may contain duplicate chunks)
+        top_k: Maximum number of documents to return
+
+    Returns:
+        Unique documents sorted by score (descending)
+    """
+    if not docs:
+        return []
+
+    scores = np.fromiter((doc["score"] for doc in docs), dtype=np.float64, count=len(docs))
+    order = np.argsort(-scores, kind="stable")
+
+    seen: set[str] = set()
+    unique_docs: list[dict] = []
+    for idx in order:
+        doc = docs[idx]
+        chunk_id = doc["chunk_id"]
+        if chunk_id in seen:
+            continue
+        seen.add(chunk_id)
+        unique_docs.append(doc)
+        if len(unique_docs) == top_k:
+            break
+
+    return unique_docs
+
+
 async def rag_search_node(
     state: SupportTicketState,
     qdrant_service: Optional[QdrantService] = None,
@@ -20,10 +55,10 @@ async def rag_search_node(
     """Search knowledge base for relevant documents using vector similarity.
 
     This node performs hybrid search:
-    1. Generates embeddings for each search query
-    2. Searches Qdrant vector database
+    1. Generates embeddings for all search queries in one batch call
+    2. Searches Qdrant vector database with one batch request
     3. Optionally filters by category
-    4. Deduplicates results by chunk_id
+    4. Deduplicates results by chunk_id (vectorized sort)
     5. Returns top-k most relevant documents
 
     Args:
@@ -36,7 +71,7 @@ async def rag_search_node(
     Returns:
         Dictionary with retrieved_docs list
     """
-    logger.info(f"Searching knowledge base for ticket: {state.get('ticket_id')}")
+    logger.info("Searching knowledge base for ticket: %s", state.get("ticket_id"))
 
     # Initialize services if not provided
     if qdrant_service is None:
@@ -50,53 +85,47 @@ async def rag_search_node(
         search_queries = [state["raw_message"][:200]]
 
     category = state.get("category")
-    all_docs: dict[str, dict] = {}  # chunk_id -> document (for deduplication)
 
     try:
-        # Search for each query
-        for i, query in enumerate(search_queries, 1):
-            logger.debug(f"Searching query {i}/{len(search_queries)}: {query}")
-
-            # Generate embedding
-            query_vector = await embedding_service.embed_query(query)
-
-            # Search Qdrant
-            results = await qdrant_service.search(
-                query_vector=query_vector,
-                top_k=top_k,
-                category_filter=category if category else None,
-                score_threshold=score_threshold
-            )
+        # Generate embeddings for all queries (cached, misses in one batch request)
+        query_vectors = await embedding_service.embed_queries(search_queries)
+
+        # Search Qdrant for all queries in a single batch request
+        batch_results = await qdrant_service.search_batch(
+            query_vectors=query_vectors,
+            top_k=top_k,
+            category_filter=category if category else None,
+            score_threshold=score_threshold
+        )
 
-            # Deduplicate by chunk_id (keep highest score)
-            for doc in results:
-                chunk_id = doc["chunk_id"]
-                if chunk_id not in all_docs or doc["score"] > all_docs[chunk_id]["score"]:
-                    all_docs[chunk_id] = doc
+        # Flatten hits from all queries into parallel arrays
+        docs: list[dict] = []
+        for i, (query, results) in enumerate(zip(search_queries, batch_results), 1):
+            logger.debug(
+                "Query %d/%d returned %d docs: %s",
+                i,
+                len(search_queries),
+                len(results),
+                query,
+            )
+            docs.extend(results)
 
-        # Sort by score and return top results
-        sorted_docs = sorted(
-            all_docs.values(),
-            key=lambda x: x["score"],
-            reverse=True
-        )[:top_k]
+        sorted_docs = dedupe_by_chunk_id(docs, top_k)
 
         logger.info(
-            f"Retrieved {len(sorted_docs)} unique documents "
-            f"(from {len(search_queries)} queries)"
+            "Retrieved %d unique documents (from %d queries)",
+            len(sorted_docs),
+            len(search_queries),
         )
 
-        # Validate documents with Pydantic
-        validated_docs = [
-            RAGDocument(**doc).model_dump() for doc in sorted_docs
-        ]
-
+        # NOTE: No per-document Pydantic round-trip here - the dicts are built by
+        # QdrantService._hit_to_document and already match the RAGDocument schema.
         return {
-            "retrieved_docs": validated_docs
+            "retrieved_docs": sorted_docs
         }
 
     except Exception as e:
-        logger.error(f"RAG search failed: {e}")
+        logger.error("RAG search failed: %s", e)
         return {
             "retrieved_docs": [],
             "errors": [f"RAG search error: {str(e)}"]
@@ -55,10 +55,10 @@ async def rerank_node(
         logger.warning("No documents to re-rank")
         return {"reranked_docs": []}
 
-    # Convert to RAGDocument objects
-    rag_docs = [RAGDocument(**doc) for doc in retrieved_docs]
+    # Convert to RAGDocument objects (trusted search_rag output, skip validation)
+    rag_docs = [RAGDocument.model_construct(**doc) for doc in retrieved_docs]
 
-    llm = get_llm(temperature=0)
+    llm = get_llm(temperature=0, prompt_cache_key="rerank_v1")
     structured_llm = llm.with_structured_output(RelevanceScore)
 
     prompt = ChatPromptTemplate.from_messages([
@@ -31,6 +31,27 @@ class TriageResult(BaseModel):
         return v
 
 
+# Static rubric kept as the first (system) message so it forms a stable,
+# byte-identical prompt prefix that OpenAI prompt caching can reuse.
+TRIAGE_RUBRIC = """You are a support ticket triage specialist.
+
+CATEGORIES: Billing (payments, charges, invoices, refunds, subscriptions) | Technical (bugs, errors, performance) | Account (login, password, profile, permissions) | Feature Request (new features, enhancements)
+PRIORITY: P1=4h (outage, security breach, payment fully blocked) | P2=24h (significant issue, billing error, frustrated customer, partial impact) | P3=72h (general question, minor issue, feature request, neutral/satisfied tone)
+TEAMS: Billing->Finance Team | Technical->Engineering | Account->Account Management | Feature Request->Product
+RULES: frustrated => P2 minimum; payment-affecting billing => P2 (P1 if fully blocked); urgent language or multiple issues may raise priority; confidence reflects message clarity."""
+
+TRIAGE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", TRIAGE_RUBRIC),
+    ("human", """Ticket ID: {ticket_id}
+Customer: {customer_name}
+Problem Type: {problem_type}
+Sentiment: {sentiment}
+Message: {message}
+
+Classify this ticket with category, priority, SLA, and suggested team.""")
+])
+
+
 async def triage_classify_node(state: SupportTicketState) -> dict:
     """Classify ticket and assign priority and SLA.
 
@@ -53,44 +74,10 @@ async def triage_classify_node(state: SupportTicketState) -> dict:
     """
     logger.info(f"Triaging ticket: {state.get('ticket_id')}")
 
-    llm = get_llm(temperature=0)
+    llm = get_llm(temperature=0, prompt_cache_key="triage_classify_v1")
     structured_llm = llm.with_structured_output(TriageResult)
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a support ticket triage specialist.
-
-**Categories:**
-- Billing: Payments, charges, invoices, refunds, subscriptions
-- Technical: Bugs, errors, performance issues, features not working
-- Account: Login, password, profile, access, permissions
-- Feature Request: New features, enhancements, product suggestions
-
-**Priority Levels:**
-- P1 (Critical, 4h SLA): Service outages, security breaches, payment completely blocked
-- P2 (High, 24h SLA): Significant issues, billing errors, frustrated customers, partial service impact
-- P3 (Normal, 72h SLA): General questions, minor issues, feature requests, satisfied/neutral tone
-
-**Teams:**
-- Finance Team: Billing, payments, refunds, invoices
-- Engineering: Technical issues, bugs, performance
-- Account Management: Account access, profile, permissions
-- Product: Feature requests, enhancements
-
-**IMPORTANT:**
-- Frustrated customers should generally get priority boost (P2 minimum)
-- Billing issues affecting payments are typically P2 (or P1 if completely blocked)
-- Multiple issues or urgent language may warrant higher priority
-- Provide a confidence score based on clarity of the message"""),
-        ("human", """Ticket ID: {ticket_id}
-Customer: {customer_name}
-Problem Type: {problem_type}
-Sentiment: {sentiment}
-Message: {message}
-
-Classify this ticket with category, priority, SLA, and suggested team.""")
-    ])
-
-    chain = prompt | structured_llm
+    chain = TRIAGE_PROMPT | structured_llm
 
     try:
         result = await chain.ainvoke({
@@ -1,8 +1,11 @@
 """Validation node - final output validation and formatting."""
 
 import logging
+import time
 from datetime import datetime, timezone
 
+from pydantic import ValidationError
+
 from ..models.state import SupportTicketState
 from ..models.ticket import (
     TicketOutput,
@@ -14,13 +17,101 @@ from ..models.ticket import (
 
 logger = logging.getLogger(__name__)
 
+# Field order resolved once at import - citation payloads carry extra keys
+# (e.g. cited_text) that CitationOutput does not declare.
+_CIT_FIELDS = tuple(CitationOutput.__annotations__)
+
+# Fallback output pieces - built once, reused by every failed validation
+_FALLBACK_ANSWER = AnswerDraft(
+    greeting="Hi,",
+    body="We've received your support request and a specialist will review it shortly.",
+    closing="Best regards,\nSupport Team",
+    tone="empathetic_professional",
+)
+_FALLBACK_TRIAGE_DEFAULTS = (
+    ("category", "category", "Technical"),
+    ("subcategory", "subcategory", "General Issue"),
+    ("priority", "priority", "P3"),
+    ("sla_hours", "sla_hours", 72),
+    ("suggested_team", "suggested_team", "Support Team"),
+    ("sentiment", "sentiment", "neutral"),
+    ("confidence", "triage_confidence", 0.0),
+)
+_FALLBACK_POLICY_FLAGS = {
+    "refund_promise": False,
+    "sla_mentioned": False,
+    "escalation_needed": True,
+    "compliance": "failed",
+}
+
+# (epoch seconds, ISO string) of the last formatted timestamp
+_ts_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601, re-formatted at most once per second.
+
+    Output timestamps are informational, so tickets finishing within the
+    same second share one formatted string.
+    """
+    global _ts_cache
+    now = time.time()
+    if now - _ts_cache[0] >= 1.0:
+        _ts_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
+def _build_output_dict(state: SupportTicketState) -> dict:
+    """Assemble the output dict with the exact shape of TicketOutput.model_dump().
+
+    Upstream nodes already produced validated values, so no intermediate
+    pydantic models are built here.
+
+    Raises:
+        KeyError: If a required upstream field is missing
+    """
+    draft_data = state.get("answer_draft", {})
+    policy_data = state.get("policy_check", {})
+
+    return {
+        "ticket_id": state["ticket_id"],
+        "timestamp": _now_iso(),
+        "triage": {
+            "category": state["category"],
+            "subcategory": state["subcategory"],
+            "priority": state["priority"],
+            "sla_hours": state["sla_hours"],
+            "suggested_team": state["suggested_team"],
+            "sentiment": state["sentiment"],
+            "confidence": state["triage_confidence"],
+        },
+        "answer_draft": {
+            "greeting": draft_data.get("greeting", "Hi,"),
+            "body": draft_data.get("body", ""),
+            "closing": draft_data.get("closing", "Best regards,\nSupport Team"),
+            "tone": draft_data.get("tone", "empathetic_professional"),
+        },
+        "citations": [
+            {field: citation[field] for field in _CIT_FIELDS}
+            for citation in state.get("citations", [])
+        ],
+        "policy_check": {
+            "refund_promise": policy_data.get("refund_promise", False),
+            "sla_mentioned": policy_data.get("sla_mentioned", False),
+            "escalation_needed": policy_data.get("escalation_needed", False),
+            "compliance": policy_data.get("compliance", "warning"),
+            "issues": policy_data.get("issues"),
+        },
+    }
+
 
 async def validation_node(state: SupportTicketState) -> dict:
     """Validate and format final output as structured JSON.
 
     This is the final node in the workflow. It:
     1. Validates all required fields are present
-    2. Converts to output schema with Pydantic validation
+    2. Assembles the output schema as a plain dict and validates it
+       against TicketOutput (the API route trusts this result)
     3. Adds metadata (timestamp, etc.)
     4. Returns structured JSON for API response
 
@@ -30,103 +121,53 @@ async def validation_node(state: SupportTicketState) -> dict:
     Returns:
         Dictionary with validated 'output' field
     """
-    logger.info(f"Validating output for ticket: {state.get('ticket_id')}")
+    logger.info("Validating output for ticket: %s", state.get("ticket_id"))
 
     try:
-        # Build triage output
-        triage = TriageOutput(
-            category=state["category"],
-            subcategory=state["subcategory"],
-            priority=state["priority"],
-            sla_hours=state["sla_hours"],
-            suggested_team=state["suggested_team"],
-            sentiment=state["sentiment"],
-            confidence=state["triage_confidence"]
-        )
+        output = _build_output_dict(state)
 
-        # Build answer draft output
-        draft_data = state.get("answer_draft", {})
-        answer_draft = AnswerDraft(
-            greeting=draft_data.get("greeting", "Hi,"),
-            body=draft_data.get("body", ""),
-            closing=draft_data.get("closing", "Best regards,\nSupport Team"),
-            tone=draft_data.get("tone", "empathetic_professional")
-        )
-
-        # Build citations output
-        citations_data = state.get("citations", [])
-        citations = [
-            CitationOutput(**citation) for citation in citations_data
-        ]
-
-        # Build policy check output
-        policy_data = state.get("policy_check", {})
-        policy_check = PolicyCheckOutput(
-            refund_promise=policy_data.get("refund_promise", False),
-            sla_mentioned=policy_data.get("sla_mentioned", False),
-            escalation_needed=policy_data.get("escalation_needed", False),
-            compliance=policy_data.get("compliance", "warning"),
-            issues=policy_data.get("issues")
-        )
-
-        # Build complete output
-        output = TicketOutput(
-            ticket_id=state["ticket_id"],
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            triage=triage,
-            answer_draft=answer_draft,
-            citations=citations,
-            policy_check=policy_check
-        )
+        # Single schema check for the ticket: bad data raises here and is
+        # handled by the fallback branch below. The dict itself is returned.
+        TicketOutput.model_validate(output)
 
         logger.info(
-            f"Validation complete - Compliance: {policy_check.compliance}, "
-            f"Citations: {len(citations)}, "
-            f"Priority: {triage.priority}"
+            "Validation complete - Compliance: %s, Citations: %d, Priority: %s",
+            output["policy_check"]["compliance"],
+            len(output["citations"]),
+            output["triage"]["priority"],
         )
 
         return {
-            "output": output.model_dump()
+            "output": output
         }
 
-    except Exception as e:
-        logger.error(f"Validation failed: {e}")
+    except (KeyError, TypeError, AttributeError, ValidationError) as e:
+        # Missing upstream field, malformed upstream value, or schema violation
+        logger.error("Validation failed: %s", e)
 
         # Try to build minimal valid output
         try:
+            error_message = f"Validation error: {str(e)}"
             minimal_output = TicketOutput(
                 ticket_id=state.get("ticket_id", "UNKNOWN"),
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                triage=TriageOutput(
-                    category=state.get("category", "Technical"),
-                    subcategory=state.get("subcategory", "General Issue"),
-                    priority=state.get("priority", "P3"),
-                    sla_hours=state.get("sla_hours", 72),
-                    suggested_team=state.get("suggested_team", "Support Team"),
-                    sentiment=state.get("sentiment", "neutral"),
-                    confidence=state.get("triage_confidence", 0.0)
-                ),
-                answer_draft=AnswerDraft(
-                    greeting="Hi,",
-                    body="We've received your support request and a specialist will review it shortly.",
-                    closing="Best regards,\nSupport Team",
-                    tone="empathetic_professional"
-                ),
+                timestamp=_now_iso(),
+                triage=TriageOutput(**{
+                    field: state.get(key, default)
+                    for field, key, default in _FALLBACK_TRIAGE_DEFAULTS
+                }),
+                answer_draft=_FALLBACK_ANSWER,
                 citations=[],
                 policy_check=PolicyCheckOutput(
-                    refund_promise=False,
-                    sla_mentioned=False,
-                    escalation_needed=True,
-                    compliance="failed",
-                    issues=[f"Validation error: {str(e)}"]
+                    **_FALLBACK_POLICY_FLAGS,
+                    issues=[error_message]
                 )
             )
 
             return {
                 "output": minimal_output.model_dump(),
-                "errors": [f"Validation error: {str(e)}"]
+                "errors": [error_message]
             }
 
-        except Exception as fallback_error:
-            logger.critical(f"Even fallback validation failed: {fallback_error}")
+        except ValidationError as fallback_error:
+            logger.critical("Even fallback validation failed: %s", fallback_error)
             raise
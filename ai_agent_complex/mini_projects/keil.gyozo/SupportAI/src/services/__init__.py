@@ -3,11 +3,13 @@
 from .qdrant_service import QdrantService
 from .embedding_service import EmbeddingService
 from .llm_service import get_llm
+from .llm_cache import llm_response_cache
 from .cache_service import CacheService
 
 __all__ = [
     "QdrantService",
     "EmbeddingService",
     "get_llm",
+    "llm_response_cache",
     "CacheService",
 ]
@@ -1,6 +1,7 @@
 """OpenAI embedding service."""
 
 import logging
+from collections import OrderedDict
 from typing import Optional
 
 from langchain_openai import OpenAIEmbeddings
@@ -16,16 +17,26 @@ class EmbeddingService:
     def __init__(
         self,
         model: Optional[str] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        cache_size: Optional[int] = None
     ):
         """Initialize embedding service.
 
         Args:
             model: Embedding model name (default: text-embedding-3-large)
             api_key: OpenAI API key
+            cache_size: Max cached query embeddings (0 disables the cache)
         """
         self.model = model or settings.OPENAI_EMBEDDING_MODEL
         self.api_key = api_key or settings.OPENAI_API_KEY
+        self.cache_size = (
+            cache_size if cache_size is not None else settings.EMBEDDING_CACHE_SIZE
+        )
+
+        # LRU cache: normalized query text -> embedding vector.
+        # No lock needed - lookups/inserts never await, so they are atomic
+        # on the event loop.
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
 
         self.embeddings = OpenAIEmbeddings(
             model=self.model,
@@ -36,9 +47,37 @@ class EmbeddingService:
 
         logger.info(f"Initialized embedding service with model: {self.model}")
 
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Normalize query text into a cache key.
+
+        Only used for cache lookups - the original text is what gets embedded,
+        so case-sensitive tokens (KB-/POLICY- ids, product names) are kept.
+        """
+        return " ".join(text.split()).lower()
+
+    def _cache_get(self, key: str) -> Optional[list[float]]:
+        """Return cached embedding and mark it as recently used."""
+        vector = self._query_cache.get(key)
+        if vector is not None:
+            self._query_cache.move_to_end(key)
+        return vector
+
+    def _cache_put(self, key: str, vector: list[float]) -> None:
+        """Store embedding, evicting the least recently used entry if full."""
+        if self.cache_size <= 0:
+            return
+        self._query_cache[key] = vector
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.cache_size:
+            self._query_cache.popitem(last=False)
+
     async def embed_query(self, text: str) -> list[float]:
         """Generate embedding for a single query text.
 
+        Results are cached (LRU) on the normalized text; the original
+        text is sent to the model.
+
         Args:
             text: Query text to embed
 
@@ -48,14 +87,71 @@ class EmbeddingService:
         Raises:
             Exception: If embedding generation fails
         """
+        key = self._normalize(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("Query embedding cache HIT")
+            return cached
+
         try:
             embedding = await self.embeddings.aembed_query(text)
             logger.debug(f"Generated query embedding (dim: {len(embedding)})")
+            self._cache_put(key, embedding)
             return embedding
         except Exception as e:
             logger.error(f"Failed to generate query embedding: {e}")
             raise
 
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple query texts.
+
+        Cached queries are served from the LRU cache; all misses are
+        embedded together in a single batch request.
+
+        Args:
+            texts: Query texts to embed
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            Exception: If embedding generation fails
+        """
+        keys = [self._normalize(text) for text in texts]
+        vectors: dict[str, list[float]] = {}
+        misses: list[str] = []
+        miss_texts: list[str] = []
+
+        # Unique keys in order; the first original text seen for a key is embedded
+        first_texts = {}
+        for key, text in zip(keys, texts):
+            first_texts.setdefault(key, text)
+
+        for key, text in first_texts.items():
+            cached = self._cache_get(key)
+            if cached is not None:
+                vectors[key] = cached
+            else:
+                misses.append(key)
+                miss_texts.append(text)
+
+        if misses:
+            try:
+                embeddings = await self.embeddings.aembed_documents(miss_texts)
+            except Exception as e:
+                logger.error(f"Failed to generate query embeddings: {e}")
+                raise
+
+            for key, embedding in zip(misses, embeddings):
+                vectors[key] = embedding
+                self._cache_put(key, embedding)
+
+        logger.debug(
+            f"Query embeddings: {len(keys) - len(misses)} cached, "
+            f"{len(misses)} generated"
+        )
+        return [vectors[key] for key in keys]
+
     async def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple documents.
 
@@ -0,0 +1,156 @@
+"""Micro-batching for short structured LLM calls.
+
+During traffic bursts many tickets hit the same node (same system prompt,
+same output schema) within milliseconds of each other. LLMBatcher buffers
+those requests for a short window and sends them as ONE chat completion
+that answers a numbered list, then resolves each caller's future with its
+own item. A lone request is sent as a normal single call.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field, create_model
+
+from ..config import settings
+from .llm_service import get_llm
+from .micro_batcher import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+BATCH_INSTRUCTIONS = (
+    "\n\nYou will receive several independent requests numbered [1]..[N]. "
+    "Answer each one on its own, as if it were the only request. Return exactly "
+    "N items in `items`, in the same order as the requests."
+)
+
+
+class LLMBatcher(MicroBatcher[str, BaseModel]):
+    """Coalesce concurrent structured-output calls into batched requests."""
+
+    def __init__(
+        self,
+        system_prompt: str,
+        schema: type[BaseModel],
+        temperature: float = 0.0,
+        max_batch_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        prompt_cache_key: Optional[str] = None,
+    ):
+        """Initialize batcher.
+
+        Args:
+            system_prompt: Static system prompt shared by all requests
+            schema: Pydantic model for a single answer
+            temperature: Sampling temperature
+            max_batch_size: Max requests per LLM call (default: from settings)
+            max_wait: Max seconds to wait for a batch to fill (default: from settings)
+            prompt_cache_key: OpenAI prompt cache key (see get_llm)
+        """
+        super().__init__(
+            run=self._run,
+            max_wait=(
+                max_wait if max_wait is not None else settings.LLM_BATCH_WINDOW_MS / 1000
+            ),
+            max_size=max_batch_size or settings.LLM_BATCH_MAX_SIZE,
+        )
+        self.system_prompt = system_prompt
+        self.schema = schema
+        self.temperature = temperature
+        self.prompt_cache_key = prompt_cache_key
+
+        self.batch_schema = create_model(
+            f"{schema.__name__}Batch",
+            items=(list[schema], Field(..., description="One answer per request, in order")),
+        )
+
+    async def ainvoke(self, message: str) -> BaseModel:
+        """Submit one request and wait for its answer.
+
+        Args:
+            message: Fully formatted user message for this request
+
+        Returns:
+            Parsed answer as an instance of schema
+        """
+        return await self._submit(message)
+
+    async def _run(self, messages: list[str]) -> list[BaseModel]:
+        """Answer a batch; a lone request is sent as a normal single call."""
+        if len(messages) == 1:
+            return [await self._invoke_single(messages[0])]
+        return await self._invoke_batch(messages)
+
+    async def _invoke_single(self, message: str) -> BaseModel:
+        """Send a single request without batching."""
+        llm = get_llm(
+            temperature=self.temperature, prompt_cache_key=self.prompt_cache_key
+        ).with_structured_output(self.schema)
+        return await llm.ainvoke([
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=message),
+        ])
+
+    async def _invoke_batch(self, messages: list[str]) -> list[BaseModel]:
+        """Answer several requests with one LLM call.
+
+        Falls back to individual concurrent calls if the model returns the
+        wrong number of items.
+        """
+        llm = get_llm(
+            temperature=self.temperature, prompt_cache_key=self.prompt_cache_key
+        ).with_structured_output(self.batch_schema)
+
+        numbered = "\n\n".join(
+            f"[{i}]\n{message}" for i, message in enumerate(messages, 1)
+        )
+        result = await llm.ainvoke([
+            SystemMessage(content=self.system_prompt + BATCH_INSTRUCTIONS),
+            HumanMessage(content=numbered),
+        ])
+
+        if len(result.items) == len(messages):
+            logger.debug("Batched %d LLM requests into one call", len(messages))
+            return result.items
+
+        logger.warning(
+            "Batch answer count mismatch (%d != %d), falling back to individual calls",
+            len(result.items),
+            len(messages),
+        )
+        return list(await asyncio.gather(*(self._invoke_single(m) for m in messages)))
+
+
+# Batchers are shared per name so concurrent tickets land in the same queue
+_batchers: dict[str, LLMBatcher] = {}
+
+
+def get_batched_llm(
+    name: str,
+    system_prompt: str,
+    schema: type[BaseModel],
+    temperature: float = 0.0,
+) -> LLMBatcher:
+    """Get (or create) the shared batcher for a node.
+
+    Args:
+        name: Batcher name, also used as the prompt cache key
+        system_prompt: Static system prompt
+        schema: Pydantic model for a single answer
+        temperature: Sampling temperature
+
+    Returns:
+        Shared LLMBatcher instance
+    """
+    batcher = _batchers.get(name)
+    if batcher is None:
+        batcher = LLMBatcher(
+            system_prompt=system_prompt,
+            schema=schema,
+            temperature=temperature,
+            prompt_cache_key=name,
+        )
+        _batchers[name] = batcher
+    return batcher
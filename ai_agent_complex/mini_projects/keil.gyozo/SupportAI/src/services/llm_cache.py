@@ -0,0 +1,116 @@
+"""In-process LLM response cache.
+
+Plugged into ChatOpenAI via its ``cache=`` parameter, so every chain built
+on get_llm() (including with_structured_output) is served from memory when
+the exact same prompt is sent with the exact same model configuration.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLResponseCache(BaseCache):
+    """Bounded LRU cache for LLM generations with per-entry TTL.
+
+    Keys are sha256(llm_string + prompt); LangChain's llm_string already
+    encodes model, temperature and bound tools/schemas, so different
+    configurations never collide.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        """Initialize response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Time-to-live for each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, RETURN_VAL_TYPE]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Hash prompt and model configuration into a compact cache key."""
+        digest = hashlib.sha256(llm_string.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations or None on miss/expiry."""
+        key = self._key(prompt, llm_string)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        logger.debug("LLM response cache HIT")
+        return entry[1]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations, evicting the least recently used entry if full."""
+        key = self._key(prompt, llm_string)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, return_val)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    # Async variants run inline - BaseCache's defaults would hop to a thread
+    # pool for what is a dictionary lookup.
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Async lookup (inline)."""
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Async update (inline)."""
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Async clear (inline)."""
+        self.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global response cache shared by all LLM instances
+llm_response_cache = TTLResponseCache(
+    maxsize=settings.LLM_CACHE_SIZE,
+    ttl=settings.LLM_CACHE_TTL,
+)
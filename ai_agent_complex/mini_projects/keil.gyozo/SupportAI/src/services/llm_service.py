@@ -1,26 +1,66 @@
 """LLM service for getting configured language models."""
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from langchain_openai import ChatOpenAI
 
 from ..config import settings
+from .llm_cache import llm_response_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _get_llm_cached(
+    model_name: str,
+    temperature: float,
+    api_key: str,
+    prompt_cache_key: Optional[str] = None
+) -> ChatOpenAI:
+    """Create a ChatOpenAI instance once per distinct configuration.
+
+    Reusing the instance keeps its underlying httpx client and connection
+    pool alive across node invocations and requests.
+    """
+    llm = ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        openai_api_key=api_key,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        timeout=settings.OPENAI_TIMEOUT,
+        # Sent as a raw request field so it works regardless of SDK version
+        extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
+        # Only deterministic calls are served from the response cache
+        cache=llm_response_cache if settings.LLM_CACHE_ENABLED and temperature == 0 else None,
+    )
+
+    logger.debug(
+        "Created LLM instance: %s (temp=%s, prompt_cache_key=%s)",
+        model_name, temperature, prompt_cache_key,
+    )
+    return llm
+
+
 def get_llm(
     model: Optional[str] = None,
     temperature: float = 0.0,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    prompt_cache_key: Optional[str] = None
 ) -> ChatOpenAI:
     """Get a configured ChatOpenAI instance.
 
+    Instances are cached, so callers must not mutate the returned object
+    (use .bind() / .with_structured_output() instead).
+
     Args:
         model: Model name (default: from settings)
         temperature: Sampling temperature (0.0 for deterministic)
         api_key: OpenAI API key (default: from settings)
+        prompt_cache_key: Stable key for OpenAI prompt caching. Requests
+            sharing a key and a static prompt prefix (>= 1024 tokens) are
+            routed to the same cache, lowering latency and input cost.
 
     Returns:
         Configured ChatOpenAI instance
@@ -28,13 +68,4 @@ def get_llm(
     model_name = model or settings.OPENAI_MODEL
     openai_api_key = api_key or settings.OPENAI_API_KEY
 
-    llm = ChatOpenAI(
-        model=model_name,
-        temperature=temperature,
-        openai_api_key=openai_api_key,
-        max_retries=settings.OPENAI_MAX_RETRIES,
-        timeout=settings.OPENAI_TIMEOUT,
-    )
-
-    logger.debug(f"Created LLM instance: {model_name} (temp={temperature})")
-    return llm
+    return _get_llm_cached(model_name, temperature, openai_api_key, prompt_cache_key)
@@ -0,0 +1,117 @@
+"""Shared micro-batching loop for coalescing concurrent calls.
+
+Callers submit an item and await a future. A collector task buffers items
+for a short window (or until the batch is full), hands the whole batch to
+a run step that returns one result per item, and resolves each caller's
+future with its own result. LLMBatcher and QueryBatcher are built on it.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BatchRunner = Callable[[list[T]], Awaitable[list[R]]]
+
+
+class MicroBatcher(Generic[T, R]):
+    """Buffer concurrent submissions and run them as batches."""
+
+    def __init__(
+        self,
+        run: BatchRunner,
+        max_wait: float,
+        max_size: int,
+        size: Callable[[T], int] = lambda item: 1,
+    ):
+        """Initialize batcher.
+
+        Args:
+            run: Coroutine answering a batch of items, one result per item
+                in input order
+            max_wait: Max seconds to wait for a batch to fill
+            max_size: Flush once the batch holds this many units
+            size: Number of units an item counts for (default: 1)
+        """
+        self.run = run
+        self.max_wait = max_wait
+        self.max_size = max_size
+        self.size = size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The loop only keeps weak references to tasks; hold in-flight
+        # dispatches here so they cannot be garbage-collected mid-call
+        self._dispatches: set[asyncio.Task] = set()
+
+    def _ensure_worker(self) -> None:
+        """Start the collector task on the current event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+
+    async def _submit(self, item: T) -> R:
+        """Queue one item and wait for its result."""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Gather items into batches and dispatch them until idle."""
+        while True:
+            try:
+                batch = [self._queue.get_nowait()]
+            except asyncio.QueueEmpty:
+                return  # idle - restarted by the next submit
+            pending = self.size(batch[0][0])
+            deadline = self._loop.time() + self.max_wait
+
+            while pending < self.max_size:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(entry)
+                pending += self.size(entry[0])
+
+            # Dispatch without blocking collection of the next batch
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        """Run a batch and resolve its futures.
+
+        Every future is settled, whatever happens: if the run step fails or
+        returns the wrong number of results, each caller gets the error; if
+        the dispatch itself is cancelled, so are the callers' futures.
+        """
+        try:
+            results = await self.run([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch run returned {len(results)} results for {len(batch)} items"
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except BaseException as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -7,12 +7,28 @@ VERSION COMPATIBILITY:
 HTTPS CONFIGURATION:
 - Local/Docker: https=False (default HTTP on port 6333)
 - Qdrant Cloud: https=True (required for cloud instances)
+
+TRANSPORT:
+- prefer_grpc=True (default) sends points/searches as protobuf over gRPC
+  (QDRANT_GRPC_PORT, 6334); vectors travel as packed floats instead of JSON.
+- With gRPC, AsyncQdrantClient calls go through grpc.aio stubs, so
+  query_points/upsert never block the event loop and need no raw-stub
+  (client.grpc_points) calls of our own.
+- Set QDRANT_PREFER_GRPC=false if only the REST port is reachable.
 """
 
+import asyncio
+import hashlib
 import logging
+import time
 import uuid
-from typing import Optional
+from collections import ChainMap
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, Union
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
@@ -21,13 +37,80 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     SearchParams,
 )
 
 from ..config import settings
+from .query_batcher import QueryBatcher
 
 logger = logging.getLogger(__name__)
 
+# Payload fields used in search filters - indexed so HNSW can filter during
+# graph traversal instead of post-filtering candidates.
+INDEXED_PAYLOAD_FIELDS = ("category", "subcategory", "doc_type")
+
+# Payload fields returned with each search hit
+_PAYLOAD_KEYS = (
+    "doc_id", "chunk_id", "title", "content", "url",
+    "category", "subcategory", "doc_type",
+)
+_get_payload_fields = itemgetter(*_PAYLOAD_KEYS)
+_PAYLOAD_DEFAULTS = dict.fromkeys(_PAYLOAD_KEYS)
+
+_UUID_NAMESPACE = uuid.NAMESPACE_DNS.bytes
+
+# Clients shared between QdrantService instances, keyed by connection
+# settings, with the number of open services using each one
+_clients: dict[tuple, AsyncQdrantClient] = {}
+_client_refs: dict[tuple, int] = {}
+
+# collection_exists results per (host, port, collection): (expires_at, exists)
+_EXISTS_TTL = 30.0
+_exists_cache: dict[tuple, tuple[float, bool]] = {}
+
+
+def _get_client(
+    host: str,
+    port: int,
+    grpc_port: int,
+    api_key: Optional[str],
+    https: bool,
+    prefer_grpc: bool,
+) -> tuple[tuple, AsyncQdrantClient]:
+    """Get (or create) the shared client for these connection settings.
+
+    Returns:
+        Registry key (needed to release the client) and the client
+    """
+    key = (host, port, grpc_port, api_key, https, prefer_grpc)
+    client = _clients.get(key)
+    if client is None:
+        client = AsyncQdrantClient(
+            host=host,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            api_key=api_key,
+            https=https,  # ⚠️ Must be False for local, True for cloud
+        )
+        _clients[key] = client
+        _client_refs[key] = 0
+    _client_refs[key] += 1
+    return key, client
+
+
+@lru_cache(maxsize=65536)
+def _chunk_uuid(chunk_id: str) -> str:
+    """blake2b-128 of namespace + chunk_id, formatted as a UUID string."""
+    digest = hashlib.blake2b(_UUID_NAMESPACE + chunk_id.encode("utf-8"), digest_size=16)
+    return str(uuid.UUID(bytes=digest.digest(), version=5))
+
 
 class QdrantService:
     """Service for interacting with Qdrant vector database."""
@@ -36,38 +119,69 @@ class QdrantService:
         self,
         host: Optional[str] = None,
         port: Optional[int] = None,
+        grpc_port: Optional[int] = None,
         collection_name: Optional[str] = None,
         api_key: Optional[str] = None,
         https: Optional[bool] = None,
+        prefer_grpc: Optional[bool] = None,
+        client: Optional[AsyncQdrantClient] = None,
     ):
         """Initialize Qdrant client.
 
         Args:
             host: Qdrant host address
-            port: Qdrant port (default: 6333)
+            port: Qdrant REST port (default: 6333)
+            grpc_port: Qdrant gRPC port (default: 6334)
             collection_name: Name of the collection to use
             api_key: API key for Qdrant Cloud (optional)
             https: Use HTTPS connection (False for local, True for cloud)
+            prefer_grpc: Use gRPC instead of REST where supported
+            client: Existing client to use instead of the shared one; it is
+                owned by the caller and not closed by close()
         """
         self.host = host or settings.QDRANT_HOST
         self.port = port or settings.QDRANT_PORT
+        self.grpc_port = grpc_port or settings.QDRANT_GRPC_PORT
         self.collection_name = collection_name or settings.QDRANT_COLLECTION
         self.api_key = api_key or settings.QDRANT_API_KEY
 
         # ⚠️ CRITICAL: Default to False for local development
         # Set QDRANT_HTTPS=true in .env for Qdrant Cloud
         self.https = https if https is not None else settings.QDRANT_HTTPS
-
-        self.client = AsyncQdrantClient(
-            host=self.host,
-            port=self.port,
-            api_key=self.api_key,
-            https=self.https,  # ⚠️ Must be False for local, True for cloud
+        self.prefer_grpc = (
+            prefer_grpc if prefer_grpc is not None else settings.QDRANT_PREFER_GRPC
         )
 
+        # Services with the same settings share one client (connection pool,
+        # gRPC channel); it is closed when the last of them closes.
+        self._client_key: Optional[tuple]
+        if client is not None:
+            self._client_key, self.client = None, client
+        else:
+            self._client_key, self.client = _get_client(
+                host=self.host,
+                port=self.port,
+                grpc_port=self.grpc_port,
+                api_key=self.api_key,
+                https=self.https,
+                prefer_grpc=self.prefer_grpc,
+            )
+
+        # Coalesce concurrent search_batch calls (0 disables)
+        self._query_batcher: Optional[QueryBatcher] = None
+        if settings.QDRANT_BATCH_WINDOW_MS > 0:
+            self._query_batcher = QueryBatcher(
+                execute=self._execute_batch,
+                window=settings.QDRANT_BATCH_WINDOW_MS / 1000,
+                max_requests=settings.QDRANT_BATCH_MAX_SIZE,
+            )
+
         logger.info(
-            f"Initialized Qdrant client: {self.host}:{self.port} "
-            f"(https={'enabled' if self.https else 'disabled'})"
+            "Initialized Qdrant client: %s:%d (transport=%s, https=%s)",
+            self.host,
+            self.grpc_port if self.prefer_grpc else self.port,
+            "grpc" if self.prefer_grpc else "rest",
+            "enabled" if self.https else "disabled",
         )
 
     @staticmethod
@@ -75,8 +189,10 @@ class QdrantService:
         """Convert chunk_id to a deterministic UUID.
 
         IMPORTANT: Qdrant only accepts UUID or unsigned integer IDs!
-        uuid5 is deterministic → same chunk_id = same UUID every time.
+        The id is a blake2b hash of the chunk_id (with UUID version bits set),
+        so it is deterministic → same chunk_id = same UUID every time.
         This enables proper upsert behavior (overwrites existing records).
+        Results are memoized since re-upserts repeat the same chunk_ids.
 
         Args:
             chunk_id: String chunk identifier (e.g., "KB-1234-c-45")
@@ -84,7 +200,7 @@ class QdrantService:
         Returns:
             UUID string that can be used as Qdrant point ID
         """
-        return str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk_id))
+        return _chunk_uuid(chunk_id)
 
     async def create_collection(
         self,
@@ -93,6 +209,11 @@ class QdrantService:
     ) -> bool:
         """Create a new collection in Qdrant.
 
+        Vectors are stored on disk with int8 scalar quantization kept in RAM
+        (~4x smaller); searches rescore the oversampled candidates against
+        the original float32 vectors. Also creates keyword payload indexes
+        for INDEXED_PAYLOAD_FIELDS.
+
         Args:
             vector_size: Dimension of vectors (default: 3072 for text-embedding-3-large)
             distance: Distance metric (COSINE, DOT, EUCLID)
@@ -106,14 +227,84 @@ class QdrantService:
         try:
             await self.client.create_collection(
                 collection_name=self.collection_name,
-                vectors_config=VectorParams(size=vector_size, distance=distance),
+                vectors_config=VectorParams(
+                    size=vector_size,
+                    distance=distance,
+                    on_disk=True,
+                ),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    ),
+                ),
             )
-            logger.info(f"Created collection: {self.collection_name}")
+            for field_name in INDEXED_PAYLOAD_FIELDS:
+                await self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
+            _exists_cache.pop((self.host, self.port, self.collection_name), None)
+            logger.info("Created collection: %s", self.collection_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to create collection: {e}")
+            logger.error("Failed to create collection: %s", e)
             raise
 
+    @staticmethod
+    def _search_params(top_k: int) -> SearchParams:
+        """HNSW search params with beam width scaled to the requested top_k.
+
+        Quantized vectors are used for traversal; 2x oversampled candidates
+        are rescored with full-precision vectors. Ignored by collections
+        created without quantization.
+        """
+        return SearchParams(
+            hnsw_ef=max(64, top_k * 4),
+            exact=False,
+            quantization=QuantizationSearchParams(
+                ignore=False,
+                rescore=True,
+                oversampling=2.0,
+            ),
+        )
+
+    @staticmethod
+    def _build_category_filter(category_filter: Optional[str]) -> Optional[Filter]:
+        """Build a payload filter restricting results to one category.
+
+        Args:
+            category_filter: Category to filter by (None disables filtering)
+
+        Returns:
+            Qdrant Filter or None
+        """
+        if not category_filter:
+            return None
+        return Filter(
+            must=[FieldCondition(key="category", match=MatchValue(value=category_filter))]
+        )
+
+    @staticmethod
+    def _hit_to_document(hit) -> dict:
+        """Convert a Qdrant scored point into a document dictionary.
+
+        Args:
+            hit: ScoredPoint returned by query_points / query_batch_points
+
+        Returns:
+            Document payload fields plus similarity score
+        """
+        payload = hit.payload
+        try:
+            values = _get_payload_fields(payload)
+        except KeyError:
+            # Partial payload - missing fields become None
+            values = _get_payload_fields(ChainMap(payload, _PAYLOAD_DEFAULTS))
+        return dict(zip(_PAYLOAD_KEYS, values), score=hit.score)
+
     async def search(
         self,
         query_vector: list[float],
@@ -137,11 +328,7 @@ class QdrantService:
         Raises:
             Exception: If search fails
         """
-        search_filter = None
-        if category_filter:
-            search_filter = Filter(
-                must=[FieldCondition(key="category", match=MatchValue(value=category_filter))]
-            )
+        search_filter = self._build_category_filter(category_filter)
 
         try:
             # qdrant-client >= 1.13: use query_points() instead of search()
@@ -151,47 +338,131 @@ class QdrantService:
                 query_filter=search_filter,
                 limit=top_k,
                 score_threshold=score_threshold,
-                search_params=SearchParams(hnsw_ef=128, exact=False),
+                search_params=self._search_params(top_k),
             )
 
             documents = [
-                {
-                    "doc_id": hit.payload.get("doc_id"),
-                    "chunk_id": hit.payload.get("chunk_id"),
-                    "title": hit.payload.get("title"),
-                    "content": hit.payload.get("content"),
-                    "url": hit.payload.get("url"),
-                    "score": hit.score,
-                    "category": hit.payload.get("category"),
-                    "subcategory": hit.payload.get("subcategory"),
-                    "doc_type": hit.payload.get("doc_type"),
-                }
+                self._hit_to_document(hit)
                 for hit in results.points  # NOTE: results.points, not results
             ]
 
-            logger.info(f"Found {len(documents)} documents for query")
+            logger.info("Found %d documents for query", len(documents))
             return documents
 
         except Exception as e:
-            logger.error(f"Qdrant search failed: {e}")
+            logger.error("Qdrant search failed: %s", e)
+            raise
+
+    async def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        category_filter: Optional[str] = None,
+        score_threshold: float = 0.7,
+    ) -> list[list[dict]]:
+        """Run several vector searches in a single Qdrant request.
+
+        Uses query_batch_points() so N searches cost one HTTP round-trip
+        and are executed in parallel on the server. Concurrent callers
+        (other tickets) within QDRANT_BATCH_WINDOW_MS share the same request.
+
+        Args:
+            query_vectors: Query embedding vectors
+            top_k: Number of results to return per query
+            category_filter: Optional category to filter by
+            score_threshold: Minimum similarity score (0-1)
+
+        Returns:
+            One list of matching documents per query vector, in input order
+
+        Raises:
+            Exception: If search fails
+        """
+        if not query_vectors:
+            return []
+
+        search_filter = self._build_category_filter(category_filter)
+        search_params = self._search_params(top_k)
+
+        requests = [
+            QueryRequest(
+                query=query_vector,
+                filter=search_filter,
+                limit=top_k,
+                score_threshold=score_threshold,
+                params=search_params,
+                with_payload=True,
+            )
+            for query_vector in query_vectors
+        ]
+
+        if self._query_batcher is not None:
+            return await self._query_batcher.submit(requests)
+        return await self._execute_batch(requests)
+
+    async def _execute_batch(self, requests: list[QueryRequest]) -> list[list[dict]]:
+        """Send prepared requests with one query_batch_points call.
+
+        Args:
+            requests: Query requests (possibly from several callers)
+
+        Returns:
+            One list of matching documents per request, in input order
+
+        Raises:
+            Exception: If search fails
+        """
+        try:
+            responses = await self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests,
+            )
+
+            results = [
+                [self._hit_to_document(hit) for hit in response.points]
+                for response in responses
+            ]
+
+            logger.info(
+                "Found %d documents for %d queries",
+                sum(len(docs) for docs in results),
+                len(requests),
+            )
+            return results
+
+        except Exception as e:
+            logger.error("Qdrant batch search failed: %s", e)
             raise
 
     async def upsert_documents(
         self,
         documents: list[dict],
-        vectors: list[list[float]]
+        vectors: Union[list[list[float]], np.ndarray],
+        batch_size: Optional[int] = None,
+        parallel: Optional[int] = None,
+        wait: bool = False,
     ) -> bool:
         """Insert or update documents in Qdrant.
 
+        Points are built lazily and sent in chunks of batch_size by up to
+        `parallel` concurrent upsert calls, so memory stays bounded and
+        network I/O overlaps with server-side indexing. Vectors are packed
+        into one float32 array up front, matching what Qdrant stores and
+        what the gRPC transport sends.
+
         Args:
             documents: List of document payloads with metadata
-            vectors: List of embedding vectors (must match documents length)
+            vectors: Embedding vectors, list or 2-D array (must match documents length)
+            batch_size: Points per upsert request (default: from settings)
+            parallel: Max concurrent upsert requests (default: from settings)
+            wait: Wait for each batch to be indexed before acknowledging
 
         Returns:
             True if successful
 
         Raises:
-            ValueError: If documents and vectors lengths don't match
+            ValueError: If documents and vectors lengths don't match, or the
+                vectors do not all have the same dimension
             Exception: If upsert fails
         """
         if len(documents) != len(vectors):
@@ -200,25 +471,43 @@ class QdrantService:
                 f"number of vectors ({len(vectors)})"
             )
 
-        points = [
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError(f"Expected 2-D vectors, got shape {vectors.shape}")
+
+        points = (
             PointStruct(
                 id=self.chunk_id_to_uuid(doc["chunk_id"]),  # UUID conversion!
                 vector=vector,
                 payload=doc  # Original chunk_id preserved in payload
             )
             for doc, vector in zip(documents, vectors)
-        ]
+        )
+        batch_size = batch_size or settings.QDRANT_UPSERT_BATCH_SIZE
+        parallel = parallel or settings.QDRANT_UPSERT_CONCURRENCY
+        batches = iter(lambda: list(islice(points, batch_size)), [])
+
+        async def upload_worker() -> None:
+            # Workers share one iterator, each pulling the next chunk when free
+            for batch in batches:
+                await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=batch,
+                    wait=wait,
+                )
 
         try:
-            await self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
-            logger.info(f"Upserted {len(points)} documents to {self.collection_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Qdrant upsert failed: {e}")
-            raise
+            # TaskGroup cancels the remaining workers as soon as one fails
+            async with asyncio.TaskGroup() as group:
+                for _ in range(max(1, parallel)):
+                    group.create_task(upload_worker())
+        except ExceptionGroup as eg:
+            error = eg.exceptions[0]
+            logger.error("Qdrant upsert failed: %s", error)
+            raise error from None
+
+        logger.info("Upserted %d documents to %s", len(documents), self.collection_name)
+        return True
 
     async def health_check(self) -> bool:
         """Check Qdrant connection health.
@@ -230,21 +519,33 @@ class QdrantService:
             await self.client.get_collections()
             return True
         except Exception as e:
-            logger.warning(f"Qdrant health check failed: {e}")
+            logger.warning("Qdrant health check failed: %s", e)
             return False
 
     async def collection_exists(self) -> bool:
         """Check if collection exists.
 
+        The answer is cached for _EXISTS_TTL seconds (shared by services on
+        the same host) so readiness probes don't hit Qdrant every time.
+        create_collection / delete_collection invalidate it.
+
         Returns:
             True if collection exists, False otherwise
         """
+        cache_key = (self.host, self.port, self.collection_name)
+        cached = _exists_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
             collections = await self.client.get_collections()
-            return any(c.name == self.collection_name for c in collections.collections)
         except Exception:
             return False
 
+        exists = self.collection_name in {c.name for c in collections.collections}
+        _exists_cache[cache_key] = (time.monotonic() + _EXISTS_TTL, exists)
+        return exists
+
     async def delete_collection(self) -> bool:
         """Delete the collection.
 
@@ -256,10 +557,11 @@ class QdrantService:
         """
         try:
             await self.client.delete_collection(collection_name=self.collection_name)
-            logger.info(f"Deleted collection: {self.collection_name}")
+            _exists_cache.pop((self.host, self.port, self.collection_name), None)
+            logger.info("Deleted collection: %s", self.collection_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete collection: {e}")
+            logger.error("Failed to delete collection: %s", e)
             raise
 
     async def get_collection_info(self) -> dict:
@@ -277,10 +579,20 @@ class QdrantService:
                 "status": info.status,
             }
         except Exception as e:
-            logger.error(f"Failed to get collection info: {e}")
+            logger.error("Failed to get collection info: %s", e)
             raise
 
     async def close(self) -> None:
-        """Close the Qdrant client connection."""
+        """Release the shared client, closing it if no other service uses it."""
+        key, self._client_key = self._client_key, None
+        if key is None:
+            return  # already closed, or client injected by the caller
+
+        _client_refs[key] -= 1
+        if _client_refs[key] > 0:
+            return
+
+        del _client_refs[key]
+        _clients.pop(key, None)
         await self.client.close()
         logger.info("Closed Qdrant client connection")
@@ -0,0 +1,76 @@
+"""Cross-request coalescing of Qdrant vector searches.
+
+Each ticket already sends its expanded queries as one query_batch_points
+call. Under concurrent load, QueryBatcher goes one step further: search
+groups submitted by different tickets within a short window are merged
+into a single query_batch_points request and the responses are split back
+per caller.
+"""
+
+import logging
+from typing import Awaitable, Callable
+
+from qdrant_client.models import QueryRequest
+
+from .micro_batcher import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+BatchExecutor = Callable[[list[QueryRequest]], Awaitable[list[list[dict]]]]
+
+
+class QueryBatcher(MicroBatcher[list[QueryRequest], list[list[dict]]]):
+    """Merge concurrent search groups into shared batch requests."""
+
+    def __init__(
+        self,
+        execute: BatchExecutor,
+        window: float = 0.02,
+        max_requests: int = 32,
+    ):
+        """Initialize batcher.
+
+        Args:
+            execute: Coroutine running a list of QueryRequests in one call
+            window: Max seconds to wait for other groups to arrive
+            max_requests: Flush once this many requests are queued
+        """
+        super().__init__(
+            run=self._run,
+            max_wait=window,
+            max_size=max_requests,
+            size=len,
+        )
+        self.execute = execute
+
+    async def submit(self, requests: list[QueryRequest]) -> list[list[dict]]:
+        """Queue a group of requests and wait for their results.
+
+        Args:
+            requests: Requests belonging to one caller
+
+        Returns:
+            One result list per request, in input order
+        """
+        return await self._submit(requests)
+
+    async def _run(
+        self, groups: list[list[QueryRequest]]
+    ) -> list[list[list[dict]]]:
+        """Run merged requests and split the results back per group."""
+        merged = [request for requests in groups for request in requests]
+        results = await self.execute(merged)
+
+        if len(groups) > 1:
+            logger.debug(
+                "Coalesced %d search groups into one request (%d queries)",
+                len(groups),
+                len(merged),
+            )
+
+        sliced = []
+        offset = 0
+        for requests in groups:
+            sliced.append(results[offset:offset + len(requests)])
+            offset += len(requests)
+        return sliced
@@ -1,11 +1,23 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from ..config import settings
 
+# Background listener writing queued records to stdout
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush and stop the current listener (registered with atexit once)."""
+    if _listener is not None:
+        _listener.stop()
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -13,24 +25,52 @@ def setup_logging(
 ) -> None:
     """Configure application logging.
 
+    Request handlers only enqueue log records; a QueueListener thread does
+    the formatting and stdout I/O. Thread/process attributes are not
+    collected since the format does not use them.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_string: Custom log format string
     """
+    global _listener
+
     log_level = level or settings.LOG_LEVEL
     log_format = format_string or (
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # Skip per-record attribute lookups not used by the format
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter(log_format, style="%", validate=False)
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # QueueHandler only merges args into the message; layout is applied by
+    # stream_handler on the listener thread
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler]
     )
 
+    # basicConfig is a no-op if the root logger already has handlers
+    if queue_handler in logging.getLogger().handlers:
+        if _listener is None:
+            atexit.register(_stop_listener)
+        else:
+            _listener.stop()
+        _listener = QueueListener(log_queue, stream_handler)
+        _listener.start()
+
     # Set levels for third-party loggers (reduce noise)
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
@@ -38,4 +78,4 @@ def setup_logging(
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured - Level: {log_level}")
+    logger.info("Logging configured - Level: %s", log_level)
@@ -93,6 +93,18 @@ class TestAPIIntegration:
 
         assert response.status_code == 422  # Validation error
 
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_process_batch_rejects_empty_batch(self, api_client: AsyncClient):
+        """Test POST /api/v1/tickets/process-batch with no tickets."""
+
+        response = await api_client.post(
+            "/api/v1/tickets/process-batch",
+            json={"tickets": []}
+        )
+
+        assert response.status_code == 422  # Validation error
+
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_get_metrics_endpoint(self, api_client: AsyncClient):
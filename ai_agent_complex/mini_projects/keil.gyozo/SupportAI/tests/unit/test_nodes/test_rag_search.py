@@ -0,0 +1,90 @@
+"""Unit tests for RAG search node."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.nodes.rag_search import rag_search_node
+from src.models.state import SupportTicketState
+
+
+def _doc(chunk_id: str, score: float) -> dict:
+    """Build a search hit as returned by QdrantService.search."""
+    return {
+        "doc_id": chunk_id.split("-c-")[0],
+        "chunk_id": chunk_id,
+        "title": f"Title {chunk_id}",
+        "content": f"Content {chunk_id}",
+        "url": f"https://kb.company.com/{chunk_id}",
+        "score": score,
+        "category": "billing",
+        "subcategory": None,
+        "doc_type": "kb_article",
+    }
+
+
+class TestRagSearchNode:
+    """Test suite for RAG search node."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_embeds_all_queries_in_one_call(self):
+        """All expanded queries should be embedded with a single batch request."""
+
+        state: SupportTicketState = {
+            "ticket_id": "TKT-001",
+            "raw_message": "I was charged twice for my subscription",
+            "search_queries": ["duplicate charge", "refund timeline"],
+        }
+
+        embedding_service = AsyncMock()
+        embedding_service.embed_queries.return_value = [[0.1] * 8, [0.2] * 8]
+
+        qdrant_service = AsyncMock()
+        qdrant_service.search_batch.return_value = [
+            [_doc("KB-1-c-1", 0.9)],
+            [],
+        ]
+
+        result = await rag_search_node(
+            state,
+            qdrant_service=qdrant_service,
+            embedding_service=embedding_service,
+        )
+
+        embedding_service.embed_queries.assert_awaited_once_with(
+            ["duplicate charge", "refund timeline"]
+        )
+        embedding_service.embed_query.assert_not_called()
+        qdrant_service.search_batch.assert_awaited_once()
+        qdrant_service.search.assert_not_called()
+        assert len(result["retrieved_docs"]) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_deduplicates_by_chunk_id_keeping_best_score(self):
+        """Duplicate chunks across queries keep the highest score, sorted desc."""
+
+        state: SupportTicketState = {
+            "ticket_id": "TKT-002",
+            "raw_message": "Where is my refund?",
+            "search_queries": ["refund", "refund status"],
+        }
+
+        embedding_service = AsyncMock()
+        embedding_service.embed_queries.return_value = [[0.1] * 8, [0.2] * 8]
+
+        qdrant_service = AsyncMock()
+        qdrant_service.search_batch.return_value = [
+            [_doc("KB-1-c-1", 0.75), _doc("KB-2-c-1", 0.8)],
+            [_doc("KB-1-c-1", 0.95)],
+        ]
+
+        result = await rag_search_node(
+            state,
+            qdrant_service=qdrant_service,
+            embedding_service=embedding_service,
+        )
+
+        docs = result["retrieved_docs"]
+        assert [d["chunk_id"] for d in docs] == ["KB-1-c-1", "KB-2-c-1"]
+        assert docs[0]["score"] == 0.95
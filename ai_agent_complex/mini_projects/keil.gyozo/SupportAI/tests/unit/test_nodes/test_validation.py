@@ -0,0 +1,127 @@
+"""Unit tests for validation node."""
+
+import pytest
+
+from src.nodes.validation import _now_iso, validation_node
+from src.models.state import SupportTicketState
+from src.models.ticket import TicketOutput
+
+
+@pytest.fixture
+def completed_state() -> SupportTicketState:
+    """State as produced by the full workflow before validate_output."""
+    return {
+        "ticket_id": "TKT-001",
+        "raw_message": "I was charged twice for my subscription",
+        "sentiment": "frustrated",
+        "category": "Billing",
+        "subcategory": "Duplicate Charge",
+        "priority": "P2",
+        "sla_hours": 24,
+        "suggested_team": "Finance Team",
+        "triage_confidence": 0.92,
+        "answer_draft": {
+            "greeting": "Hi John,",
+            "body": "Duplicate charges are resolved within 3-5 days [KB-1234].",
+            "closing": "Best regards,\nSupport Team",
+            "tone": "empathetic_professional",
+        },
+        "citations": [
+            {
+                "doc_id": "KB-1234",
+                "chunk_id": "KB-1234-c-45",
+                "title": "Duplicate Charge Resolution",
+                "score": 0.89,
+                "url": "https://kb.company.com/billing/duplicate",
+                "cited_text": None,
+            }
+        ],
+        "policy_check": {
+            "refund_promise": False,
+            "sla_mentioned": True,
+            "escalation_needed": False,
+            "compliance": "warning",
+            "issues": ["Specific SLA timeframe mentioned"],
+        },
+    }
+
+
+class TestValidationNode:
+    """Test suite for validation node."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_output_matches_ticket_output_schema(self, completed_state):
+        """Happy-path output must round-trip through TicketOutput unchanged."""
+
+        result = await validation_node(completed_state)
+
+        assert "errors" not in result
+        output = result["output"]
+        assert TicketOutput(**output).model_dump() == output
+        assert output["triage"]["priority"] == "P2"
+        assert output["citations"] == [
+            {
+                "doc_id": "KB-1234",
+                "chunk_id": "KB-1234-c-45",
+                "title": "Duplicate Charge Resolution",
+                "score": 0.89,
+                "url": "https://kb.company.com/billing/duplicate",
+            }
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_missing_triage_falls_back(self, completed_state):
+        """Missing upstream fields produce the minimal escalation output."""
+
+        del completed_state["category"]
+
+        result = await validation_node(completed_state)
+
+        assert result["errors"]
+        output = result["output"]
+        assert output["triage"]["category"] == "Technical"
+        assert output["policy_check"]["compliance"] == "failed"
+        assert output["policy_check"]["escalation_needed"] is True
+        assert output["citations"] == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_schema_violation_triggers_fallback(self, completed_state):
+        """Schema violations are caught in the node and produce the fallback."""
+
+        completed_state["citations"][0]["score"] = 1.5  # must be within 0-1
+
+        result = await validation_node(completed_state)
+        assert result["errors"]
+        assert result["output"]["policy_check"]["compliance"] == "failed"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_incomplete_citation_triggers_fallback(self, completed_state):
+        """A partial citation fails the output and escalates the ticket."""
+
+        completed_state["citations"].append({"doc_id": "KB-9999", "title": "No chunk id"})
+
+        result = await validation_node(completed_state)
+
+        assert "errors" in result
+        assert result["output"]["citations"] == []
+        assert result["output"]["policy_check"]["escalation_needed"] is True
+
+    @pytest.mark.unit
+    def test_now_iso_reuses_string_within_a_second(self, monkeypatch):
+        """Test timestamp string is only re-formatted after a second passes."""
+
+        clock = [1_700_000_000.0]
+        monkeypatch.setattr("src.nodes.validation.time.time", lambda: clock[0])
+        monkeypatch.setattr("src.nodes.validation._ts_cache", (0.0, ""))
+
+        first = _now_iso()
+        clock[0] += 0.5
+        assert _now_iso() is first
+
+        clock[0] += 1.0
+        assert _now_iso() != first
+        assert _now_iso().endswith("+00:00")
@@ -0,0 +1,60 @@
+"""Unit tests for embedding service."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.embedding_service import EmbeddingService
+
+
+class TestEmbeddingService:
+    """Test suite for embedding service."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_embed_query_uses_cache_for_normalized_text(self):
+        """Queries differing only in case/whitespace hit the cache."""
+
+        service = EmbeddingService(api_key="test-key")
+        service.embeddings = AsyncMock()
+        service.embeddings.aembed_query.return_value = [0.1, 0.2]
+
+        first = await service.embed_query("How to reset password")
+        second = await service.embed_query("  how to RESET   password ")
+
+        assert first == second == [0.1, 0.2]
+        service.embeddings.aembed_query.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_embed_queries_batches_only_misses(self):
+        """Only uncached, unique queries are sent in one batch request."""
+
+        service = EmbeddingService(api_key="test-key")
+        service.embeddings = AsyncMock()
+        service.embeddings.aembed_query.return_value = [1.0]
+        service.embeddings.aembed_documents.return_value = [[2.0], [3.0]]
+
+        await service.embed_query("refund status")
+        vectors = await service.embed_queries(
+            ["Refund status", "Duplicate charge KB-1042", "Where is my refund", "duplicate  charge kb-1042"]
+        )
+
+        # Original text (first occurrence per normalized key) is embedded
+        service.embeddings.aembed_documents.assert_awaited_once_with(
+            ["Duplicate charge KB-1042", "Where is my refund"]
+        )
+        assert vectors == [[1.0], [2.0], [3.0], [2.0]]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Cache never grows beyond cache_size."""
+
+        service = EmbeddingService(api_key="test-key", cache_size=2)
+        service.embeddings = AsyncMock()
+        service.embeddings.aembed_query.return_value = [0.5]
+
+        for text in ["a", "b", "a", "c"]:
+            await service.embed_query(text)
+
+        assert list(service._query_cache) == ["a", "c"]
@@ -0,0 +1,79 @@
+"""Unit tests for LLM micro-batcher."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import BaseModel
+
+from src.services.llm_batcher import LLMBatcher
+
+
+class Answer(BaseModel):
+    """Single structured answer."""
+
+    label: str
+
+
+class TestLLMBatcher:
+    """Test suite for LLM batcher."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Requests arriving within the window are answered by one LLM call."""
+
+        batcher = LLMBatcher("system", Answer, max_batch_size=8, max_wait=0.05)
+
+        with patch("src.services.llm_batcher.get_llm") as mock_get_llm:
+            structured = mock_get_llm.return_value.with_structured_output.return_value
+            structured.ainvoke = AsyncMock(return_value=batcher.batch_schema(
+                items=[Answer(label="a"), Answer(label="b"), Answer(label="c")]
+            ))
+
+            results = await asyncio.gather(
+                batcher.ainvoke("first"),
+                batcher.ainvoke("second"),
+                batcher.ainvoke("third"),
+            )
+
+        assert [r.label for r in results] == ["a", "b", "c"]
+        structured.ainvoke.assert_awaited_once()
+        human = structured.ainvoke.call_args.args[0][1].content
+        assert "[1]\nfirst" in human and "[3]\nthird" in human
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_single_request_uses_plain_schema(self):
+        """A lone request is sent without the batch wrapper."""
+
+        batcher = LLMBatcher("system", Answer, max_wait=0.01)
+
+        with patch("src.services.llm_batcher.get_llm") as mock_get_llm:
+            structured = MagicMock()
+            structured.ainvoke = AsyncMock(return_value=Answer(label="solo"))
+            mock_get_llm.return_value.with_structured_output.return_value = structured
+
+            result = await batcher.ainvoke("only")
+
+        assert result.label == "solo"
+        mock_get_llm.return_value.with_structured_output.assert_called_once_with(Answer)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_every_caller(self):
+        """A failed batch call raises in each waiting caller."""
+
+        batcher = LLMBatcher("system", Answer, max_wait=0.05)
+
+        with patch("src.services.llm_batcher.get_llm") as mock_get_llm:
+            structured = mock_get_llm.return_value.with_structured_output.return_value
+            structured.ainvoke = AsyncMock(side_effect=RuntimeError("rate limited"))
+
+            results = await asyncio.gather(
+                batcher.ainvoke("first"),
+                batcher.ainvoke("second"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,57 @@
+"""Unit tests for LLM response cache."""
+
+import pytest
+from unittest.mock import patch
+
+from langchain_core.outputs import Generation
+
+from src.services.llm_cache import TTLResponseCache
+from src.services.llm_service import get_llm
+
+
+class TestTTLResponseCache:
+    """Test suite for LLM response cache."""
+
+    @pytest.mark.unit
+    def test_hit_requires_same_prompt_and_config(self):
+        """Only identical prompt + llm_string pairs are served from cache."""
+
+        cache = TTLResponseCache(maxsize=10, ttl=60)
+        value = [Generation(text="cached")]
+        cache.update("prompt", "gpt-4|temp=0", value)
+
+        assert cache.lookup("prompt", "gpt-4|temp=0") == value
+        assert cache.lookup("prompt", "gpt-4|temp=0.3") is None
+        assert cache.lookup("other prompt", "gpt-4|temp=0") is None
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.unit
+    def test_entries_expire_after_ttl(self):
+        """Expired entries are treated as misses and dropped."""
+
+        cache = TTLResponseCache(maxsize=10, ttl=60)
+        with patch("src.services.llm_cache.time.monotonic", return_value=1000.0):
+            cache.update("prompt", "llm", [Generation(text="old")])
+        with patch("src.services.llm_cache.time.monotonic", return_value=1061.0):
+            assert cache.lookup("prompt", "llm") is None
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Cache never grows beyond maxsize."""
+
+        cache = TTLResponseCache(maxsize=2, ttl=60)
+        cache.update("a", "llm", [Generation(text="a")])
+        cache.update("b", "llm", [Generation(text="b")])
+        cache.lookup("a", "llm")
+        cache.update("c", "llm", [Generation(text="c")])
+
+        assert cache.lookup("b", "llm") is None
+        assert cache.lookup("a", "llm") is not None
+
+    @pytest.mark.unit
+    def test_only_deterministic_llms_use_cache(self):
+        """get_llm attaches the cache only for temperature 0."""
+
+        assert get_llm(model="gpt-4o-mini", temperature=0, api_key="k").cache is not None
+        assert get_llm(model="gpt-4o-mini", temperature=0.3, api_key="k").cache is None
@@ -0,0 +1,38 @@
+"""Unit tests for LLM service."""
+
+import pytest
+
+from src.services.llm_service import get_llm
+
+
+class TestLLMService:
+    """Test suite for LLM service."""
+
+    @pytest.mark.unit
+    def test_get_llm_reuses_instance_for_same_config(self):
+        """Same model/temperature/key returns the cached ChatOpenAI."""
+
+        first = get_llm(model="gpt-4o-mini", temperature=0, api_key="test-key")
+        second = get_llm(model="gpt-4o-mini", temperature=0.0, api_key="test-key")
+
+        assert first is second
+
+    @pytest.mark.unit
+    def test_get_llm_separates_different_temperatures(self):
+        """Different sampling settings get their own instance."""
+
+        cold = get_llm(model="gpt-4o-mini", temperature=0, api_key="test-key")
+        warm = get_llm(model="gpt-4o-mini", temperature=0.3, api_key="test-key")
+
+        assert cold is not warm
+        assert warm.temperature == 0.3
+
+    @pytest.mark.unit
+    def test_prompt_cache_key_sent_in_request_body(self):
+        """prompt_cache_key is forwarded to OpenAI via extra_body."""
+
+        llm = get_llm(model="gpt-4o-mini", api_key="test-key", prompt_cache_key="triage_v1")
+        plain = get_llm(model="gpt-4o-mini", api_key="test-key")
+
+        assert llm.extra_body == {"prompt_cache_key": "triage_v1"}
+        assert plain.extra_body is None
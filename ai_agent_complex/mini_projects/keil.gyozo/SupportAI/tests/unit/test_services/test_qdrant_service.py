@@ -1,8 +1,12 @@
 """Unit tests for Qdrant service."""
 
+import asyncio
+import uuid
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from src.services import qdrant_service
 from src.services.qdrant_service import QdrantService
 
 
@@ -69,6 +73,159 @@ class TestQdrantService:
         call_args = mock_client.query_points.call_args
         assert call_args.kwargs.get("query_filter") is not None
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_search_batch_single_request(self):
+        """Test batch search issues one request and keeps per-query order."""
+
+        mock_client = AsyncMock()
+        first, second = MagicMock(), MagicMock()
+        first.points = [
+            MagicMock(payload={"doc_id": "KB-1", "chunk_id": "KB-1-c-1"}, score=0.91)
+        ]
+        second.points = []
+        mock_client.query_batch_points.return_value = [first, second]
+
+        service = QdrantService(https=False)
+        service.client = mock_client
+
+        results = await service.search_batch(
+            query_vectors=[[0.1] * 3072, [0.2] * 3072],
+            top_k=5,
+            category_filter="billing"
+        )
+
+        mock_client.query_batch_points.assert_awaited_once()
+        requests = mock_client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert all(r.limit == 5 and r.filter is not None for r in requests)
+        # Filter and search params are built once and shared by all requests
+        assert requests[0].filter is requests[1].filter
+        assert requests[0].params is requests[1].params
+        assert len(results) == 2
+        assert results[0][0]["chunk_id"] == "KB-1-c-1"
+        assert results[1] == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_search_batches_are_coalesced(self):
+        """Concurrent callers share one query_batch_points request."""
+
+        def respond(collection_name, requests):
+            responses = []
+            for request in requests:
+                response = MagicMock()
+                response.points = [
+                    MagicMock(payload={"chunk_id": f"limit-{request.limit}"}, score=0.9)
+                ]
+                responses.append(response)
+            return responses
+
+        mock_client = AsyncMock()
+        mock_client.query_batch_points.side_effect = respond
+
+        service = QdrantService(https=False)
+        service.client = mock_client
+
+        first, second = await asyncio.gather(
+            service.search_batch([[0.1] * 8, [0.2] * 8], top_k=3),
+            service.search_batch([[0.3] * 8], top_k=7),
+        )
+
+        mock_client.query_batch_points.assert_awaited_once()
+        assert [docs[0]["chunk_id"] for docs in first] == ["limit-3", "limit-3"]
+        assert [docs[0]["chunk_id"] for docs in second] == ["limit-7"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_collection_indexes_filter_fields(self):
+        """Test that filterable payload fields get keyword indexes."""
+
+        service = QdrantService(https=False)
+        service.client = AsyncMock()
+
+        await service.create_collection(vector_size=8)
+
+        indexed = [
+            call.kwargs["field_name"]
+            for call in service.client.create_payload_index.call_args_list
+        ]
+        assert indexed == ["category", "subcategory", "doc_type"]
+
+        kwargs = service.client.create_collection.call_args.kwargs
+        assert kwargs["vectors_config"].on_disk is True
+        assert kwargs["quantization_config"].scalar.type == "int8"
+
+    @pytest.mark.unit
+    def test_hnsw_ef_scales_with_top_k(self):
+        """Test hnsw_ef has a floor and grows with top_k."""
+
+        assert QdrantService._search_params(5).hnsw_ef == 64
+        assert QdrantService._search_params(50).hnsw_ef == 200
+        assert QdrantService._search_params(5).quantization.rescore is True
+
+    @pytest.mark.unit
+    def test_client_prefers_grpc_by_default(self, monkeypatch):
+        """Test that the client is built for gRPC on the configured port."""
+
+        captured = {}
+
+        def fake_client(**kwargs):
+            captured.update(kwargs)
+            return AsyncMock()
+
+        monkeypatch.setattr(
+            "src.services.qdrant_service.AsyncQdrantClient", fake_client
+        )
+        monkeypatch.setattr("src.services.qdrant_service._clients", {})
+        monkeypatch.setattr("src.services.qdrant_service._client_refs", {})
+
+        QdrantService(https=False)
+        assert captured["prefer_grpc"] is True
+        assert captured["grpc_port"] == 6334
+
+        QdrantService(https=False, prefer_grpc=False)
+        assert captured["prefer_grpc"] is False
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_services_share_client_until_last_close(self, monkeypatch):
+        """Test that one client is shared and closed with the last service."""
+
+        monkeypatch.setattr(
+            "src.services.qdrant_service.AsyncQdrantClient",
+            lambda **kwargs: AsyncMock(),
+        )
+        monkeypatch.setattr("src.services.qdrant_service._clients", {})
+        monkeypatch.setattr("src.services.qdrant_service._client_refs", {})
+
+        first = QdrantService(https=False)
+        second = QdrantService(https=False)
+        assert first.client is second.client
+
+        await first.close()
+        await first.close()  # second close is a no-op
+        first.client.close.assert_not_awaited()
+
+        await second.close()
+        second.client.close.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_injected_client_is_not_pooled_or_closed(self, monkeypatch):
+        """Test that an injected client bypasses the registry and close()."""
+
+        monkeypatch.setattr("src.services.qdrant_service._clients", {})
+        monkeypatch.setattr("src.services.qdrant_service._client_refs", {})
+
+        client = AsyncMock()
+        service = QdrantService(https=False, client=client)
+        assert service.client is client
+        assert qdrant_service._clients == {}
+
+        await service.close()
+        client.close.assert_not_awaited()
+
     @pytest.mark.unit
     def test_chunk_id_to_uuid_deterministic(self):
         """Test that same chunk_id always produces same UUID."""
@@ -82,6 +239,15 @@ class TestQdrantService:
         assert len(uuid1) == 36
         assert uuid1.count("-") == 4
 
+    @pytest.mark.unit
+    def test_chunk_id_to_uuid_is_rfc4122(self):
+        """Test that point ids parse as RFC 4122 UUIDs with version bits set."""
+
+        parsed = uuid.UUID(QdrantService.chunk_id_to_uuid("KB-1234-c-45"))
+
+        assert parsed.variant == uuid.RFC_4122
+        assert parsed.version == 5
+
     @pytest.mark.unit
     def test_chunk_id_to_uuid_different_ids(self):
         """Test that different chunk_ids produce different UUIDs."""
@@ -134,3 +300,56 @@ class TestQdrantService:
 
         with pytest.raises(ValueError, match="must match"):
             await service.upsert_documents(documents, vectors)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_upsert_documents_sends_chunks(self):
+        """Test that upsert splits points into batches without waiting."""
+
+        service = QdrantService(https=False)
+        service.client = AsyncMock()
+
+        documents = [{"chunk_id": f"KB-{i}", "content": "test"} for i in range(5)]
+        vectors = [[0.1] * 8 for _ in documents]
+
+        await service.upsert_documents(documents, vectors, batch_size=2, parallel=2)
+
+        calls = service.client.upsert.call_args_list
+        assert sorted(len(call.kwargs["points"]) for call in calls) == [1, 2, 2]
+        assert all(call.kwargs["wait"] is False for call in calls)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_upsert_documents_rejects_ragged_vectors(self):
+        """Test that vectors of different dimensions are rejected."""
+
+        service = QdrantService(https=False)
+        service.client = AsyncMock()
+
+        documents = [{"chunk_id": "KB-1"}, {"chunk_id": "KB-2"}]
+        vectors = [[0.1] * 8, [0.2] * 4]
+
+        with pytest.raises(ValueError):
+            await service.upsert_documents(documents, vectors)
+        service.client.upsert.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_collection_exists_is_cached(self, monkeypatch):
+        """Test that collection_exists reuses its answer until invalidated."""
+
+        monkeypatch.setattr("src.services.qdrant_service._exists_cache", {})
+
+        service = QdrantService(https=False)
+        service.client = AsyncMock()
+        collection = MagicMock()
+        collection.name = service.collection_name
+        service.client.get_collections.return_value = MagicMock(collections=[collection])
+
+        assert await service.collection_exists() is True
+        assert await service.collection_exists() is True
+        service.client.get_collections.assert_awaited_once()
+
+        await service.delete_collection()
+        service.client.get_collections.return_value = MagicMock(collections=[])
+        assert await service.collection_exists() is False
@@ -6,10 +6,9 @@ with a sample transcript.
 """
 
 import os
-import json
+import asyncio
 from dotenv import load_dotenv
-from src.workflow.graph import process_meeting
-from src.models.schemas import ProcessedMeeting
+from src.models.schemas import ActionItem, ProcessedMeeting
 
 
 # Sample meeting transcript
@@ -54,7 +53,23 @@ Thanks everyone!
 """
 
 
-def main():
+def print_action_item(index: int, item: ActionItem) -> None:
+    """Print a single action item."""
+    print(f"\n{index}. {item.task}")
+    if item.assignee:
+        print(f"   👤 Assignee: {item.assignee}")
+    if item.deadline:
+        print(f"   📅 Deadline: {item.deadline}")
+    if item.priority:
+        priority_emoji = {
+            "high": "🔴",
+            "medium": "🟡",
+            "low": "🟢"
+        }.get(item.priority.lower(), "⚪")
+        print(f"   {priority_emoji} Priority: {item.priority.upper()}")
+
+
+async def main():
     """Main function to process a meeting transcript."""
     # Load environment variables
     load_dotenv()
@@ -75,14 +90,31 @@ def main():
     print("=" * 80)
     print("\nProcessing meeting transcript...\n")
 
+    # Imported here so the environment check and banner do not wait for
+    # LangGraph / langchain_openai (and openai, tiktoken) to load
+    from src.workflow.graph import stream_meeting
+
     try:
-        # Process the meeting
-        result = process_meeting(
+        # Process the meeting, printing action items as they are generated
+        result = None
+        streamed = 0
+        async for update in stream_meeting(
             transcript=SAMPLE_TRANSCRIPT,
             openai_api_key=openai_api_key,
             model_name=model_name,
-            use_parallel=False  # Set to True for parallel processing
-        )
+            use_parallel=True  # Summary and action items run concurrently
+        ):
+            if isinstance(update, ActionItem):
+                if streamed == 0:
+                    print("✅ ACTION ITEMS")
+                    print("-" * 80)
+                streamed += 1
+                print_action_item(streamed, update)
+            else:
+                result = update
+
+        if streamed:
+            print()
 
         # Check for errors
         if result.errors:
@@ -111,25 +143,14 @@ def main():
 
             print()
 
-        # Display action items
-        if result.action_items:
+        # Display action items that were not streamed (e.g. cached results)
+        if result.action_items and not streamed:
             print("✅ ACTION ITEMS")
             print("-" * 80)
             for i, item in enumerate(result.action_items, 1):
-                print(f"\n{i}. {item.task}")
-                if item.assignee:
-                    print(f"   👤 Assignee: {item.assignee}")
-                if item.deadline:
-                    print(f"   📅 Deadline: {item.deadline}")
-                if item.priority:
-                    priority_emoji = {
-                        "high": "🔴",
-                        "medium": "🟡",
-                        "low": "🟢"
-                    }.get(item.priority.lower(), "⚪")
-                    print(f"   {priority_emoji} Priority: {item.priority.upper()}")
+                print_action_item(i, item)
             print()
-        else:
+        elif not result.action_items:
             print("No action items found.\n")
 
         # Create ProcessedMeeting object for JSON export
@@ -141,13 +162,9 @@ def main():
 
             # Save to JSON file
             output_file = "meeting_output.json"
+            # Serialized directly by pydantic-core (Rust), UTF-8 as-is
             with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    processed.model_dump(mode="json"),
-                    f,
-                    indent=2,
-                    ensure_ascii=False
-                )
+                f.write(processed.model_dump_json(indent=2))
 
             print(f"💾 Results saved to: {output_file}")
             print()
@@ -162,4 +179,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
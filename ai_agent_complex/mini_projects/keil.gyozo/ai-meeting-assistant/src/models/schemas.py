@@ -5,14 +5,32 @@ This module defines the data structures for meeting transcripts,
 action items, summaries, and the final processed output.
 """
 
-from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+import operator
+from datetime import datetime, timezone
+from typing import Annotated, Any, Literal, Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+
+def _normalize_priority(v: Any) -> Any:
+    """Lowercase the priority, defaulting to medium if it is not allowed."""
+    if isinstance(v, str):
+        v = v.lower()
+        return v if v in ('high', 'medium', 'low') else 'medium'
+    return v
+
+
+# Normalized before pydantic-core checks the Literal
+Priority = Annotated[
+    Optional[Literal['high', 'medium', 'low']],
+    BeforeValidator(_normalize_priority)
+]
 
 
 class ActionItem(BaseModel):
     """Represents a single action item extracted from a meeting."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     task: str = Field(
         ...,
         description="Description of the action item/task to be completed"
@@ -25,27 +43,17 @@ class ActionItem(BaseModel):
         None,
         description="Deadline for completing the task (if mentioned)"
     )
-    priority: Optional[str] = Field(
+    priority: Priority = Field(
         None,
         description="Priority level: high, medium, or low"
     )
 
-    @field_validator('priority')
-    @classmethod
-    def validate_priority(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that priority is one of the allowed values."""
-        if v is not None:
-            allowed = ['high', 'medium', 'low']
-            v_lower = v.lower()
-            if v_lower not in allowed:
-                return 'medium'  # Default to medium if invalid
-            return v_lower
-        return v
-
 
 class MeetingSummary(BaseModel):
     """Represents the executive summary of a meeting."""
 
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
     summary: str = Field(
         ...,
         description="Concise executive summary of the meeting (2-4 sentences)"
@@ -64,6 +72,19 @@ class MeetingSummary(BaseModel):
     )
 
 
+class CombinedOutput(BaseModel):
+    """Summary and action items produced by a single LLM call."""
+
+    summary: MeetingSummary = Field(
+        ...,
+        description="Executive summary of the meeting"
+    )
+    action_items: List[ActionItem] = Field(
+        default_factory=list,
+        description="List of extracted action items"
+    )
+
+
 class MeetingTranscript(BaseModel):
     """Input model for raw meeting transcript."""
 
@@ -89,20 +110,16 @@ class ProcessedMeeting(BaseModel):
         description="List of extracted action items"
     )
     processed_at: datetime = Field(
-        default_factory=datetime.now,
-        description="Timestamp when the meeting was processed"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Timestamp when the meeting was processed (UTC)"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class GraphState(BaseModel):
     """State object that flows through the LangGraph workflow."""
 
+    model_config = ConfigDict(extra='ignore')
+
     # Input
     transcript: str = Field(
         ...,
@@ -126,11 +143,10 @@ class GraphState(BaseModel):
     )
 
     # Processing metadata
-    errors: List[str] = Field(
+    # Nodes return only their new errors; the operator.add reducer appends
+    # them, which lets parallel branches report errors in the same step.
+    # Never return (or mutate) state.errors itself - it would be re-added.
+    errors: Annotated[List[str], operator.add] = Field(
         default_factory=list,
         description="Any errors encountered during processing"
     )
-
-    class Config:
-        """Pydantic configuration."""
-        arbitrary_types_allowed = True
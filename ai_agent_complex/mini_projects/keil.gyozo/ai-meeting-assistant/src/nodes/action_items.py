@@ -5,12 +5,16 @@ This node uses an LLM to identify and structure action items including
 assignees, deadlines, and priorities.
 """
 
-from typing import Dict, Any, List
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+from langchain_core.callbacks.manager import adispatch_custom_event
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import Runnable
 from src.models.schemas import GraphState, ActionItem
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 # System prompt for action items extraction
 ACTION_ITEMS_SYSTEM_PROMPT = """You are an expert at extracting action items from meeting transcripts.
@@ -53,7 +57,16 @@ If there are no action items, return an empty list.
 Ensure each action item is clear, specific, and actionable."""
 
 
-def create_action_items_chain(llm: ChatOpenAI):
+# Prompt template and parser, built once at import
+ACTION_ITEMS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ACTION_ITEMS_SYSTEM_PROMPT),
+    ("user", ACTION_ITEMS_USER_PROMPT)
+])
+
+ACTION_ITEMS_OUTPUT_PARSER = JsonOutputParser()
+
+
+def create_action_items_chain(llm: "ChatOpenAI"):
     """
     Create the action items extraction LangChain chain.
 
@@ -63,20 +76,113 @@ def create_action_items_chain(llm: ChatOpenAI):
     Returns:
         A LangChain chain for extracting action items
     """
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", ACTION_ITEMS_SYSTEM_PROMPT),
-        ("user", ACTION_ITEMS_USER_PROMPT)
-    ])
-
-    # We'll parse the list of action items
-    output_parser = JsonOutputParser()
+    # JSON mode; JsonOutputParser stays for its partial results while streaming
+    json_llm = llm.bind(response_format={"type": "json_object"})
 
-    chain = prompt | llm | output_parser
+    chain = ACTION_ITEMS_PROMPT | json_llm | ACTION_ITEMS_OUTPUT_PARSER
 
     return chain
 
 
-def extract_action_items(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
+def parse_action_items(
+    action_items_data: List[Dict[str, Any]],
+    errors: List[str]
+) -> List[ActionItem]:
+    """
+    Convert raw action item dicts into validated ActionItem models.
+
+    Invalid items are skipped and their validation errors appended to
+    errors, so one malformed item does not drop the rest.
+
+    Args:
+        action_items_data: Action item dicts as returned by the LLM
+        errors: List collecting validation error messages
+
+    Returns:
+        List of valid ActionItem models
+    """
+    action_items: List[ActionItem] = []
+    for item_data in action_items_data:
+        try:
+            action_items.append(ActionItem(**item_data))
+        except Exception as e:
+            # Log validation error but continue with other items
+            errors.append(f"Action item validation error: {str(e)}")
+    return action_items
+
+
+# Custom event dispatched for each action item as soon as it is complete
+ACTION_ITEM_EVENT = "action_item"
+
+
+async def _emit_action_item(
+    item_data: Dict[str, Any],
+    action_items: List[ActionItem],
+    errors: List[str],
+    dispatch: bool = True
+) -> None:
+    """Validate one streamed item, keep it and publish it as a custom event."""
+    for action_item in parse_action_items([item_data], errors):
+        action_items.append(action_item)
+        if not dispatch:
+            continue
+        try:
+            await adispatch_custom_event(ACTION_ITEM_EVENT, action_item)
+        except RuntimeError:
+            pass  # Not running inside a graph/chain - nobody is listening
+
+
+async def stream_action_items(
+    chain: Runnable,
+    inputs: Dict[str, Any],
+    errors: List[str],
+    action_items: Optional[List[ActionItem]] = None,
+    dispatch: bool = True
+) -> Tuple[Dict[str, Any], List[ActionItem]]:
+    """
+    Run a JSON chain with streaming and publish action items as they complete.
+
+    JsonOutputParser yields the partially parsed object after every token.
+    An item is complete once the next one has started (or the stream has
+    ended); each complete item is validated and dispatched as an
+    ACTION_ITEM_EVENT custom event, visible to astream_events consumers.
+
+    Args:
+        chain: Chain ending in a JsonOutputParser whose output has "action_items"
+        inputs: Chain inputs
+        errors: List collecting validation error messages
+        action_items: Optional list to collect the items into, so a caller
+            can see which items were published if the stream fails midway
+        dispatch: If False, items are collected but no events are dispatched
+
+    Returns:
+        Tuple of the final parsed output and the validated action items
+    """
+    result: Dict[str, Any] = {}
+    if action_items is None:
+        action_items = []
+    emitted = 0
+
+    async for partial in chain.astream(inputs):
+        if not isinstance(partial, dict):
+            continue
+        result = partial
+        items_data = partial.get("action_items") or []
+        while len(items_data) > emitted + 1:
+            await _emit_action_item(items_data[emitted], action_items, errors, dispatch)
+            emitted += 1
+
+    for item_data in (result.get("action_items") or [])[emitted:]:
+        await _emit_action_item(item_data, action_items, errors, dispatch)
+
+    return result, action_items
+
+
+async def extract_action_items(
+    state: GraphState,
+    llm: "ChatOpenAI",
+    dispatch: bool = True
+) -> Dict[str, Any]:
     """
     Extract action items from the meeting transcript.
 
@@ -86,41 +192,34 @@ def extract_action_items(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
     Args:
         state: The current graph state with parsed transcript
         llm: The ChatOpenAI language model instance
+        dispatch: Publish each item as an ACTION_ITEM_EVENT custom event
 
     Returns:
         Dict with updated state containing action items
     """
     transcript = state.parsed_transcript or state.transcript
+    errors: List[str] = []
+    action_items: List[ActionItem] = []
 
     try:
         # Create the chain
         chain = create_action_items_chain(llm)
 
-        # Invoke the chain
-        result = chain.invoke({"transcript": transcript})
-
-        # Parse action items
-        action_items_data = result.get("action_items", [])
-
-        # Convert to ActionItem models with validation
-        action_items: List[ActionItem] = []
-        for item_data in action_items_data:
-            try:
-                action_item = ActionItem(**item_data)
-                action_items.append(action_item)
-            except Exception as e:
-                # Log validation error but continue with other items
-                error_msg = f"Action item validation error: {str(e)}"
-                state.errors.append(error_msg)
+        # Stream the chain; items are published as they complete
+        await stream_action_items(
+            chain, {"transcript": transcript}, errors, action_items, dispatch
+        )
 
         return {
             "action_items": action_items,
-            "errors": state.errors
+            "errors": errors
         }
 
     except Exception as e:
         error_msg = f"Action items extraction error: {str(e)}"
+        # Keep the items streamed before the failure - they were already
+        # published, so the final state must contain them too
         return {
-            "action_items": [],
-            "errors": state.errors + [error_msg]
+            "action_items": action_items,
+            "errors": errors + [error_msg]
         }
@@ -0,0 +1,164 @@
+"""
+Combined node for generating the summary and action items in one LLM call.
+
+The summarizer and action items nodes each send the full transcript to the
+LLM. This node sends it once and asks for both sections in a single JSON
+response, halving prompt tokens and round-trips for long transcripts.
+"""
+
+import asyncio
+from typing import Dict, Any, List, TYPE_CHECKING
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+from src.models.schemas import GraphState, MeetingSummary, ActionItem, CombinedOutput
+from src.nodes.summarizer import summarize_meeting
+from src.nodes.action_items import extract_action_items, stream_action_items
+from src.utils.cache import lru_disk_cache
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+# System prompt covering both the summary and the action items
+COMBINED_SYSTEM_PROMPT = """You are an expert meeting analyst. For each meeting transcript you produce
+an executive summary and a list of action items.
+
+Summary:
+1. A clear executive summary (2-4 sentences) that captures the essence of the meeting
+2. Key discussion points and decisions made
+3. Participants mentioned in the meeting (if identifiable)
+4. Meeting date (if mentioned)
+
+Action items:
+1. The specific task or action to be completed
+2. Who is assigned to complete it (if mentioned)
+3. Any deadline or due date mentioned (if specified)
+4. Priority level (high, medium, or low based on context)
+
+Guidelines:
+- Be concise and professional in the summary
+- Only extract explicit action items, not general discussions
+- Infer priority from urgency indicators (ASAP, urgent, when possible, etc.)
+- If assignee or deadline is unclear, use null
+- If multiple people are assigned, list the primary person or use "Team"
+"""
+
+
+# User prompt template
+COMBINED_USER_PROMPT = """Analyze the following meeting transcript.
+
+Meeting Transcript:
+{transcript}
+
+Please provide your response in the following JSON format:
+{{
+    "summary": {{
+        "summary": "2-4 sentence executive summary here",
+        "key_points": ["key point 1", "key point 2", "key point 3"],
+        "participants": ["participant 1", "participant 2"] (or null if not identifiable),
+        "meeting_date": "date if mentioned" (or null if not mentioned)
+    }},
+    "action_items": [
+        {{
+            "task": "specific task description",
+            "assignee": "person name or null",
+            "deadline": "deadline string or null",
+            "priority": "high, medium, or low"
+        }}
+    ]
+}}
+
+If there are no action items, return an empty list."""
+
+
+# Built once; create_combined_chain only binds the LLM
+COMBINED_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", COMBINED_SYSTEM_PROMPT),
+    ("user", COMBINED_USER_PROMPT)
+])
+
+COMBINED_OUTPUT_PARSER = JsonOutputParser(pydantic_object=CombinedOutput)
+
+
+def create_combined_chain(llm: "ChatOpenAI"):
+    """
+    Create the combined summary + action items LangChain chain.
+
+    Args:
+        llm: The ChatOpenAI language model instance
+
+    Returns:
+        A LangChain chain returning a dict with summary and action_items
+    """
+    # JSON mode; JsonOutputParser stays for its partial results while streaming
+    json_llm = llm.bind(response_format={"type": "json_object"})
+
+    chain = COMBINED_PROMPT | json_llm | COMBINED_OUTPUT_PARSER
+
+    return chain
+
+
+@lru_disk_cache(path=".meeting_cache.sqlite")
+async def summarize_and_extract(state: GraphState, llm: "ChatOpenAI") -> Dict[str, Any]:
+    """
+    Generate the summary and action items with a single LLM call.
+
+    If the combined call returns no usable summary, only the summarizer node
+    is re-run and the streamed action items are kept. If the call itself
+    fails, both sections fall back to the separate nodes (run concurrently);
+    if the failed stream already published action items, the fallback
+    publishes none, so consumers never see an item twice. Successful
+    results are cached on disk by transcript hash, so repeated transcripts
+    skip the LLM.
+
+    Args:
+        state: The current graph state with parsed transcript
+        llm: The ChatOpenAI language model instance
+
+    Returns:
+        Dict with updated state containing summary and action items
+    """
+    transcript = state.parsed_transcript or state.transcript
+    errors: List[str] = []
+    action_items: List[ActionItem] = []
+
+    try:
+        # Create the chain
+        chain = create_combined_chain(llm)
+
+        # Stream the chain; action items are published as they complete
+        result, _ = await stream_action_items(
+            chain, {"transcript": transcript}, errors, action_items
+        )
+
+    except Exception as e:
+        errors.append(f"Combined analysis error: {str(e)}")
+
+        # Fallback: separate calls for each section
+        summary_update, action_items_update = await asyncio.gather(
+            summarize_meeting(state, llm),
+            extract_action_items(state, llm, dispatch=not action_items)
+        )
+
+        return {
+            "summary": summary_update["summary"],
+            "action_items": action_items_update["action_items"],
+            "errors": errors + summary_update["errors"] + action_items_update["errors"]
+        }
+
+    try:
+        summary = MeetingSummary(**result["summary"])
+
+    except Exception as e:
+        errors.append(f"Combined analysis error: {str(e)}")
+
+        # Fallback: the action items are fine, only redo the summary
+        summary_update = await summarize_meeting(state, llm)
+        summary = summary_update["summary"]
+        errors.extend(summary_update["errors"])
+
+    return {
+        "summary": summary,
+        "action_items": action_items,
+        "errors": errors
+    }
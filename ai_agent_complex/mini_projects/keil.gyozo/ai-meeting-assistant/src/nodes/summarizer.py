@@ -5,12 +5,16 @@ This node uses an LLM to create concise summaries and extract key points
 from the parsed meeting transcript.
 """
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+import json
+from typing import Dict, Any, TYPE_CHECKING
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableLambda
 from src.models.schemas import GraphState, MeetingSummary
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 
 # System prompt for the summarizer
 SUMMARIZER_SYSTEM_PROMPT = """You are an expert meeting analyst specializing in creating concise, actionable executive summaries.
@@ -47,29 +51,42 @@ Please provide your response in the following JSON format:
 Ensure the summary is clear, concise, and captures the most important aspects of the meeting."""
 
 
-def create_summarizer_chain(llm: ChatOpenAI):
+# Prompt and parser are immutable; built once and shared by every chain
+SUMMARIZER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SUMMARIZER_SYSTEM_PROMPT),
+    ("user", SUMMARIZER_USER_PROMPT)
+])
+
+
+def _load_json(message: BaseMessage) -> Dict[str, Any]:
+    """Parse the message content; JSON mode guarantees a valid JSON object."""
+    return json.loads(message.content)
+
+
+SUMMARIZER_OUTPUT_PARSER = RunnableLambda(_load_json)
+
+
+def create_summarizer_chain(llm: "ChatOpenAI"):
     """
     Create the summarizer LangChain chain.
 
+    The LLM is called in JSON mode, so its reply is loaded with json.loads
+    directly instead of JsonOutputParser's tolerant parsing.
+
     Args:
         llm: The ChatOpenAI language model instance
 
     Returns:
         A LangChain chain for generating meeting summaries
     """
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SUMMARIZER_SYSTEM_PROMPT),
-        ("user", SUMMARIZER_USER_PROMPT)
-    ])
-
-    output_parser = JsonOutputParser(pydantic_object=MeetingSummary)
+    json_llm = llm.bind(response_format={"type": "json_object"})
 
-    chain = prompt | llm | output_parser
+    chain = SUMMARIZER_PROMPT | json_llm | SUMMARIZER_OUTPUT_PARSER
 
     return chain
 
 
-def summarize_meeting(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
+async def summarize_meeting(state: GraphState, llm: "ChatOpenAI") -> Dict[str, Any]:
     """
     Generate an executive summary from the meeting transcript.
 
@@ -90,19 +107,19 @@ def summarize_meeting(state: GraphState, llm: ChatOpenAI) -> Dict[str, Any]:
         chain = create_summarizer_chain(llm)
 
         # Invoke the chain
-        result = chain.invoke({"transcript": transcript})
+        result = await chain.ainvoke({"transcript": transcript})
 
         # Parse the result into MeetingSummary model
         summary = MeetingSummary(**result)
 
         return {
             "summary": summary,
-            "errors": state.errors
+            "errors": []
         }
 
     except Exception as e:
         error_msg = f"Summarizer error: {str(e)}"
         return {
             "summary": None,
-            "errors": state.errors + [error_msg]
+            "errors": [error_msg]
         }
@@ -0,0 +1,138 @@
+"""
+Persistent result cache for the meeting analysis nodes.
+
+Results are stored in a local SQLite file keyed by a hash of the parsed
+transcript and the model configuration, so processing the same transcript
+again (e.g. re-running main.py during development) skips the LLM entirely.
+"""
+
+import functools
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Awaitable, Callable, Dict, Optional, TYPE_CHECKING
+
+from src.models.schemas import GraphState, MeetingSummary, ActionItem
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+NodeFunc = Callable[[GraphState, "ChatOpenAI"], Awaitable[Dict[str, Any]]]
+
+
+def transcript_cache_key(transcript: str, llm: "ChatOpenAI") -> str:
+    """
+    Build the cache key for a transcript and model configuration.
+
+    Args:
+        transcript: Parsed transcript text
+        llm: The ChatOpenAI instance that would process it
+
+    Returns:
+        Hex digest identifying the transcript + model + temperature
+    """
+    model_name = getattr(llm, "model_name", type(llm).__name__)
+    temperature = getattr(llm, "temperature", None)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{model_name}\x00{temperature}\x00".encode())
+    digest.update(transcript.encode())
+    return digest.hexdigest()
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open the cache database, creating the table if needed."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS meeting_cache ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+    )
+    return conn
+
+
+def _load(path: str, key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached row for key (refreshing its LRU timestamp), or None."""
+    with closing(_connect(path)) as conn, conn:
+        row = conn.execute(
+            "SELECT value FROM meeting_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE meeting_cache SET last_used = ? WHERE key = ?",
+            (time.time(), key)
+        )
+    return json.loads(row[0])
+
+
+def _store(path: str, key: str, value: Dict[str, Any], max_entries: int) -> None:
+    """Store value under key and evict least recently used rows beyond max_entries."""
+    with closing(_connect(path)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO meeting_cache (key, value, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time())
+        )
+        conn.execute(
+            "DELETE FROM meeting_cache WHERE key NOT IN ("
+            "SELECT key FROM meeting_cache ORDER BY last_used DESC LIMIT ?)",
+            (max_entries,)
+        )
+
+
+def lru_disk_cache(
+    path: str = ".meeting_cache.sqlite",
+    max_entries: int = 256
+) -> Callable[[NodeFunc], NodeFunc]:
+    """
+    Cache a summary + action items node on disk by transcript hash.
+
+    Only successful results (summary present, no errors) are stored. Cache
+    I/O failures are ignored so the node always falls through to the LLM.
+
+    Args:
+        path: SQLite file used as the cache store
+        max_entries: Maximum number of cached transcripts (LRU eviction)
+
+    Returns:
+        Decorator for an async node taking (state, llm)
+    """
+    def decorator(func: NodeFunc) -> NodeFunc:
+        @functools.wraps(func)
+        async def wrapper(state: GraphState, llm: "ChatOpenAI") -> Dict[str, Any]:
+            transcript = state.parsed_transcript or state.transcript
+            key = transcript_cache_key(transcript, llm)
+
+            try:
+                cached = _load(path, key)
+            except (sqlite3.Error, ValueError):
+                cached = None
+
+            if cached is not None:
+                return {
+                    "summary": MeetingSummary(**cached["summary"]),
+                    "action_items": [ActionItem(**item) for item in cached["action_items"]],
+                    "errors": []
+                }
+
+            result = await func(state, llm)
+
+            if result.get("summary") is not None and not result.get("errors"):
+                value = {
+                    "summary": result["summary"].model_dump(mode="json"),
+                    "action_items": [
+                        item.model_dump(mode="json")
+                        for item in result.get("action_items") or []
+                    ]
+                }
+                try:
+                    _store(path, key, value, max_entries)
+                except sqlite3.Error:
+                    pass
+
+            return result
+
+        return wrapper
+
+    return decorator
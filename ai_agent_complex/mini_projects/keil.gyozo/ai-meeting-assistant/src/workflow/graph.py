@@ -5,14 +5,16 @@ This module defines the state graph that orchestrates the meeting processing
 pipeline from raw transcript to structured output.
 """
 
-from typing import Dict, Any
+import asyncio
+from typing import Any, AsyncIterator, Dict, Union
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 
-from src.models.schemas import GraphState
+from src.models.schemas import GraphState, ActionItem
 from src.nodes.parser import parse_transcript
 from src.nodes.summarizer import summarize_meeting
-from src.nodes.action_items import extract_action_items
+from src.nodes.action_items import extract_action_items, ACTION_ITEM_EVENT
+from src.nodes.combined import summarize_and_extract
 
 
 def create_meeting_workflow(
@@ -25,8 +27,8 @@ def create_meeting_workflow(
 
     The workflow follows this pipeline:
     1. Parse/clean the raw transcript
-    2. Generate summary (parallel)
-    3. Extract action items (parallel)
+    2. Generate summary
+    3. Extract action items
     4. Return final state
 
     Args:
@@ -48,13 +50,13 @@ def create_meeting_workflow(
     workflow = StateGraph(GraphState)
 
     # Define wrapper functions that inject the LLM
-    def summarizer_node(state: GraphState) -> Dict[str, Any]:
+    async def summarizer_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for summarize_meeting that injects LLM."""
-        return summarize_meeting(state, llm)
+        return await summarize_meeting(state, llm)
 
-    def action_items_node(state: GraphState) -> Dict[str, Any]:
+    async def action_items_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for extract_action_items that injects LLM."""
-        return extract_action_items(state, llm)
+        return await extract_action_items(state, llm)
 
     # Add nodes to the graph
     workflow.add_node("parse", parse_transcript)
@@ -89,7 +91,8 @@ def create_parallel_meeting_workflow(
     Create an optimized workflow with parallel processing.
 
     This version runs summarization and action item extraction in parallel
-    after parsing for better performance.
+    after parsing. Both are I/O-bound LLM calls on the same parsed
+    transcript, so wall-clock time is roughly that of the slower one.
 
     The workflow:
     1. Parse/clean the raw transcript
@@ -117,13 +120,13 @@ def create_parallel_meeting_workflow(
     workflow = StateGraph(GraphState)
 
     # Define wrapper functions
-    def summarizer_node(state: GraphState) -> Dict[str, Any]:
+    async def summarizer_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for summarize_meeting that injects LLM."""
-        return summarize_meeting(state, llm)
+        return await summarize_meeting(state, llm)
 
-    def action_items_node(state: GraphState) -> Dict[str, Any]:
+    async def action_items_node(state: GraphState) -> Dict[str, Any]:
         """Wrapper for extract_action_items that injects LLM."""
-        return extract_action_items(state, llm)
+        return await extract_action_items(state, llm)
 
     def router_node(state: GraphState) -> Dict[str, Any]:
         """Router node that triggers parallel execution."""
@@ -163,11 +166,66 @@ def create_parallel_meeting_workflow(
     return compiled_graph
 
 
+def create_combined_meeting_workflow(
+    openai_api_key: str,
+    model_name: str = "gpt-4-turbo-preview",
+    temperature: float = 0.0
+) -> StateGraph:
+    """
+    Create a workflow that analyzes the transcript with a single LLM call.
+
+    The summary and action items are requested together, so the transcript
+    is sent to the LLM once instead of twice. If the combined call fails,
+    the node falls back to the separate summarizer and action items nodes.
+
+    The workflow:
+    1. Parse/clean the raw transcript
+    2. Generate summary and action items in one call
+    3. Return final state
+
+    Args:
+        openai_api_key: OpenAI API key
+        model_name: Name of the OpenAI model to use
+        temperature: Temperature for LLM generation
+
+    Returns:
+        Compiled StateGraph ready for execution
+    """
+    # Initialize the LLM
+    llm = ChatOpenAI(
+        api_key=openai_api_key,
+        model=model_name,
+        temperature=temperature
+    )
+
+    # Create the state graph
+    workflow = StateGraph(GraphState)
+
+    async def analyze_node(state: GraphState) -> Dict[str, Any]:
+        """Wrapper for summarize_and_extract that injects LLM."""
+        return await summarize_and_extract(state, llm)
+
+    # Add nodes
+    workflow.add_node("parse", parse_transcript)
+    workflow.add_node("analyze", analyze_node)
+
+    # Define workflow edges
+    workflow.set_entry_point("parse")
+    workflow.add_edge("parse", "analyze")
+    workflow.add_edge("analyze", END)
+
+    # Compile the graph
+    compiled_graph = workflow.compile()
+
+    return compiled_graph
+
+
 async def process_meeting_async(
     transcript: str,
     openai_api_key: str,
     model_name: str = "gpt-4-turbo-preview",
-    use_parallel: bool = True
+    use_parallel: bool = True,
+    use_combined: bool = True
 ) -> GraphState:
     """
     Process a meeting transcript asynchronously.
@@ -176,7 +234,10 @@ async def process_meeting_async(
         transcript: Raw meeting transcript text
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
-        use_parallel: Whether to use parallel processing (faster)
+        use_parallel: Whether to use parallel processing (faster); only
+            used when use_combined is False
+        use_combined: Whether to get summary and action items from a
+            single LLM call
 
     Returns:
         Final GraphState with summary and action items
@@ -185,7 +246,9 @@ async def process_meeting_async(
     initial_state = GraphState(transcript=transcript)
 
     # Create the workflow
-    if use_parallel:
+    if use_combined:
+        graph = create_combined_meeting_workflow(openai_api_key, model_name)
+    elif use_parallel:
         graph = create_parallel_meeting_workflow(openai_api_key, model_name)
     else:
         graph = create_meeting_workflow(openai_api_key, model_name)
@@ -196,34 +259,86 @@ async def process_meeting_async(
     return GraphState(**final_state)
 
 
-def process_meeting(
+async def stream_meeting(
     transcript: str,
     openai_api_key: str,
     model_name: str = "gpt-4-turbo-preview",
-    use_parallel: bool = False
-) -> GraphState:
+    use_parallel: bool = True,
+    use_combined: bool = True
+) -> AsyncIterator[Union[ActionItem, GraphState]]:
     """
-    Process a meeting transcript synchronously.
+    Process a meeting transcript, yielding action items as they are generated.
+
+    Each ActionItem is yielded as soon as the LLM has finished writing it;
+    the final GraphState is yielded last. Results served from the cache
+    arrive only in the final state.
 
     Args:
         transcript: Raw meeting transcript text
         openai_api_key: OpenAI API key
         model_name: Name of the OpenAI model to use
-        use_parallel: Whether to use parallel processing
+        use_parallel: Whether to use parallel processing (only used when
+            use_combined is False)
+        use_combined: Whether to get summary and action items from a
+            single LLM call
 
-    Returns:
-        Final GraphState with summary and action items
+    Yields:
+        ActionItem objects, then the final GraphState
     """
     # Create initial state
     initial_state = GraphState(transcript=transcript)
 
     # Create the workflow
-    if use_parallel:
+    if use_combined:
+        graph = create_combined_meeting_workflow(openai_api_key, model_name)
+    elif use_parallel:
         graph = create_parallel_meeting_workflow(openai_api_key, model_name)
     else:
         graph = create_meeting_workflow(openai_api_key, model_name)
 
-    # Run the workflow
-    final_state = graph.invoke(initial_state)
+    # Run the workflow, forwarding action item events
+    final_state = None
+    async for event in graph.astream_events(initial_state, version="v2"):
+        if event["event"] == "on_custom_event" and event["name"] == ACTION_ITEM_EVENT:
+            yield event["data"]
+        elif event["event"] == "on_chain_end" and not event["parent_ids"]:
+            final_state = event["data"]["output"]
 
-    return GraphState(**final_state)
+    yield GraphState(**final_state)
+
+
+def process_meeting(
+    transcript: str,
+    openai_api_key: str,
+    model_name: str = "gpt-4-turbo-preview",
+    use_parallel: bool = True,
+    use_combined: bool = True
+) -> GraphState:
+    """
+    Process a meeting transcript synchronously.
+
+    The LLM nodes are async, so this runs process_meeting_async in a new
+    event loop. Do not call it from inside a running loop; await
+    process_meeting_async instead.
+
+    Args:
+        transcript: Raw meeting transcript text
+        openai_api_key: OpenAI API key
+        model_name: Name of the OpenAI model to use
+        use_parallel: Whether to run summary and action items concurrently
+            (separate calls, only used when use_combined is False)
+        use_combined: Whether to get summary and action items from a
+            single LLM call
+
+    Returns:
+        Final GraphState with summary and action items
+    """
+    return asyncio.run(
+        process_meeting_async(
+            transcript=transcript,
+            openai_api_key=openai_api_key,
+            model_name=model_name,
+            use_parallel=use_parallel,
+            use_combined=use_combined
+        )
+    )
@@ -1,21 +1,109 @@
 """
 Admin endpoints for cache management - P0.17 Phase 2
 """
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException
+import time
+from typing import Any, Callable, Dict, Tuple
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
 
 from api.schemas import (
     CacheStatsResponse, CacheInvalidateResponse, CacheClearResponse, DevModeResponse
 )
 from services.cache_control import get_cache_control
+from services.config_service import is_dev_mode
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Stats are polled by every open admin tab; a background task refreshes a
+# snapshot in app.state.cache_stats so polls never wait for PostgreSQL
+STATS_REFRESH_INTERVAL_SECONDS = 2
+
+# Single-flight for clear/invalidate: one lock per operation key, plus the
+# start time and result of the last run of each key. Entries only live while
+# calls for the key are in progress (_cache_op_callers counts them).
+_cache_op_locks: Dict[str, asyncio.Lock] = {}
+_cache_op_results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_cache_op_callers: Dict[str, int] = {}
+
+
+async def run_single_flight(key: str, func: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+    """
+    Run a blocking cache operation at most once per burst of identical calls.
+
+    Calls with the same key are serialized. A call that waited while another
+    run *started after it arrived* reuses that run's result: everything it
+    would have deleted is already gone, so no redundant DELETEs are issued.
+    """
+    arrived = time.monotonic()
+    lock = _cache_op_locks.setdefault(key, asyncio.Lock())
+    _cache_op_callers[key] = _cache_op_callers.get(key, 0) + 1
+    try:
+        async with lock:
+            last = _cache_op_results.get(key)
+            if last is not None and last[0] >= arrived:
+                logger.info(f"🔁 Cache operation {key} coalesced with a concurrent run")
+                return last[1]
+            
+            started = time.monotonic()
+            result = await asyncio.to_thread(func, *args)
+            _cache_op_results[key] = (started, result)
+            return result
+    finally:
+        _cache_op_callers[key] -= 1
+        if not _cache_op_callers[key]:
+            # Nobody left who could reuse the result: forget the key
+            del _cache_op_callers[key]
+            _cache_op_locks.pop(key, None)
+            _cache_op_results.pop(key, None)
+
+
+def invalidate_cache_stats(app: FastAPI) -> None:
+    """
+    Drop the stats snapshot after a clear/invalidate.
+
+    Bumping the generation makes any get_stats() run that started before the
+    change discard its (pre-clear) result instead of storing it.
+    """
+    app.state.cache_stats_generation = getattr(app.state, "cache_stats_generation", 0) + 1
+    app.state.cache_stats = None
+
+
+async def collect_cache_stats(app: FastAPI) -> Dict[str, Any]:
+    """
+    Run get_stats() in a worker thread (blocking DB calls) and store the
+    snapshot unless the caches were invalidated while it was running.
+    """
+    generation = getattr(app.state, "cache_stats_generation", 0)
+    stats = await asyncio.to_thread(get_cache_control().get_stats)
+    if getattr(app.state, "cache_stats_generation", 0) == generation:
+        app.state.cache_stats = stats
+    return stats
+
+
+async def refresh_cache_stats(app: FastAPI) -> None:
+    """
+    Keep app.state.cache_stats up to date (runs for the app's lifetime).
+
+    Errors are logged and retried on the next tick.
+    """
+    while True:
+        try:
+            await collect_cache_stats(app)
+        except Exception as e:
+            logger.error(f"Failed to refresh cache stats: {e}")
+        await asyncio.sleep(STATS_REFRESH_INTERVAL_SECONDS)
+
+
+async def dev_mode_dep() -> bool:
+    """DEV_MODE flag from system.ini (memoized by is_dev_mode)."""
+    return is_dev_mode()
+
 
 @router.get("/admin/cache/stats", response_model=CacheStatsResponse)
-async def get_cache_stats():
+async def get_cache_stats(request: Request):
     """
     Get comprehensive cache statistics for all layers.
     
@@ -25,10 +113,15 @@ async def get_cache_stats():
     - Current configuration flags
     
     **Frontend**: Auto-refreshes every 5 seconds
+
+    Stats may be up to STATS_REFRESH_INTERVAL_SECONDS old; `timestamp`
+    tells when they were collected.
     """
     try:
-        cache_control = get_cache_control()
-        stats = cache_control.get_stats()
+        stats = getattr(request.app.state, "cache_stats", None)
+        if stats is None:
+            # No snapshot yet (startup) or dropped after an invalidation
+            stats = await collect_cache_stats(request.app)
         
         logger.info(f"📊 Cache stats requested: memory_size={stats['memory_cache']['size']}, db_users={stats['db_cache']['cached_users']}")
         
@@ -39,7 +132,7 @@ async def get_cache_stats():
 
 
 @router.post("/admin/cache/clear", response_model=CacheClearResponse)
-async def clear_all_caches():
+async def clear_all_caches(request: Request):
     """
     Clear ALL cache layers (memory + DB).
     
@@ -51,7 +144,8 @@ async def clear_all_caches():
     """
     try:
         cache_control = get_cache_control()
-        result = cache_control.clear_all()
+        result = await run_single_flight("clear_all", cache_control.clear_all)
+        invalidate_cache_stats(request.app)  # Show the change on the next poll
         
         logger.warning(f"🗑️ ALL CACHES CLEARED! memory={result['memory_cleared']}, db={result['db_cleared']}")
         
@@ -62,7 +156,7 @@ async def clear_all_caches():
 
 
 @router.delete("/admin/cache/user/{user_id}", response_model=CacheInvalidateResponse)
-async def invalidate_user_cache(user_id: int):
+async def invalidate_user_cache(user_id: int, request: Request):
     """
     Invalidate all caches for a specific user.
     
@@ -74,7 +168,10 @@ async def invalidate_user_cache(user_id: int):
     """
     try:
         cache_control = get_cache_control()
-        result = cache_control.invalidate_user(user_id)
+        result = await run_single_flight(
+            f"user:{user_id}", cache_control.invalidate_user, user_id
+        )
+        invalidate_cache_stats(request.app)  # Show the change on the next poll
         
         logger.info(f"🗑️ User cache invalidated: user_id={user_id}, memory={result['memory_cleared']}, db={result['db_cleared']}")
         
@@ -85,7 +182,7 @@ async def invalidate_user_cache(user_id: int):
 
 
 @router.delete("/admin/cache/tenant/{tenant_id}", response_model=CacheInvalidateResponse)
-async def invalidate_tenant_cache(tenant_id: int):
+async def invalidate_tenant_cache(tenant_id: int, request: Request):
     """
     Invalidate all caches for a tenant and its users.
     
@@ -97,7 +194,10 @@ async def invalidate_tenant_cache(tenant_id: int):
     """
     try:
         cache_control = get_cache_control()
-        result = cache_control.invalidate_tenant(tenant_id)
+        result = await run_single_flight(
+            f"tenant:{tenant_id}", cache_control.invalidate_tenant, tenant_id
+        )
+        invalidate_cache_stats(request.app)  # Show the change on the next poll
         
         logger.info(f"🗑️ Tenant cache invalidated: tenant_id={tenant_id}, users={result['users_affected']}, memory={result['memory_cleared']}, db={result['db_cleared']}")
         
@@ -108,7 +208,7 @@ async def invalidate_tenant_cache(tenant_id: int):
 
 
 @router.post("/admin/cache/enable")
-async def enable_cache():
+async def enable_cache(dev_mode: bool = Depends(dev_mode_dep)):
     """
     Enable caching at runtime (without restart).
     
@@ -118,13 +218,8 @@ async def enable_cache():
     **Use case**: Re-enable cache after debugging
     """
     try:
-        cache_control = get_cache_control()
-        
         # Check if DEV_MODE is active
-        from services.config_service import get_config_service
-        config = get_config_service()
-        
-        if config.is_dev_mode():
+        if dev_mode:
             return {
                 "success": False,
                 "message": "Cannot enable cache: DEV_MODE=true in system.ini (restart required to change)"
@@ -166,7 +261,7 @@ async def disable_cache():
 
 
 @router.get("/config/dev-mode", response_model=DevModeResponse)
-async def get_dev_mode():
+async def get_dev_mode(dev_mode: bool = Depends(dev_mode_dep)):
     """
     Get development mode status from system.ini.
     
@@ -176,11 +271,6 @@ async def get_dev_mode():
     **Frontend**: Fetches once on app startup and caches the result.
     """
     try:
-        from services.config_service import get_config_service
-        
-        config = get_config_service()
-        dev_mode = config.is_dev_mode()
-        
         logger.info(f"🔧 DEV_MODE status requested: {dev_mode}")
         
         return {"dev_mode": dev_mode}
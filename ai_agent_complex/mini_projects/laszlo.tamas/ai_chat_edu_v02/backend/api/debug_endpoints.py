@@ -1,13 +1,12 @@
 """Debug API endpoints for troubleshooting."""
 
 from fastapi import APIRouter, HTTPException, status
-from database.pg_connection import get_connection_params
+from database.pg_connection import connect
 from services.qdrant_service import QdrantService
 from services.config_service import get_config_service
 from services.cache_service import simple_cache, get_context_cache
 import logging
 import os
-import psycopg2
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/debug", tags=["debug"])
@@ -21,8 +20,7 @@ async def reset_postgres():
     conn = None
     cur = None
     try:
-        params = get_connection_params()
-        conn = psycopg2.connect(**params)
+        conn = connect()
         cur = conn.cursor()
         
         # Delete in correct order (foreign key constraints)
@@ -144,14 +142,10 @@ async def reset_qdrant():
 async def reset_cache():
     """Clear all caches (database cache + Python memory cache)."""
     try:
-        import psycopg2
-        from database.pg_connection import get_connection_params
-        
         # Clear database cache table
         db_rows_deleted = 0
         try:
-            params = get_connection_params()
-            conn = psycopg2.connect(**params)
+            conn = connect()
             cur = conn.cursor()
             
             cur.execute("DELETE FROM cached_prompts;")
@@ -6,23 +6,43 @@ Provides API endpoints for listing, viewing, and managing documents.
 import logging
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field
 
 from database.pg_init import (
     get_documents_for_user,
     get_document_by_id,
     delete_document
 )
+from services.cache_control import get_cache_control
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 
+def document_cache_control(max_age: int) -> str:
+    """
+    Cache-Control for a document response.
+    
+    Browsers keep the document for max_age (BROWSER_CACHE_MAX_AGE_SECONDS),
+    then revalidate with If-None-Match, so deletions are noticed.
+    """
+    return f"private, max-age={max_age}"
+
+
+def document_etag(document: dict) -> str:
+    """Weak ETag from id, content length and creation time."""
+    created_at = document["created_at"]
+    stamp = int(created_at.timestamp()) if isinstance(created_at, datetime) else created_at
+    return f'W/"{document["id"]}-{len(document["content"])}-{stamp}"'
+
 
 # Schemas
 class DocumentSummary(BaseModel):
     """Summary of a document (without full content)."""
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+    
     id: int
     tenant_id: int
     user_id: Optional[int] = None
@@ -30,13 +50,12 @@ class DocumentSummary(BaseModel):
     source: str
     title: str
     created_at: datetime  # Changed from str to datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class DocumentDetail(BaseModel):
     """Full document with content."""
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+    
     id: int
     tenant_id: int
     user_id: Optional[int] = None
@@ -45,9 +64,6 @@ class DocumentDetail(BaseModel):
     title: str
     content: str
     created_at: datetime  # Changed from str to datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class DocumentListResponse(BaseModel):
@@ -58,7 +74,7 @@ class DocumentListResponse(BaseModel):
 
 # Endpoints
 @router.get("/", response_model=DocumentListResponse)
-def list_documents(
+async def list_documents(
     user_id: int = Query(..., description="User ID"),
     tenant_id: int = Query(..., description="Tenant ID")
 ):
@@ -74,14 +90,16 @@ def list_documents(
     try:
         logger.info(f"Listing documents for user {user_id}, tenant {tenant_id}")
         
-        documents = get_documents_for_user(user_id=user_id, tenant_id=tenant_id)
+        # psycopg (sync API) is blocking; keep it off the event loop
+        documents = await run_in_threadpool(
+            get_documents_for_user, user_id=user_id, tenant_id=tenant_id
+        )
         
-        logger.info(f"Found {len(documents)} documents for user {user_id}")
+        count = len(documents)
+        logger.info(f"Found {count} documents for user {user_id}")
         
-        return DocumentListResponse(
-            documents=documents,
-            count=len(documents)
-        )
+        # Plain dict: validated once by response_model, not twice
+        return {"documents": documents, "count": count}
     
     except Exception as e:
         logger.error(f"Error listing documents: {e}", exc_info=True)
@@ -92,16 +110,19 @@ def list_documents(
 
 
 @router.get("/{document_id}", response_model=DocumentDetail)
-def get_document(document_id: int):
+async def get_document(document_id: int, request: Request, response: Response):
     """
     Get full document by ID including content.
     
+    Sends a weak ETag; a matching If-None-Match gets 304 Not Modified
+    without a body (only when ENABLE_BROWSER_CACHE is on).
+    
     TODO: Add permission check (user must have access to this document).
     """
     try:
         logger.info(f"Fetching document {document_id}")
         
-        document = get_document_by_id(document_id)
+        document = await run_in_threadpool(get_document_by_id, document_id)
         
         if not document:
             raise HTTPException(
@@ -109,6 +130,21 @@ def get_document(document_id: int):
                 detail=f"Document {document_id} not found"
             )
         
+        cache_control = get_cache_control()
+        if cache_control.is_browser_cache_enabled():
+            etag = document_etag(document)
+            headers = {
+                "ETag": etag,
+                "Cache-Control": document_cache_control(cache_control.get_browser_cache_max_age())
+            }
+            
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                logger.info(f"Document {document_id} not modified")
+                return Response(status_code=304, headers=headers)
+            
+            response.headers.update(headers)
+        
         logger.info(f"Retrieved document {document_id}: {document['title']}")
         
         return document
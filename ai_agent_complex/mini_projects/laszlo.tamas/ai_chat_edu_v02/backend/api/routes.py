@@ -719,8 +719,6 @@ async def update_tenant(tenant_id: int, updates: TenantUpdateRequest):
     try:
         from database.pg_connection import get_db_connection
         import json
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
         
         # Build UPDATE query dynamically
         update_fields = []
@@ -751,11 +749,11 @@ async def update_tenant(tenant_id: int, updates: TenantUpdateRequest):
         values.append(tenant_id)
         query = f"UPDATE tenants SET {', '.join(update_fields)} WHERE tenant_id = %s RETURNING *"
         
-        cursor.execute(query, values)
-        updated_tenant = cursor.fetchone()
-        conn.commit()
-        cursor.close()
-        conn.close()
+        # Connection is returned to the pool when the block exits
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, values)
+                updated_tenant = cursor.fetchone()
         
         if not updated_tenant:
             raise HTTPException(status_code=404, detail="Tenant not found")
@@ -8,8 +8,9 @@ Handles:
 """
 
 import logging
+import uuid
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from database.pg_init import (
     get_user_sessions,
     update_session_title,
@@ -19,9 +20,36 @@ from database.pg_init import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
+DEFAULT_SESSION_TITLE = "Új beszélgetés"
+
+
+def require_session_uuid(session_id: str) -> None:
+    """
+    Reject malformed session IDs with 404 before they reach PostgreSQL.
+
+    chat_sessions.id is a UUID column; a bad ID would otherwise fail inside
+    the query and be logged as an unexpected 500 with a full traceback.
+    """
+    try:
+        uuid.UUID(session_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+
+# Longer titles are cut to this length (as update_session_title stores them)
+MAX_SESSION_TITLE_LENGTH = 100
+
 
 class UpdateTitleRequest(BaseModel):
-    title: str
+    """New session title; stripped, non-empty, cut to MAX_SESSION_TITLE_LENGTH."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    title: str = Field(..., min_length=1)
+    
+    @field_validator("title")
+    @classmethod
+    def _truncate(cls, v: str) -> str:
+        return v[:MAX_SESSION_TITLE_LENGTH]
 
 
 @router.get("")
@@ -34,15 +62,14 @@ async def list_user_sessions(user_id: int = Query(..., description="User ID")):
     - message_count, is_deleted, processed_for_ltm
     """
     try:
-        sessions = get_user_sessions(user_id, include_deleted=False)
-        
-        # Format response: title fallback to "Új beszélgetés"
-        for session in sessions:
-            if not session.get('title'):
-                session['title'] = "Új beszélgetés"
+        # Untitled sessions get the fallback title from the query itself
+        sessions = get_user_sessions(
+            user_id, include_deleted=False, default_title=DEFAULT_SESSION_TITLE
+        )
+        count = len(sessions)
         
-        logger.info(f"Listed {len(sessions)} sessions for user_id={user_id}")
-        return {"sessions": sessions, "count": len(sessions)}
+        logger.info(f"Listed {count} sessions for user_id={user_id}")
+        return {"sessions": sessions, "count": count}
     
     except Exception as e:
         logger.error(f"Error listing sessions for user {user_id}: {e}", exc_info=True)
@@ -54,19 +81,17 @@ async def update_title(session_id: str, request: UpdateTitleRequest):
     """
     Update session title (user editing).
     
-    Max length: 100 characters
+    Max length: 100 characters (longer titles are cut); blank titles get 422.
     """
     try:
-        if not request.title or len(request.title.strip()) == 0:
-            raise HTTPException(status_code=400, detail="Title cannot be empty")
-        
-        success = update_session_title(session_id, request.title.strip())
+        require_session_uuid(session_id)
+        success = update_session_title(session_id, request.title)
         
         if not success:
             raise HTTPException(status_code=404, detail="Session not found")
         
         logger.info(f"Updated title for session {session_id}: {request.title[:50]}")
-        return {"success": True, "title": request.title.strip()}
+        return {"success": True, "title": request.title}
     
     except HTTPException:
         raise
@@ -83,6 +108,7 @@ async def delete_session(session_id: str):
     Session will no longer appear in session list but data is preserved.
     """
     try:
+        require_session_uuid(session_id)
         success = soft_delete_session(session_id)
         
         if not success:
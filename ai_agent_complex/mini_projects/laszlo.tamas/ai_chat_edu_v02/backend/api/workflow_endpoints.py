@@ -6,17 +6,105 @@ New endpoints that use the automated LangGraph workflows:
 2. POST /api/workflows/close-session - Session memory creation
 """
 
+import hashlib
 import logging
 from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from pydantic import BaseModel, Field
-from typing import Literal, Dict, Any
+from typing import Literal, Dict, Any, Optional
 import os
 
+from database.document_repository import DocumentRepository
+from services.config_service import get_config_service
 from services.document_processing_workflow import DocumentProcessingWorkflow
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".txt", ".md"})
+
+# Uploads are copied from the spooled request file in chunks of this size
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Allowance for multipart boundaries/headers and the form fields when
+# comparing Content-Length against the file size limit
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Path guarded by UploadSizeLimitMiddleware (router is mounted under /api)
+PROCESS_DOCUMENT_PATH = "/api/workflows/process-document"
+
+
+def max_upload_bytes() -> int:
+    """MAX_FILE_SIZE_MB from system.ini, in bytes."""
+    return get_config_service().get_max_file_size_mb() * 1024 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized document uploads from the Content-Length header.
+
+    FastAPI parses the whole multipart body before the endpoint runs, so a
+    check inside the handler comes after the upload was received and
+    spooled. This ASGI middleware answers 413 before any body is read.
+    Uploads without Content-Length (chunked) are still bounded by
+    read_upload_limited.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST" \
+                and scope["path"].rstrip("/") == PROCESS_DOCUMENT_PATH:
+            max_bytes = max_upload_bytes()
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                        logger.warning(f"[WORKFLOW API] process-document: rejected {int(value)} byte upload")
+                        response = ORJSONResponse(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            content={"detail": f"File too large (max: {max_bytes} bytes)"}
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+def new_content_hasher() -> hashlib.blake2b:
+    """Hasher for documents.content_hash (BLAKE2b-256, stdlib)."""
+    return hashlib.blake2b(digest_size=32)
+
+
+async def read_upload_limited(
+    file: UploadFile,
+    max_bytes: int,
+    hasher: Optional[hashlib.blake2b] = None
+) -> bytes:
+    """
+    Read an upload in chunks, failing as soon as it exceeds max_bytes.
+
+    Starlette already spools large uploads to a temp file; this keeps an
+    oversized upload from being pulled into memory in full before the
+    size check rejects it. If a hasher is given it is fed each chunk.
+
+    Raises:
+        HTTPException 413: If the file is larger than max_bytes
+    """
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer += chunk
+        if hasher is not None:
+            hasher.update(chunk)
+        if len(buffer) > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large (max: {max_bytes} bytes)"
+            )
+    return bytes(buffer)
+
 
 # ===== REQUEST/RESPONSE MODELS =====
 
@@ -51,6 +139,7 @@ async def process_document_workflow(
     
     Pipeline steps (automatic):
     - File validation
+    - Duplicate check (same file already processed → skipped)
     - Content extraction (PDF/TXT/MD)
     - Database storage
     - Text chunking
@@ -73,8 +162,8 @@ async def process_document_workflow(
     
     Returns:
         {
-            "status": "success" | "failed",
-            "document_id": int,
+            "status": "success" | "skipped" | "failed",
+            "document_id": int,  # existing document if skipped
             "summary": {
                 "filename": str,
                 "content_length": int,
@@ -86,21 +175,45 @@ async def process_document_workflow(
     
     Raises:
         400: Invalid file or parameters
+        413: File larger than MAX_FILE_SIZE_MB (system.ini)
         500: Processing error
     """
     logger.info(f"[WORKFLOW API] process-document: {file.filename}, tenant={tenant_id}, user={user_id}")
     
     try:
         # Validate file extension
-        file_ext = f".{file.filename.split('.')[-1].lower()}" if "." in file.filename else ""
-        if file_ext not in {".pdf", ".txt", ".md"}:
+        file_ext = os.path.splitext(file.filename or "")[1].lower()
+        if file_ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid file type: {file_ext}. Allowed: .pdf, .txt, .md"
             )
         
-        # Read file content
-        content = await file.read()
+        # Oversized Content-Length was already rejected by
+        # UploadSizeLimitMiddleware; read in bounded chunks
+        hasher = new_content_hasher()
+        content = await read_upload_limited(file, max_upload_bytes(), hasher)
+        content_hash = hasher.digest()
+        
+        # Same file already processed for this tenant/owner: reuse its chunks
+        existing_id = await run_in_threadpool(
+            DocumentRepository().find_processed_document_by_hash,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            visibility=visibility,
+            content_hash=content_hash
+        )
+        if existing_id is not None:
+            logger.info(f"[WORKFLOW API] process-document: duplicate of document {existing_id}, skipped")
+            return {
+                "status": "skipped",
+                "document_id": existing_id,
+                "summary": {
+                    "document_id": existing_id,
+                    "filename": file.filename,
+                    "reason": "duplicate content"
+                }
+            }
         
         # Execute workflow
         workflow = DocumentProcessingWorkflow()
@@ -110,7 +223,8 @@ async def process_document_workflow(
             file_type=file_ext,
             tenant_id=tenant_id,
             user_id=user_id,
-            visibility=visibility
+            visibility=visibility,
+            content_hash=content_hash
         )
         
         logger.info(f"[WORKFLOW API] process-document complete: status={result['status']}")
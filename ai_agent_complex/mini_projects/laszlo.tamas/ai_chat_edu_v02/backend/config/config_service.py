@@ -2,78 +2,162 @@
 Configuration Service - system.ini Reader
 
 Provides centralized access to system.ini configuration values.
+
+Values are type-converted once when the file is loaded and served from a
+dict afterwards. The file's mtime is checked (at most once per
+_STAT_INTERVAL seconds) so edits to system.ini are picked up without a
+restart.
 """
 
-import configparser
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from config.fast_ini import IniData, load_ini
 
 logger = logging.getLogger(__name__)
 
-# Singleton pattern for config parser
-_config: Optional[configparser.ConfigParser] = None
+# Parsed system.ini (shared with settings.py / ConfigService via load_ini)
+_config: Optional[IniData] = None
 _config_path = Path(__file__).parent / "system.ini"
 
+# (section, key) -> raw string / converted value, built by _load_config
+_raw: Dict[Tuple[str, str], str] = {}
+_typed: Dict[Tuple[str, str], Any] = {}
+
+# mtime of the loaded file (None if it did not exist) and last stat() time
+_mtime_ns: Optional[int] = None
+_last_check = 0.0
+_STAT_INTERVAL = 1.0  # seconds
+
+# Serializes (re)loads so concurrent first calls parse the file only once
+_load_lock = threading.Lock()
+
+_MISSING = object()
+
+
+def _convert(value: str) -> Any:
+    """Convert a raw ini value to bool, int, float or str."""
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+
+    try:
+        # Try integer
+        return int(value)
+    except ValueError:
+        try:
+            # Try float
+            return float(value)
+        except ValueError:
+            # Return as string
+            return value
+
+
+def _file_mtime_ns() -> Optional[int]:
+    """Return system.ini mtime in ns, or None if the file does not exist."""
+    try:
+        return _config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _is_stale() -> bool:
+    """Check (rate-limited) whether system.ini changed since it was loaded."""
+    global _last_check
+
+    now = time.monotonic()
+    if now - _last_check < _STAT_INTERVAL:
+        return False
+    _last_check = now
+    return _file_mtime_ns() != _mtime_ns
+
+
+def _load_config() -> IniData:
+    """Load system.ini configuration file (singleton, reloaded on change)."""
+    if _config is not None and not _is_stale():
+        return _config
+
+    with _load_lock:
+        # Another thread may have (re)loaded it while we waited
+        if _config is None or _file_mtime_ns() != _mtime_ns:
+            _read_config()
 
-def _load_config() -> configparser.ConfigParser:
-    """Load system.ini configuration file (singleton)."""
-    global _config
-    
-    if _config is None:
-        _config = configparser.ConfigParser()
-        if _config_path.exists():
-            _config.read(_config_path, encoding='utf-8')
-            logger.info(f"Loaded configuration from {_config_path}")
-        else:
-            logger.warning(f"Configuration file not found: {_config_path}")
-    
     return _config
 
 
+def _read_config() -> None:
+    """Parse system.ini and rebuild the value tables (caller holds the lock)."""
+    global _config, _raw, _typed, _mtime_ns, _last_check
+
+    mtime_ns = _file_mtime_ns()
+    config = load_ini(_config_path)
+    if mtime_ns is not None:
+        logger.info(f"Loaded configuration from {_config_path}")
+    else:
+        logger.warning(f"Configuration file not found: {_config_path}")
+
+    raw: Dict[Tuple[str, str], str] = {}
+    typed: Dict[Tuple[str, str], Any] = {}
+    for section, values in config.items():
+        for key, value in values.items():
+            raw[(section, key)] = value
+            typed[(section, key)] = _convert(value)
+
+    _config, _raw, _typed = config, raw, typed
+    _mtime_ns = mtime_ns
+    _last_check = time.monotonic()
+
+
+def _lookup(section: str, key: str, raw: bool = False) -> Any:
+    """Look up a converted (or raw) value; keys are case-insensitive."""
+    _load_config()
+    table = _raw if raw else _typed
+    return table.get((section, key.lower()), _MISSING)
+
+
 def get_config_value(section: str, key: str, fallback: Any = None) -> Any:
     """
     Get configuration value from system.ini.
-    
+
     Args:
         section: Configuration section (e.g., 'application', 'rag')
         key: Configuration key (e.g., 'APP_VERSION', 'TOP_K_DOCUMENTS')
         fallback: Default value if key not found
-    
+
     Returns:
         Configuration value or fallback
-    
+
     Example:
         >>> get_config_value('application', 'APP_VERSION', '0.0.0')
         '0.2.0'
     """
-    config = _load_config()
-    
-    try:
-        if section in config and key in config[section]:
-            value = config[section][key]
-            
-            # Type conversion based on value
-            if value.lower() in ('true', 'false'):
-                return value.lower() == 'true'
-            
-            try:
-                # Try integer
-                return int(value)
-            except ValueError:
-                try:
-                    # Try float
-                    return float(value)
-                except ValueError:
-                    # Return as string
-                    return value
-        else:
-            logger.debug(f"Config key [{section}].{key} not found, using fallback: {fallback}")
-            return fallback
-    
-    except Exception as e:
-        logger.error(f"Error reading config [{section}].{key}: {e}")
+    value = _lookup(section, key)
+    if value is _MISSING:
+        logger.debug(f"Config key [{section}].{key} not found, using fallback: {fallback}")
         return fallback
+    return value
+
+
+def get_bool(section: str, key: str, fallback: bool = False) -> bool:
+    """Get a boolean value from system.ini (fallback if missing or not a bool)."""
+    value = get_config_value(section, key, fallback)
+    return value if isinstance(value, bool) else fallback
+
+
+def get_int(section: str, key: str, fallback: int = 0) -> int:
+    """Get an integer value from system.ini (fallback if missing or not an int)."""
+    value = get_config_value(section, key, fallback)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return fallback
+
+
+def get_str(section: str, key: str, fallback: str = "") -> str:
+    """Get a value from system.ini as the raw string from the file."""
+    value = _lookup(section, key, raw=True)
+    return fallback if value is _MISSING else value
 
 
 def reload_config() -> None:
@@ -0,0 +1,101 @@
+"""
+Minimal system.ini parser.
+
+system.ini only uses flat ``[section]`` / ``key = value`` lines, so it is
+parsed with two precompiled regexes into ``{section: {key: raw_value}}``
+instead of going through configparser's interpolation machinery.
+
+Matches the configparser behaviour the backend relies on:
+- keys are case-insensitive (stored lower-case, like optionxform)
+- full-line ``#`` / ``;`` comments, no inline comments
+- values are stripped; indented lines continue the previous value
+- later duplicates of a key override earlier ones
+"""
+
+import functools
+import os
+import re
+from pathlib import Path
+from typing import Dict, Union
+
+IniData = Dict[str, Dict[str, str]]
+
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+# Same spellings as configparser.ConfigParser.BOOLEAN_STATES
+TRUE_VALUES = frozenset({'1', 'yes', 'true', 'on'})
+FALSE_VALUES = frozenset({'0', 'no', 'false', 'off'})
+BOOLEAN_STATES = {
+    **dict.fromkeys(TRUE_VALUES, True),
+    **dict.fromkeys(FALSE_VALUES, False),
+}
+
+
+def parse_ini(text: str) -> IniData:
+    """Parse ini text into a nested dict of raw string values."""
+    data: IniData = {}
+    section = None
+    key = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+
+        if line[0].isspace() and section is not None and key is not None:
+            # Continuation of a multi-line value
+            section[key] = f"{section[key]}\n{stripped}"
+            continue
+
+        match = _SECTION_RE.match(stripped)
+        if match:
+            section = data.setdefault(match.group(1).strip(), {})
+            key = None
+            continue
+
+        match = _KV_RE.match(stripped)
+        if match and section is not None:
+            key = match.group(1).lower()
+            section[key] = match.group(2)
+
+    return data
+
+
+def read_ini(path: Union[str, Path]) -> IniData:
+    """Read and parse an ini file (UTF-8); missing file -> empty dict."""
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return {}
+    return parse_ini(text)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_ini(path: str, mtime_ns: int) -> IniData:
+    return read_ini(path)
+
+
+def load_ini(path: Union[str, Path]) -> IniData:
+    """
+    Parse an ini file once and share the result between all callers.
+
+    Cached per (absolute path, mtime), so an edited file is parsed again.
+    The returned dict is shared: treat it as read-only.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_ini(path, mtime_ns)
+
+
+def to_bool(value: str) -> bool:
+    """Convert an ini value to bool like ConfigParser.getboolean."""
+    normalized = value.strip().lower()
+    if normalized in TRUE_VALUES:
+        return True
+    if normalized in FALSE_VALUES:
+        return False
+    raise ValueError(f"Not a boolean: {value}")
@@ -0,0 +1,25 @@
+"""
+JSON log formatter for container deployments (LOG_FORMAT=json).
+
+One JSON object per line, serialized with orjson instead of the stdlib
+json module so logging stays cheap on cache/DB hot paths.
+"""
+
+import logging
+
+import orjson
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
@@ -3,21 +3,21 @@ System Prompt Configuration
 Hierarchical prompt system: Application → Tenant → User
 """
 
-import configparser
 import os
 from pathlib import Path
 
-# Load system.ini configuration
-_config = configparser.ConfigParser()
+from config.fast_ini import load_ini
+
+# Load system.ini configuration (shared parse, see fast_ini.load_ini)
 _config_path = Path(__file__).parent / "system.ini"
 
 if not _config_path.exists():
     raise FileNotFoundError(f"Configuration file not found: {_config_path}")
 
-_config.read(_config_path, encoding='utf-8')
+_application = load_ini(_config_path).get("application", {})
 
 # Application-level system prompt (loaded from system.ini)
-APPLICATION_SYSTEM_PROMPT = _config.get("application", "SYSTEM_PROMPT", fallback="""You are a helpful AI assistant in a multi-tenant internal chat system.
+APPLICATION_SYSTEM_PROMPT = _application.get("system_prompt", """You are a helpful AI assistant in a multi-tenant internal chat system.
 - Always maintain professional tone
 - Prioritize user privacy and data security
 - Follow company policies and guidelines
@@ -29,7 +29,7 @@ use the information from the "CURRENT USER" section below. DO NOT search documen
 Documents contain domain knowledge and uploaded content - they do NOT contain the current user's personal data.""")
 
 # Chat history handling instructions
-CHAT_HISTORY_INSTRUCTIONS = _config.get("application", "CHAT_HISTORY_INSTRUCTIONS", fallback="")
+CHAT_HISTORY_INSTRUCTIONS = _application.get("chat_history_instructions", "")
 
 
 def build_system_prompt(
@@ -1,65 +1,88 @@
 """
 Configuration loader for system.ini settings
 """
-import configparser
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final, Mapping
 
-# Load system.ini
-config = configparser.ConfigParser()
+from config.fast_ini import load_ini, to_bool
+
+# Load system.ini. Every value below is read and cast once at import and is
+# constant for the lifetime of the process.
 config_path = Path(__file__).parent / "system.ini"
-config.read(config_path)
+_ini = load_ini(config_path)  # Shared with ConfigService (parsed once)
+
+
+def _get(section: str, key: str, fallback: str) -> str:
+    return _ini.get(section, {}).get(key.lower(), fallback)
+
+
+def _getint(section: str, key: str, fallback: int) -> int:
+    value = _ini.get(section, {}).get(key.lower())
+    return fallback if value is None else int(value)
+
+
+def _getfloat(section: str, key: str, fallback: float) -> float:
+    value = _ini.get(section, {}).get(key.lower())
+    return fallback if value is None else float(value)
+
+
+def _getboolean(section: str, key: str, fallback: bool) -> bool:
+    value = _ini.get(section, {}).get(key.lower())
+    return fallback if value is None else to_bool(value)
+
 
 # [application]
-DEFAULT_LANGUAGE = config.get("application", "DEFAULT_LANGUAGE", fallback="en")
-MAX_CONTEXT_TOKENS = config.getint("application", "MAX_CONTEXT_TOKENS", fallback=8000)
+DEFAULT_LANGUAGE: Final[str] = _get("application", "DEFAULT_LANGUAGE", "en")
+MAX_CONTEXT_TOKENS: Final[int] = _getint("application", "MAX_CONTEXT_TOKENS", 8000)
 
 # [llm]
-CHAT_TEMPERATURE = config.getfloat("llm", "CHAT_TEMPERATURE", fallback=0.7)
-CHAT_MAX_TOKENS = config.getint("llm", "CHAT_MAX_TOKENS", fallback=500)
-EMBEDDING_BATCH_SIZE = config.getint("llm", "EMBEDDING_BATCH_SIZE", fallback=100)
+CHAT_TEMPERATURE: Final[float] = _getfloat("llm", "CHAT_TEMPERATURE", 0.7)
+CHAT_MAX_TOKENS: Final[int] = _getint("llm", "CHAT_MAX_TOKENS", 500)
+EMBEDDING_BATCH_SIZE: Final[int] = _getint("llm", "EMBEDDING_BATCH_SIZE", 100)
 
 # [chunking]
-CHUNKING_STRATEGY = config.get("chunking", "CHUNKING_STRATEGY", fallback="recursive")
-CHUNK_SIZE_TOKENS = config.getint("chunking", "CHUNK_SIZE_TOKENS", fallback=500)
-CHUNK_OVERLAP_TOKENS = config.getint("chunking", "CHUNK_OVERLAP_TOKENS", fallback=50)
+CHUNKING_STRATEGY: Final[str] = _get("chunking", "CHUNKING_STRATEGY", "recursive")
+CHUNK_SIZE_TOKENS: Final[int] = _getint("chunking", "CHUNK_SIZE_TOKENS", 500)
+CHUNK_OVERLAP_TOKENS: Final[int] = _getint("chunking", "CHUNK_OVERLAP_TOKENS", 50)
 
 # [retrieval]
-TOP_K_DOCUMENTS = config.getint("retrieval", "TOP_K_DOCUMENTS", fallback=5)
-TOP_K_PRODUCTS = config.getint("retrieval", "TOP_K_PRODUCTS", fallback=10)
-SIMILARITY_METRIC = config.get("retrieval", "SIMILARITY_METRIC", fallback="cosine")
-MIN_SCORE_THRESHOLD = config.getfloat("retrieval", "MIN_SCORE_THRESHOLD", fallback=0.7)
+TOP_K_DOCUMENTS: Final[int] = _getint("retrieval", "TOP_K_DOCUMENTS", 5)
+TOP_K_PRODUCTS: Final[int] = _getint("retrieval", "TOP_K_PRODUCTS", 10)
+SIMILARITY_METRIC: Final[str] = _get("retrieval", "SIMILARITY_METRIC", "cosine")
+MIN_SCORE_THRESHOLD: Final[float] = _getfloat("retrieval", "MIN_SCORE_THRESHOLD", 0.7)
 
 # [memory]
-ENABLE_LONGTERM_CHAT_STORAGE = config.getboolean("memory", "ENABLE_LONGTERM_CHAT_STORAGE", fallback=True)
-ENABLE_LONGTERM_CHAT_RETRIEVAL = config.getboolean("memory", "ENABLE_LONGTERM_CHAT_RETRIEVAL", fallback=True)
-CHAT_SUMMARY_MAX_TOKENS = config.getint("memory", "CHAT_SUMMARY_MAX_TOKENS", fallback=200)
-CONSOLIDATE_AFTER_MESSAGES = config.getint("memory", "CONSOLIDATE_AFTER_MESSAGES", fallback=20)
-MIN_MESSAGES_FOR_CONSOLIDATION = config.getint("memory", "MIN_MESSAGES_FOR_CONSOLIDATION", fallback=5)
+ENABLE_LONGTERM_CHAT_STORAGE: Final[bool] = _getboolean("memory", "ENABLE_LONGTERM_CHAT_STORAGE", True)
+ENABLE_LONGTERM_CHAT_RETRIEVAL: Final[bool] = _getboolean("memory", "ENABLE_LONGTERM_CHAT_RETRIEVAL", True)
+CHAT_SUMMARY_MAX_TOKENS: Final[int] = _getint("memory", "CHAT_SUMMARY_MAX_TOKENS", 200)
+CONSOLIDATE_AFTER_MESSAGES: Final[int] = _getint("memory", "CONSOLIDATE_AFTER_MESSAGES", 20)
+MIN_MESSAGES_FOR_CONSOLIDATION: Final[int] = _getint("memory", "MIN_MESSAGES_FOR_CONSOLIDATION", 5)
 
 # [rate_limiting]
-REQUESTS_PER_MINUTE = config.getint("rate_limiting", "REQUESTS_PER_MINUTE", fallback=60)
-MAX_CONCURRENT_REQUESTS = config.getint("rate_limiting", "MAX_CONCURRENT_REQUESTS", fallback=10)
+REQUESTS_PER_MINUTE: Final[int] = _getint("rate_limiting", "REQUESTS_PER_MINUTE", 60)
+MAX_CONCURRENT_REQUESTS: Final[int] = _getint("rate_limiting", "MAX_CONCURRENT_REQUESTS", 10)
 
 # [cache]
-ENABLE_RESPONSE_CACHE = config.getboolean("cache", "ENABLE_RESPONSE_CACHE", fallback=False)
-CACHE_TTL_SECONDS = config.getint("cache", "CACHE_TTL_SECONDS", fallback=3600)
+ENABLE_RESPONSE_CACHE: Final[bool] = _getboolean("cache", "ENABLE_RESPONSE_CACHE", False)
+CACHE_TTL_SECONDS: Final[int] = _getint("cache", "CACHE_TTL_SECONDS", 3600)
 
 # [logging]
-LOG_LLM_REQUESTS = config.getboolean("logging", "LOG_LLM_REQUESTS", fallback=True)
-LOG_VECTOR_SEARCHES = config.getboolean("logging", "LOG_VECTOR_SEARCHES", fallback=True)
-LOG_EMBEDDING_OPERATIONS = config.getboolean("logging", "LOG_EMBEDDING_OPERATIONS", fallback=True)
+LOG_LLM_REQUESTS: Final[bool] = _getboolean("logging", "LOG_LLM_REQUESTS", True)
+LOG_VECTOR_SEARCHES: Final[bool] = _getboolean("logging", "LOG_VECTOR_SEARCHES", True)
+LOG_EMBEDDING_OPERATIONS: Final[bool] = _getboolean("logging", "LOG_EMBEDDING_OPERATIONS", True)
 
 # Environment variables (from .env)
-OPENAI_MODEL_CHAT = os.getenv("OPENAI_MODEL_CHAT", "gpt-3.5-turbo")
-OPENAI_MODEL_EMBEDDING = os.getenv("OPENAI_MODEL_EMBEDDING", "text-embedding-3-large")
+OPENAI_MODEL_CHAT: Final[str] = os.getenv("OPENAI_MODEL_CHAT", "gpt-3.5-turbo")
+OPENAI_MODEL_EMBEDDING: Final[str] = os.getenv("OPENAI_MODEL_EMBEDDING", "text-embedding-3-large")
 
-# Embedding dimensions mapping
-EMBEDDING_MODEL_DIMENSIONS = {
+# Embedding dimensions mapping (read-only)
+EMBEDDING_MODEL_DIMENSIONS: Final[Mapping[str, int]] = MappingProxyType({
     "text-embedding-3-small": 1536,
     "text-embedding-3-large": 3072,
     "text-embedding-ada-002": 1536,
-}
+})
 
 def get_embedding_dimensions(model: str = None) -> int:
     """Get embedding dimensions for a model."""
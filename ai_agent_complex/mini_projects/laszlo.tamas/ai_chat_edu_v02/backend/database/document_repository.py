@@ -19,7 +19,8 @@ class DocumentRepository:
         visibility: Literal["private", "tenant"],
         source: str,
         title: str,
-        content: str
+        content: str,
+        content_hash: bytes | None = None
     ) -> int:
         """
         Insert a new document into the documents table.
@@ -31,6 +32,7 @@ class DocumentRepository:
             source: Document source (e.g., 'upload')
             title: Document title/filename
             content: Full text content
+            content_hash: Digest of the uploaded file (for duplicate detection)
         
         Returns:
             document_id: ID of the inserted document
@@ -51,10 +53,11 @@ class DocumentRepository:
                         source,
                         title,
                         content,
+                        content_hash,
                         created_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, NOW())
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
                     RETURNING id
-                """, (tenant_id, actual_user_id, visibility, source, title, content))
+                """, (tenant_id, actual_user_id, visibility, source, title, content, content_hash))
                 
                 document_id = cursor.fetchone()['id']
                 
@@ -62,6 +65,56 @@ class DocumentRepository:
                 
                 return document_id
     
+    def find_processed_document_by_hash(
+        self,
+        tenant_id: int,
+        user_id: int,
+        visibility: Literal["private", "tenant"],
+        content_hash: bytes
+    ) -> int | None:
+        """
+        Find an already processed upload with the same file content.
+        
+        Only documents with the same visibility (and owner, for private
+        documents) match, so a user never gets someone else's private copy.
+        Documents whose pipeline did not finish (no chunks, or chunks
+        without a Qdrant point) are ignored.
+        
+        Args:
+            tenant_id: Tenant identifier
+            user_id: User identifier (ignored if visibility='tenant')
+            visibility: Document visibility ('private' or 'tenant')
+            content_hash: Digest of the uploaded file
+        
+        Returns:
+            ID of the oldest matching document, or None
+        """
+        actual_user_id = None if visibility == 'tenant' else user_id
+        
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT d.id
+                    FROM documents d
+                    WHERE d.tenant_id = %s
+                      AND d.content_hash = %s
+                      AND d.visibility = %s
+                      AND d.user_id IS NOT DISTINCT FROM %s
+                      AND EXISTS (
+                          SELECT 1 FROM document_chunks c
+                          WHERE c.document_id = d.id
+                      )
+                      AND NOT EXISTS (
+                          SELECT 1 FROM document_chunks c
+                          WHERE c.document_id = d.id AND c.qdrant_point_id IS NULL
+                      )
+                    ORDER BY d.id
+                    LIMIT 1
+                """, (tenant_id, content_hash, visibility, actual_user_id))
+                
+                row = cursor.fetchone()
+                return row["id"] if row else None
+    
     def get_document_by_id(self, document_id: int) -> dict | None:
         """
         Retrieve a document by its ID.
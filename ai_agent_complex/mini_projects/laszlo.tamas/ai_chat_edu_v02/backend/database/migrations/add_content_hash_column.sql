@@ -0,0 +1,15 @@
+-- Migration: Add content_hash column to documents table
+-- Date: 2026-10-16
+-- Purpose: Skip extraction/chunking/embedding when the same file is uploaded again
+
+-- Add content_hash column (BLAKE2b digest of the uploaded file)
+ALTER TABLE documents
+ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+
+-- Add index for duplicate lookups within a tenant
+CREATE INDEX IF NOT EXISTS idx_documents_tenant_content_hash
+ON documents(tenant_id, content_hash);
+
+-- Add comment
+COMMENT ON COLUMN documents.content_hash IS
+'BLAKE2b-256 digest of the uploaded file; NULL for documents created before this migration';
@@ -0,0 +1,10 @@
+-- Migration: Make user_prompt_cache an UNLOGGED table
+-- Date: 2026-10-16
+-- Purpose: The prompt cache is rebuildable, not source of truth; skip WAL on writes
+
+-- Convert table (rewrites it once; the cache is small)
+ALTER TABLE user_prompt_cache SET UNLOGGED;
+
+-- Add comment
+COMMENT ON TABLE user_prompt_cache IS
+'Rebuildable cache of assembled system prompts (Tier 2). UNLOGGED: emptied after a crash, not replicated.';
@@ -1,9 +1,16 @@
+import atexit
 import os
 import logging
+import threading
 from contextlib import contextmanager
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Generator
+from types import MappingProxyType
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.string import TextLoader
+from psycopg_pool import ConnectionPool
+from typing import Any, Generator, Mapping, Optional
+
+from config.settings import MAX_CONCURRENT_REQUESTS
 
 logger = logging.getLogger(__name__)
 
@@ -21,40 +28,110 @@ if not all([POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DB, POSTGRES_USER, POSTGRES_P
 # Remove quotes (single or double) from password if present
 POSTGRES_PASSWORD = POSTGRES_PASSWORD_RAW.strip("'\"")
 
+# Optional external pooler (e.g. PgBouncer in transaction pooling mode).
+# When POSTGRES_POOLER_HOST is set, all connections go through it instead of
+# POSTGRES_HOST/POSTGRES_PORT.
+POSTGRES_POOLER_HOST = os.getenv("POSTGRES_POOLER_HOST")
+POSTGRES_POOLER_PORT = os.getenv("POSTGRES_POOLER_PORT", "6432")
+
+
+# Built once at import: the environment does not change for the process
+_CONNECTION_PARAMS: Mapping[str, Any] = MappingProxyType({
+    "host": POSTGRES_POOLER_HOST or POSTGRES_HOST,
+    "port": POSTGRES_POOLER_PORT if POSTGRES_POOLER_HOST else POSTGRES_PORT,
+    "dbname": POSTGRES_DB,
+    "user": POSTGRES_USER,
+    "password": POSTGRES_PASSWORD,
+    "client_encoding": "UTF8",  # Force UTF-8 encoding
+    "application_name": "ai_chat_edu_v02",  # Shown in pg_stat_activity
+    # Fail fast on a dead server/pooler instead of the OS TCP timeout
+    "connect_timeout": 5,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+})
+
+
+def get_connection_params() -> Mapping[str, Any]:
+    """Get PostgreSQL connection parameters (read-only, shared) from environment variables."""
+    return _CONNECTION_PARAMS
+
+
+# Connections kept open between requests (pool is created on first use)
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = max(POOL_MIN_CONNECTIONS, MAX_CONCURRENT_REQUESTS)
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _configure_connection(conn: psycopg.Connection) -> None:
+    """Per-connection setup: UUIDs come back as str, as they did with psycopg2."""
+    conn.adapters.register_loader("uuid", TextLoader)
+
+
+def _connection_kwargs() -> dict:
+    """psycopg.connect() options on top of the libpq parameters."""
+    kwargs = {"row_factory": dict_row}
+    if POSTGRES_POOLER_HOST:
+        # Transaction pooling may run each transaction on a different server
+        # connection, so server-side prepared statements cannot be reused
+        kwargs["prepare_threshold"] = None
+    return kwargs
+
+
+def connect() -> psycopg.Connection:
+    """Open a standalone (unpooled) connection with dict rows."""
+    conn = psycopg.connect(**get_connection_params(), **_connection_kwargs())
+    _configure_connection(conn)
+    return conn
+
+
+def _get_pool() -> ConnectionPool:
+    """Create the connection pool on first use (importing never connects)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    kwargs={**get_connection_params(), **_connection_kwargs()},
+                    configure=_configure_connection,
+                    min_size=POOL_MIN_CONNECTIONS,
+                    max_size=POOL_MAX_CONNECTIONS,
+                    open=True
+                )
+                # Also close on interpreter exit for scripts that never run
+                # the app lifespan (close_db_pool is idempotent)
+                atexit.register(close_db_pool)
+                via = f" via pooler {POSTGRES_POOLER_HOST}" if POSTGRES_POOLER_HOST else ""
+                logger.info(f"PostgreSQL pool created (min={POOL_MIN_CONNECTIONS}, max={POOL_MAX_CONNECTIONS}){via}")
+    return _pool
+
 
-def get_connection_params() -> dict:
-    """Get PostgreSQL connection parameters from environment variables."""
-    return {
-        "host": POSTGRES_HOST,
-        "port": POSTGRES_PORT,
-        "database": POSTGRES_DB,
-        "user": POSTGRES_USER,
-        "password": POSTGRES_PASSWORD,
-        "client_encoding": "UTF8",  # Force UTF-8 encoding
-    }
+def close_db_pool() -> None:
+    """Close all pooled connections (application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
 
 
 @contextmanager
 def get_db_connection() -> Generator:
     """Context manager for PostgreSQL database connections.
     
-    Returns a connection with RealDictCursor for dictionary-like row access.
-    Automatically commits on success, rolls back on error, and closes connection.
+    Returns a pooled connection whose cursors yield dict rows.
+    Automatically commits on success, rolls back on error, and returns the
+    connection to the pool (broken connections are discarded by the pool).
     """
-    conn = None
     try:
-        params = get_connection_params()
-        conn = psycopg2.connect(**params, cursor_factory=RealDictCursor)
-        yield conn
-        conn.commit()
+        with _get_pool().connection() as conn:
+            yield conn
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Database error: {e}")
         raise
-    finally:
-        if conn:
-            conn.close()
 
 
 def check_db_connection() -> tuple[bool, str]:
@@ -65,14 +142,18 @@ def check_db_connection() -> tuple[bool, str]:
     """
     try:
         with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT 1 as check_value")
-                result = cursor.fetchone()
-                # RealDictCursor returns dict, not tuple
-                if result and result.get('check_value') == 1:
-                    return True, "Adatbázis kapcsolódás sikeres"
-                return False, "Adatbázis válasz hibás"
-    except psycopg2.OperationalError as e:
+            # Autocommit: a single round trip, no BEGIN/COMMIT around the probe
+            conn.autocommit = True
+            try:
+                result = conn.execute("SELECT 1 as check_value").fetchone()
+            finally:
+                # Pooled connection goes back to other callers: restore default
+                conn.autocommit = False
+            # dict_row returns dict, not tuple
+            if result and result.get('check_value') == 1:
+                return True, "Adatbázis kapcsolódás sikeres"
+            return False, "Adatbázis válasz hibás"
+    except psycopg.OperationalError as e:
         error_msg = f"Adatbázis kapcsolódás sikertelen! Hiba: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
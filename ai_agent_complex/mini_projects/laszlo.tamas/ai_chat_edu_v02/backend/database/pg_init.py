@@ -69,6 +69,12 @@ def init_postgres_schema():
             """)
             logger.info("Users table created or already exists")
             
+            # Index for per-tenant user lookups (tenant cache invalidation)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_users_tenant
+                ON users(tenant_id)
+            """)
+            
             # Check if we need to seed user data
             cursor.execute("SELECT COUNT(*) as count FROM users")
             result = cursor.fetchone()
@@ -206,6 +212,16 @@ def init_postgres_schema():
             """)
             logger.info("Documents table created or already exists")
             
+            # Hash of the uploaded file, used to skip re-processing duplicates
+            cursor.execute("""
+                ALTER TABLE documents
+                ADD COLUMN IF NOT EXISTS content_hash BYTEA
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_documents_tenant_content_hash
+                ON documents(tenant_id, content_hash)
+            """)
+            
             # Create document_chunks table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS document_chunks (
@@ -238,8 +254,10 @@ def init_postgres_schema():
             logger.info("Document chunks table created or already exists")
             
             # Create user_prompt_cache table
+            # UNLOGGED: rebuildable cache, not source of truth - writes skip
+            # the WAL and the table is emptied after a crash
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_prompt_cache (
+                CREATE UNLOGGED TABLE IF NOT EXISTS user_prompt_cache (
                     id BIGSERIAL PRIMARY KEY,
                     user_id BIGINT NOT NULL,
                     cached_prompt TEXT NOT NULL,
@@ -257,6 +275,15 @@ def init_postgres_schema():
                 ON user_prompt_cache(user_id, created_at DESC)
             """)
             
+            # Tables created before it was UNLOGGED are converted once
+            cursor.execute("""
+                SELECT relpersistence FROM pg_class
+                WHERE oid = 'user_prompt_cache'::regclass
+            """)
+            if cursor.fetchone()['relpersistence'] == 'p':
+                cursor.execute("ALTER TABLE user_prompt_cache SET UNLOGGED")
+                logger.info("User prompt cache table converted to UNLOGGED")
+            
             logger.info("User prompt cache table created or already exists")
             
             conn.commit()
@@ -799,7 +826,7 @@ def get_unprocessed_sessions(older_than_hours: int = 24):
                 SELECT id, tenant_id, user_id, created_at
                 FROM chat_sessions
                 WHERE COALESCE(processed_for_ltm, FALSE) = FALSE
-                  AND created_at < NOW() - INTERVAL '%s hours'
+                  AND created_at < NOW() - make_interval(hours => %s)
                 ORDER BY created_at
             """, (older_than_hours,))
             rows = cursor.fetchall()
@@ -808,13 +835,18 @@ def get_unprocessed_sessions(older_than_hours: int = 24):
 
 # ===== SESSION MANAGEMENT FUNCTIONS (ChatGPT-style) =====
 
-def get_user_sessions(user_id: int, include_deleted: bool = False) -> list[dict]:
+def get_user_sessions(
+    user_id: int,
+    include_deleted: bool = False,
+    default_title: Optional[str] = None
+) -> list[dict]:
     """
     Get all sessions for a user, ordered by most recent activity.
     
     Args:
         user_id: User ID to fetch sessions for
         include_deleted: Whether to include soft-deleted sessions
+        default_title: Title returned for sessions with an empty/NULL title
     
     Returns:
         List of session dictionaries with title, message_count, last_message_at
@@ -825,10 +857,16 @@ def get_user_sessions(user_id: int, include_deleted: bool = False) -> list[dict]
             if not include_deleted:
                 where_clause += " AND COALESCE(cs.is_deleted, FALSE) = FALSE"
             
+            title_column = "cs.title"
+            params: list = [user_id]
+            if default_title is not None:
+                title_column = "COALESCE(NULLIF(cs.title, ''), %s) AS title"
+                params.insert(0, default_title)
+            
             cursor.execute(f"""
                 SELECT 
                     cs.id,
-                    cs.title,
+                    {title_column},
                     cs.created_at,
                     cs.last_message_at,
                     cs.is_deleted,
@@ -839,7 +877,7 @@ def get_user_sessions(user_id: int, include_deleted: bool = False) -> list[dict]
                 {where_clause}
                 GROUP BY cs.id
                 ORDER BY cs.last_message_at DESC
-            """, (user_id,))
+            """, params)
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
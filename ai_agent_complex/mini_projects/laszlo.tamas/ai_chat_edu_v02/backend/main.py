@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import json
@@ -9,8 +10,11 @@ from api.routes import router
 from api.document_endpoints import router as document_router
 from api.session_endpoints import router as session_router
 from api.websocket_endpoints import router as websocket_router
-from api.admin_endpoints import router as admin_router
+from api.admin_endpoints import router as admin_router, refresh_cache_stats
+from api.workflow_endpoints import UploadSizeLimitMiddleware
 from database.pg_init import init_postgres_schema
+from database.pg_connection import close_db_pool
+from services.qdrant_service import close_qdrant_client
 
 # Configure logging
 import sys
@@ -21,12 +25,17 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+log_handler = logging.StreamHandler(sys.stdout)
+# LOG_FORMAT=json: one JSON object per line (orjson) for log collectors
+if os.getenv("LOG_FORMAT", "text").lower() == "json":
+    from config.json_logging import JSONLogFormatter
+    log_handler.setFormatter(JSONLogFormatter())
+else:
+    log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
 logging.basicConfig(
     level=getattr(logging, log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[log_handler]
 )
 
 logger = logging.getLogger(__name__)
@@ -36,11 +45,21 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Initialize database on startup."""
     logger.info("Starting application...")
+    # Parse system.ini during startup instead of on the first request
+    from services.config_service import get_config_service
+    get_config_service()
     # Initialize PostgreSQL schema
     init_postgres_schema()
     logger.info("PostgreSQL schema initialized")
+    # Prefetch admin cache stats in the background
+    app.state.cache_stats = None
+    app.state.cache_stats_generation = 0
+    stats_task = asyncio.create_task(refresh_cache_stats(app))
     yield
     logger.info("Shutting down application...")
+    stats_task.cancel()
+    close_db_pool()
+    await close_qdrant_client()
 
 
 # Load version from system.ini
@@ -63,6 +82,10 @@ app = FastAPI(
     default_response_class=ORJSONResponse  # Use ORJSON for proper UTF-8 handling
 )
 
+# Reject oversized document uploads before the body is read
+# (added before CORS so the 413 still gets CORS headers)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Configure CORS - Local development only
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +40,10 @@ class CacheControl:
         """Check if OpenAI LLM prompt cache (Tier 4) is enabled."""
         return self.config.get_bool('cache', 'ENABLE_LLM_CACHE', default=False)
     
+    def get_browser_cache_max_age(self) -> int:
+        """Get browser cache max-age in seconds (Cache-Control header)."""
+        return self.config.get_int('cache', 'BROWSER_CACHE_MAX_AGE_SECONDS', default=300)
+    
     def get_memory_cache_ttl(self) -> int:
         """Get memory cache TTL in seconds."""
         return self.config.get_int('cache', 'MEMORY_CACHE_TTL_SECONDS', default=3600)
@@ -161,19 +165,9 @@ class CacheControl:
         }
         
         try:
-            # Clear memory cache
-            if self.is_memory_cache_enabled():
-                memory_keys = [
-                    f"system_prompt:{user_id}",
-                    f"user:{user_id}"
-                ]
-                for key in memory_keys:
-                    if hasattr(self.cache, 'invalidate'):
-                        self.cache.invalidate(key)
-                        result["memory_cleared"] += 1
-                        logger.info(f"🗑️ Memory cache cleared: {key}")
-            
-            # Clear DB cache
+            # DB tier first: memory misses are refilled from it, so clearing
+            # memory first lets a concurrent chat request re-cache the stale
+            # prompt for another hour
             if self.is_db_cache_enabled():
                 with get_db_connection() as conn:
                     with conn.cursor() as cursor:
@@ -185,6 +179,10 @@ class CacheControl:
                         conn.commit()
                         logger.info(f"🗑️ DB cache cleared for user {user_id}: {cursor.rowcount} entries")
             
+            # Then memory cache
+            if self.is_memory_cache_enabled():
+                result["memory_cleared"] = self._invalidate_user_memory(user_id)
+            
             return result
             
         except Exception as e:
@@ -192,6 +190,20 @@ class CacheControl:
             result["error"] = str(e)
             return result
     
+    def _invalidate_user_memory(self, user_id: int) -> int:
+        """Remove a user's in-memory cache entries; returns the number of keys."""
+        if not hasattr(self.cache, 'invalidate'):
+            return 0
+        
+        memory_keys = [
+            f"system_prompt:{user_id}",
+            f"user:{user_id}"
+        ]
+        for key in memory_keys:
+            self.cache.invalidate(key)
+            logger.info(f"🗑️ Memory cache cleared: {key}")
+        return len(memory_keys)
+    
     def invalidate_tenant(self, tenant_id: int) -> Dict[str, Any]:
         """
         Invalidate all caches for a tenant and its users.
@@ -210,24 +222,36 @@ class CacheControl:
         }
         
         try:
-            # Get all users in tenant
             with get_db_connection() as conn:
                 with conn.cursor() as cursor:
+                    # Get all users in tenant (needed for their memory keys)
                     cursor.execute(
                         "SELECT user_id FROM users WHERE tenant_id = %s",
                         (tenant_id,)
                     )
-                    users = cursor.fetchall()
-            
-            # Invalidate each user
-            for user in users:
-                user_result = self.invalidate_user(user['user_id'])
-                result["users_affected"] += 1
-                result["memory_cleared"] += user_result.get("memory_cleared", 0)
-                result["db_cleared"] += user_result.get("db_cleared", 0)
+                    user_ids = [row['user_id'] for row in cursor.fetchall()]
+                    result["users_affected"] = len(user_ids)
+                    
+                    # Clear DB cache for all of them in one statement
+                    if self.is_db_cache_enabled():
+                        cursor.execute(
+                            """
+                            DELETE FROM user_prompt_cache
+                            WHERE user_id IN (
+                                SELECT user_id FROM users WHERE tenant_id = %s
+                            )
+                            """,
+                            (tenant_id,)
+                        )
+                        result["db_cleared"] = cursor.rowcount
+                        conn.commit()
+                        logger.info(f"🗑️ DB cache cleared for tenant {tenant_id}: {cursor.rowcount} entries")
             
-            # Clear tenant cache
+            # Clear memory cache for each user and the tenant
             if self.is_memory_cache_enabled():
+                for user_id in user_ids:
+                    result["memory_cleared"] += self._invalidate_user_memory(user_id)
+                
                 tenant_key = f"tenant:{tenant_id}"
                 if hasattr(self.cache, 'invalidate'):
                     self.cache.invalidate(tenant_key)
@@ -255,22 +279,26 @@ class CacheControl:
         }
         
         try:
-            # Clear memory cache
+            # Clear DB cache first
+            if self.is_db_cache_enabled():
+                with get_db_connection() as conn:
+                    with conn.cursor() as cursor:
+                        # TRUNCATE instead of a row-by-row DELETE; the lock keeps
+                        # the count exact until the truncate commits
+                        cursor.execute("LOCK TABLE user_prompt_cache IN ACCESS EXCLUSIVE MODE")
+                        cursor.execute("SELECT COUNT(*) AS count FROM user_prompt_cache")
+                        result["db_cleared"] = cursor.fetchone()['count']
+                        cursor.execute("TRUNCATE user_prompt_cache")
+                        conn.commit()
+                        logger.warning(f"🗑️ ALL DB cache cleared! ({result['db_cleared']} entries)")
+            
+            # Memory cache last (it is refilled from the DB tier)
             if self.is_memory_cache_enabled():
                 if hasattr(self.cache, 'clear'):
                     self.cache.clear()
                     result["memory_cleared"] = True
                     logger.warning("🗑️ ALL memory cache cleared!")
             
-            # Clear DB cache
-            if self.is_db_cache_enabled():
-                with get_db_connection() as conn:
-                    with conn.cursor() as cursor:
-                        cursor.execute("DELETE FROM user_prompt_cache")
-                        result["db_cleared"] = cursor.rowcount
-                        conn.commit()
-                        logger.warning(f"🗑️ ALL DB cache cleared! ({cursor.rowcount} entries)")
-            
             return result
             
         except Exception as e:
@@ -3,9 +3,13 @@ Simple in-memory cache for tenant and user data.
 Reduces PostgreSQL query overhead for frequently accessed data.
 P0.17: Now respects ENABLE_MEMORY_CACHE from system.ini
 """
+import heapq
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +17,52 @@ logger = logging.getLogger(__name__)
 class SimpleCache:
     """Thread-safe in-memory cache with TTL support."""
     
-    def __init__(self, default_ttl_seconds: int = 300, dev_mode: bool = False):
+    # Timer wheel: expiry times are bucketed into WHEEL_SLOTS slots of
+    # default_ttl / SLOTS_PER_TTL seconds each, so cleanup only visits the
+    # keys whose slots have passed instead of every entry
+    WHEEL_SLOTS = 512
+    SLOTS_PER_TTL = 256
+    
+    def __init__(
+        self,
+        default_ttl_seconds: int = 300,
+        dev_mode: bool = False,
+        max_entries: int = 10_000
+    ):
         """
         Initialize cache.
         
         Args:
             default_ttl_seconds: Default time-to-live in seconds (default: 5 minutes)
             dev_mode: If True, cache is disabled (always returns None)
+            max_entries: Size bound; when full, the entry closest to expiry is evicted
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self.default_ttl = timedelta(seconds=default_ttl_seconds)
+        # key -> (expires_at as time.monotonic_ns(), value)
+        self._cache: Dict[str, Tuple[int, Any]] = {}
+        self.default_ttl = default_ttl_seconds
         self.dev_mode = dev_mode
+        self.max_entries = max_entries
+        
+        # Guards all mutations of _cache, _expiry_heap and _wheel.
+        # Reads (get hits) stay lock-free: dict.get is atomic in CPython.
+        self._lock = threading.Lock()
+        
+        # (expires_at, key) min-heap for eviction; stale items are skipped lazily
+        self._expiry_heap: List[Tuple[int, str]] = []
+        
+        self._slot_width_ns = max(default_ttl_seconds * 1_000_000_000 // self.SLOTS_PER_TTL, 1_000_000)
+        self._wheel: List[Set[str]] = [set() for _ in range(self.WHEEL_SLOTS)]
+        self._swept_tick = self._tick(time.monotonic_ns())
         
         if dev_mode:
             logger.warning("⚠️ DEV_MODE=true - Cache DISABLED")
         else:
             logger.info(f"Cache initialized with TTL: {default_ttl_seconds}s")
     
+    def _tick(self, at_ns: int) -> int:
+        """Absolute wheel tick for a time.monotonic_ns() timestamp."""
+        return at_ns // self._slot_width_ns
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
@@ -44,19 +77,23 @@ class SimpleCache:
         if self.dev_mode:
             return None
         
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
         
-        entry = self._cache[key]
-        
         # Check if expired
-        if datetime.now() > entry["expires_at"]:
-            logger.info(f"⏰ Cache expired: {key}")
-            del self._cache[key]
+        if time.monotonic_ns() > entry[0]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cache expired: %s", key)
+            with self._lock:
+                # Only drop the entry we saw, not one re-set meanwhile
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
             return None
         
-        logger.info(f"✅ Cache hit: {key}")
-        return entry["value"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache hit: %s", key)
+        return entry[1]
     
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
         """
@@ -71,15 +108,41 @@ class SimpleCache:
         if self.dev_mode:
             return
         
-        ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else self.default_ttl
-        expires_at = datetime.now() + ttl
+        # Keys come from a small pool (tenant:<id>, user:<id>, ...); interning
+        # lets the dict, wheel slot and heap items share one string object
+        # across repeated sets of the same key
+        key = sys.intern(key)
+        ttl = ttl_seconds if ttl_seconds else self.default_ttl
+        expires_at = time.monotonic_ns() + ttl * 1_000_000_000
         
-        self._cache[key] = {
-            "value": value,
-            "expires_at": expires_at
-        }
+        with self._lock:
+            self._cache[key] = (expires_at, value)
+            self._wheel[self._tick(expires_at) % self.WHEEL_SLOTS].add(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            
+            if len(self._cache) > self.max_entries:
+                self._evict_min_ttl()
+            elif len(self._expiry_heap) > 2 * self.max_entries:
+                self._rebuild_heap()
         
-        logger.info(f"💾 Cache set: {key} (expires: {expires_at.strftime('%H:%M:%S')})")
+        if logger.isEnabledFor(logging.DEBUG):
+            expires_wall = datetime.fromtimestamp(time.time() + ttl)
+            logger.debug("Cache set: %s (expires: %s)", key, expires_wall.strftime('%H:%M:%S'))
+    
+    def _evict_min_ttl(self):
+        """Evict entries with the least remaining TTL until back within max_entries (caller holds _lock)."""
+        heap = self._expiry_heap
+        while len(self._cache) > self.max_entries and heap:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._cache[key]
+                logger.debug("Cache evicted (full): %s", key)
+    
+    def _rebuild_heap(self):
+        """Drop heap items left behind by overwritten or removed keys (caller holds _lock)."""
+        self._expiry_heap = [(entry[0], key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
     
     def invalidate(self, key: str):
         """
@@ -88,28 +151,47 @@ class SimpleCache:
         Args:
             key: Cache key to remove
         """
-        if key in self._cache:
-            del self._cache[key]
+        # The key's wheel slot is left as is; cleanup skips missing keys
+        with self._lock:
+            removed = self._cache.pop(key, None)
+        if removed is not None:
             logger.info(f"🗑️ Cache invalidated: {key}")
     
     def clear(self):
         """Clear all cached entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
+            for slot in self._wheel:
+                slot.clear()
         logger.info("Cache cleared")
     
     def cleanup_expired(self):
-        """Remove all expired entries from cache."""
-        now = datetime.now()
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if now > entry["expires_at"]
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+        """Remove expired entries, visiting only the wheel slots passed since the last sweep."""
+        now = time.monotonic_ns()
+        now_tick = self._tick(now)
+        removed = 0
+        
+        with self._lock:
+            first_tick = max(self._swept_tick + 1, now_tick - self.WHEEL_SLOTS + 1)
+            for tick in range(first_tick, now_tick + 1):
+                slot = self._wheel[tick % self.WHEEL_SLOTS]
+                for key in list(slot):
+                    entry = self._cache.get(key)
+                    if entry is None:
+                        slot.discard(key)  # Invalidated or already removed
+                    elif entry[0] <= now:
+                        del self._cache[key]
+                        slot.discard(key)
+                        removed += 1
+                    elif self._tick(entry[0]) % self.WHEEL_SLOTS != tick % self.WHEEL_SLOTS:
+                        slot.discard(key)  # Re-set with a different expiry
+                    # else: expires in a later round of the wheel; keep
+            
+            self._swept_tick = max(self._swept_tick, now_tick)
+        
+        if removed:
+            logger.info(f"Cleaned up {removed} expired cache entries")
 
 
 class DummyCache:
@@ -167,11 +249,23 @@ def get_context_cache() -> SimpleCache:
         else:
             # Get TTL from config
             ttl = config.get_int('cache', 'MEMORY_CACHE_TTL_SECONDS', default=3600)
-            _context_cache = SimpleCache(default_ttl_seconds=ttl, dev_mode=False)
-            logger.info(f"✅ Memory cache ENABLED (TTL: {ttl}s)")
+            max_entries = config.get_int('cache', 'MEMORY_CACHE_MAX_ENTRIES', default=10_000)
+            _context_cache = SimpleCache(
+                default_ttl_seconds=ttl,
+                dev_mode=False,
+                max_entries=max_entries
+            )
+            logger.info(f"✅ Memory cache ENABLED (TTL: {ttl}s, max entries: {max_entries})")
     
     return _context_cache
 
 
-# Alias for backward compatibility - call the function to get the cache instance
-simple_cache = get_context_cache()
+def __getattr__(name: str):
+    """
+    Lazy module attribute (PEP 562): `simple_cache` is a backward-compatible
+    alias for get_context_cache(), built on first access instead of at import
+    so importing this module does not load system.ini.
+    """
+    if name == "simple_cache":
+        return get_context_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
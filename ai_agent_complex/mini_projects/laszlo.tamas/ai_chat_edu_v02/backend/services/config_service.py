@@ -1,17 +1,56 @@
 """Configuration service for system.ini."""
 
 import os
-import configparser
+import functools
+import threading
 from pathlib import Path
 from typing import Optional
 import logging
 
+from config.fast_ini import load_ini, to_bool
+
 logger = logging.getLogger(__name__)
 
 
 class ConfigService:
     """Service for reading system.ini configuration."""
     
+    # Typed settings resolved once in __init__ and exposed as attributes:
+    # (attribute, section, key, type, default)
+    _SCHEMA = (
+        # Application
+        ('system_prompt', 'application', 'system_prompt', str, 'Te egy hasznos AI asszisztens vagy.'),
+        ('dev_mode', 'development', 'DEV_MODE', bool, False),
+        # RAG
+        ('chunking_strategy', 'rag', 'CHUNKING_STRATEGY', str, 'recursive'),
+        ('chunk_size_tokens', 'rag', 'CHUNK_SIZE_TOKENS', int, 500),
+        ('chunk_overlap_tokens', 'rag', 'CHUNK_OVERLAP_TOKENS', int, 50),
+        ('embedding_dimensions', 'rag', 'EMBEDDING_DIMENSIONS', int, 3072),
+        ('embedding_batch_size', 'rag', 'EMBEDDING_BATCH_SIZE', int, 100),
+        ('embedding_max_concurrency', 'rag', 'EMBEDDING_MAX_CONCURRENCY', int, 4),
+        ('top_k_documents', 'rag', 'TOP_K_DOCUMENTS', int, 5),
+        ('min_score_threshold', 'rag', 'MIN_SCORE_THRESHOLD', float, 0.7),
+        ('qdrant_search_limit', 'rag', 'QDRANT_SEARCH_LIMIT', int, 10),
+        ('qdrant_search_offset', 'rag', 'QDRANT_SEARCH_OFFSET', int, 0),
+        ('qdrant_upload_batch_size', 'rag', 'QDRANT_UPLOAD_BATCH_SIZE', int, 50),
+        ('qdrant_upload_max_concurrency', 'rag', 'QDRANT_UPLOAD_MAX_CONCURRENCY', int, 2),
+        # LLM
+        ('max_tokens', 'llm', 'CHAT_MAX_TOKENS', int, 500),
+        ('temperature', 'llm', 'CHAT_TEMPERATURE', float, 0.7),
+        # Memory
+        ('longterm_chat_storage_enabled', 'memory', 'ENABLE_LONGTERM_CHAT_STORAGE', bool, False),
+        ('longterm_chat_retrieval_enabled', 'memory', 'ENABLE_LONGTERM_CHAT_RETRIEVAL', bool, False),
+        ('session_summary_max_tokens', 'memory', 'CHAT_SUMMARY_MAX_TOKENS', int, 200),
+        ('min_messages_for_consolidation', 'memory', 'MIN_MESSAGES_FOR_CONSOLIDATION', int, 5),
+        ('consolidate_after_messages', 'memory', 'CONSOLIDATE_AFTER_MESSAGES', int, 50),
+        ('top_k_long_term_memories', 'memory', 'TOP_K_LONG_TERM_MEMORIES', int, 3),
+        ('memory_score_threshold', 'memory', 'MEMORY_SCORE_THRESHOLD', float, 0.5),
+        # Limits
+        ('max_file_size_mb', 'limits', 'MAX_FILE_SIZE_MB', int, 10),
+        ('max_chunks_per_document', 'limits', 'MAX_CHUNKS_PER_DOCUMENT', int, 1000),
+        ('max_documents_per_user', 'limits', 'MAX_DOCUMENTS_PER_USER', int, 100),
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize config service.
@@ -25,13 +64,32 @@ class ConfigService:
             config_path = backend_dir / "config" / "system.ini"
         
         self.config_path = Path(config_path)
-        self.config = configparser.ConfigParser()
         
         if not self.config_path.exists():
             logger.warning(f"system.ini not found at {self.config_path}, using defaults")
+            self._data = {}
         else:
-            self.config.read(self.config_path, encoding='utf-8')
+            # {section: {lower-case key: raw value}}, shared with settings.py
+            self._data = load_ini(self.config_path)
             logger.info(f"Loaded system.ini from {self.config_path}")
+        
+        # Values never change for an instance (reload_config_service builds a
+        # new one), so each typed lookup is converted once and memoized
+        self.get = functools.lru_cache(maxsize=256)(self.get)
+        self.get_int = functools.lru_cache(maxsize=256)(self.get_int)
+        self.get_float = functools.lru_cache(maxsize=256)(self.get_float)
+        self.get_bool = functools.lru_cache(maxsize=256)(self.get_bool)
+        
+        typed_getters = {str: self.get, int: self.get_int, float: self.get_float, bool: self.get_bool}
+        for name, section, key, value_type, default in self._SCHEMA:
+            setattr(self, name, typed_getters[value_type](section, key, default))
+    
+    def _raw(self, section: str, key: str) -> Optional[str]:
+        """Raw string value, or None if the section/key is missing."""
+        try:
+            return self._data[section][key.lower()]
+        except KeyError:
+            return None
     
     def get(self, section: str, key: str, default: str = "") -> str:
         """
@@ -45,33 +103,33 @@ class ConfigService:
         Returns:
             Configuration value as string
         """
-        try:
-            return self.config.get(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        value = self._raw(section, key)
+        if value is None:
             logger.debug(f"Config {section}.{key} not found, using default: {default}")
             return default
+        return value
     
     def get_int(self, section: str, key: str, default: int = 0) -> int:
         """Get an integer value from config."""
         try:
-            return self.config.getint(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return int(self._raw(section, key))
+        except (TypeError, ValueError):
             logger.debug(f"Config {section}.{key} not found, using default: {default}")
             return default
     
     def get_float(self, section: str, key: str, default: float = 0.0) -> float:
         """Get a float value from config."""
         try:
-            return self.config.getfloat(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return float(self._raw(section, key))
+        except (TypeError, ValueError):
             logger.debug(f"Config {section}.{key} not found, using default: {default}")
             return default
     
     def get_bool(self, section: str, key: str, default: bool = False) -> bool:
         """Get a boolean value from config."""
         try:
-            return self.config.getboolean(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return to_bool(self._raw(section, key))
+        except (AttributeError, ValueError):
             logger.debug(f"Config {section}.{key} not found, using default: {default}")
             return default
     
@@ -79,26 +137,25 @@ class ConfigService:
     
     def get_system_prompt(self) -> str:
         """Get global system prompt."""
-        return self.get('application', 'system_prompt', 
-                       'Te egy hasznos AI asszisztens vagy.')
+        return self.system_prompt
     
     def is_dev_mode(self) -> bool:
         """Check if development mode is enabled (disables all caches)."""
-        return self.get_bool('development', 'DEV_MODE', False)
+        return self.dev_mode
     
     # === RAG SETTINGS ===
     
     def get_chunking_strategy(self) -> str:
         """Get chunking strategy (e.g., 'recursive')."""
-        return self.get('rag', 'CHUNKING_STRATEGY', 'recursive')
+        return self.chunking_strategy
     
     def get_chunk_size_tokens(self) -> int:
         """Get chunk size in tokens."""
-        return self.get_int('rag', 'CHUNK_SIZE_TOKENS', 500)
+        return self.chunk_size_tokens
     
     def get_chunk_overlap_tokens(self) -> int:
         """Get chunk overlap in tokens."""
-        return self.get_int('rag', 'CHUNK_OVERLAP_TOKENS', 50)
+        return self.chunk_overlap_tokens
     
     def get_embedding_model(self) -> str:
         """Get embedding model name from environment variable."""
@@ -106,31 +163,39 @@ class ConfigService:
     
     def get_embedding_dimensions(self) -> int:
         """Get embedding vector dimensions."""
-        return self.get_int('rag', 'EMBEDDING_DIMENSIONS', 3072)
+        return self.embedding_dimensions
     
     def get_embedding_batch_size(self) -> int:
         """Get max batch size for embedding API calls."""
-        return self.get_int('rag', 'EMBEDDING_BATCH_SIZE', 100)
+        return self.embedding_batch_size
+    
+    def get_embedding_max_concurrency(self) -> int:
+        """Get max number of embedding batches requested in parallel."""
+        return max(1, self.embedding_max_concurrency)
     
     def get_top_k_documents(self) -> int:
         """Get top-K documents to retrieve."""
-        return self.get_int('rag', 'TOP_K_DOCUMENTS', 5)
+        return self.top_k_documents
     
     def get_min_score_threshold(self) -> float:
         """Get minimum similarity score threshold."""
-        return self.get_float('rag', 'MIN_SCORE_THRESHOLD', 0.7)
+        return self.min_score_threshold
     
     def get_qdrant_search_limit(self) -> int:
         """Get Qdrant search limit (max results to fetch)."""
-        return self.get_int('rag', 'QDRANT_SEARCH_LIMIT', 10)
+        return self.qdrant_search_limit
     
     def get_qdrant_search_offset(self) -> int:
         """Get Qdrant search offset."""
-        return self.get_int('rag', 'QDRANT_SEARCH_OFFSET', 0)
+        return self.qdrant_search_offset
     
     def get_qdrant_upload_batch_size(self) -> int:
         """Get Qdrant upload batch size (to avoid payload size limit)."""
-        return self.get_int('rag', 'QDRANT_UPLOAD_BATCH_SIZE', 50)
+        return self.qdrant_upload_batch_size
+    
+    def get_qdrant_upload_max_concurrency(self) -> int:
+        """Get max number of Qdrant upload batches sent in parallel."""
+        return max(1, self.qdrant_upload_max_concurrency)
     
     # === LLM SETTINGS ===
     
@@ -140,64 +205,82 @@ class ConfigService:
     
     def get_max_tokens(self) -> int:
         """Get max tokens for LLM response."""
-        return self.get_int('llm', 'CHAT_MAX_TOKENS', 500)
+        return self.max_tokens
     
     def get_temperature(self) -> float:
         """Get LLM temperature."""
-        return self.get_float('llm', 'CHAT_TEMPERATURE', 0.7)
+        return self.temperature
     
     # === MEMORY SETTINGS ===
     
     def is_longterm_chat_storage_enabled(self) -> bool:
         """Check if long-term chat memory storage is enabled."""
-        return self.get_bool('memory', 'ENABLE_LONGTERM_CHAT_STORAGE', False)
+        return self.longterm_chat_storage_enabled
     
     def is_longterm_chat_retrieval_enabled(self) -> bool:
         """Check if long-term chat memory retrieval is enabled."""
-        return self.get_bool('memory', 'ENABLE_LONGTERM_CHAT_RETRIEVAL', False)
+        return self.longterm_chat_retrieval_enabled
     
     def get_session_summary_max_tokens(self) -> int:
         """Get max tokens for session summary."""
-        return self.get_int('memory', 'CHAT_SUMMARY_MAX_TOKENS', 200)
+        return self.session_summary_max_tokens
     
     def get_min_messages_for_consolidation(self) -> int:
         """Get minimum messages required for memory consolidation."""
-        return self.get_int('memory', 'MIN_MESSAGES_FOR_CONSOLIDATION', 5)
+        return self.min_messages_for_consolidation
     
     def get_consolidate_after_messages(self) -> int:
         """Get message threshold for consolidation trigger."""
-        return self.get_int('memory', 'CONSOLIDATE_AFTER_MESSAGES', 50)
+        return self.consolidate_after_messages
     
     def get_top_k_long_term_memories(self) -> int:
         """Get how many previous session summaries to retrieve."""
-        return self.get_int('memory', 'TOP_K_LONG_TERM_MEMORIES', 3)
+        return self.top_k_long_term_memories
     
     def get_memory_score_threshold(self) -> float:
         """Get minimum similarity score for relevant memories."""
-        return self.get_float('memory', 'MEMORY_SCORE_THRESHOLD', 0.5)
+        return self.memory_score_threshold
     
     # === LIMITS ===
     
     def get_max_file_size_mb(self) -> int:
         """Get max file upload size in MB."""
-        return self.get_int('limits', 'MAX_FILE_SIZE_MB', 10)
+        return self.max_file_size_mb
     
     def get_max_chunks_per_document(self) -> int:
         """Get max chunks per document."""
-        return self.get_int('limits', 'MAX_CHUNKS_PER_DOCUMENT', 1000)
+        return self.max_chunks_per_document
     
     def get_max_documents_per_user(self) -> int:
         """Get max documents per user."""
-        return self.get_int('limits', 'MAX_DOCUMENTS_PER_USER', 100)
+        return self.max_documents_per_user
 
 
 # Singleton instance
 _config_service: Optional[ConfigService] = None
+_config_service_lock = threading.Lock()
 
 
 def get_config_service() -> ConfigService:
     """Get singleton config service instance."""
     global _config_service
     if _config_service is None:
-        _config_service = ConfigService()
+        with _config_service_lock:
+            # Concurrent first callers parse system.ini only once
+            if _config_service is None:
+                _config_service = ConfigService()
     return _config_service
+
+
+@functools.lru_cache(maxsize=1)
+def is_dev_mode() -> bool:
+    """DEV_MODE from system.ini, read once (changing it requires a restart)."""
+    return get_config_service().is_dev_mode()
+
+
+def reload_config_service() -> None:
+    """Drop the singleton so the next call re-reads system.ini."""
+    global _config_service
+    with _config_service_lock:
+        _config_service = None
+    is_dev_mode.cache_clear()
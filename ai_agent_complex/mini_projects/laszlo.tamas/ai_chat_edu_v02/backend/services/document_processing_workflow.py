@@ -16,6 +16,7 @@ START → validate_file → extract_content → store_document
       → verify_completion → END
 """
 
+import asyncio
 import logging
 from typing import TypedDict, List, Optional, Dict, Any, Literal
 from langgraph.graph import StateGraph, END
@@ -41,6 +42,7 @@ class DocumentProcessingState(TypedDict, total=False):
     tenant_id: int
     user_id: int
     visibility: Literal["private", "tenant"]
+    content_hash: Optional[bytes]  # Digest of content_bytes (duplicate detection)
     
     # Intermediate
     extracted_text: Optional[str]
@@ -213,7 +215,7 @@ class DocumentProcessingWorkflow:
         Node 2: Extract text content from file bytes.
         
         Supports:
-        - PDF (PyPDF2)
+        - PDF (pypdf)
         - TXT (UTF-8 detection)
         - MD (UTF-8)
         """
@@ -248,7 +250,8 @@ class DocumentProcessingWorkflow:
                 visibility=state["visibility"],
                 source="upload",
                 title=state["filename"],
-                content=state["extracted_text"]
+                content=state["extracted_text"],
+                content_hash=state.get("content_hash")
             )
             
             logger.info(f"[NODE: store_document] ✅ Document stored: id={doc_id}")
@@ -279,7 +282,7 @@ class DocumentProcessingWorkflow:
             logger.error(f"[NODE: chunk_document] ❌ Error: {e}", exc_info=True)
             return {"error": f"Chunking failed: {str(e)}", "status": "failed"}
     
-    def _generate_embeddings_node(self, state: DocumentProcessingState) -> DocumentProcessingState:
+    async def _generate_embeddings_node(self, state: DocumentProcessingState) -> DocumentProcessingState:
         """
         Node 5: Generate embeddings for all chunks.
         """
@@ -287,7 +290,9 @@ class DocumentProcessingWorkflow:
         
         try:
             # Fetch chunks
-            chunks = self.chunk_repo.get_chunks_not_embedded(
+            # Blocking DB call: keep it off the event loop
+            chunks = await asyncio.to_thread(
+                self.chunk_repo.get_chunks_not_embedded,
                 document_id=state["document_id"]
             )
             
@@ -297,7 +302,7 @@ class DocumentProcessingWorkflow:
                 return state
             
             # Generate embeddings
-            embedded_chunks = self.embedding_service.generate_embeddings_for_chunks(chunks)
+            embedded_chunks = await self.embedding_service.generate_embeddings_for_chunks(chunks)
             
             logger.info(f"[NODE: generate_embeddings] ✅ Generated {len(embedded_chunks)} embeddings")
             
@@ -312,7 +317,7 @@ class DocumentProcessingWorkflow:
             logger.error(f"[NODE: generate_embeddings] ❌ Error: {e}", exc_info=True)
             return {"error": f"Embedding generation failed: {str(e)}", "status": "failed"}
     
-    def _upsert_qdrant_node(self, state: DocumentProcessingState) -> DocumentProcessingState:
+    async def _upsert_qdrant_node(self, state: DocumentProcessingState) -> DocumentProcessingState:
         """
         Node 6: Upload embeddings to Qdrant with batching.
         """
@@ -322,13 +327,11 @@ class DocumentProcessingWorkflow:
             embedded_chunks = state.get("_embedded_chunks", [])
             original_chunks = state.get("_original_chunks", [])
             
-            # Prepare Qdrant data
+            # Prepare Qdrant data (join embeddings back to their chunks by id)
+            originals_by_id = {c["id"]: c for c in original_chunks}
             qdrant_data = []
             for embedded_chunk in embedded_chunks:
-                original = next(
-                    (c for c in original_chunks if c["id"] == embedded_chunk["chunk_id"]),
-                    None
-                )
+                original = originals_by_id.get(embedded_chunk["chunk_id"])
                 
                 if original:
                     qdrant_data.append({
@@ -342,13 +345,13 @@ class DocumentProcessingWorkflow:
                     })
             
             # Upsert to Qdrant (with automatic batching to avoid payload size limits)
-            qdrant_results = self.qdrant_service.upsert_document_chunks(
+            qdrant_results = await self.qdrant_service.upsert_document_chunks(
                 qdrant_data,
                 batch_size=self.qdrant_service.upload_batch_size
             )
             
             # Update PostgreSQL with point IDs
-            self.chunk_repo.update_chunks_embedding_batch(qdrant_results)
+            await asyncio.to_thread(self.chunk_repo.update_chunks_embedding_batch, qdrant_results)
             
             logger.info(f"[NODE: upsert_to_qdrant] ✅ Uploaded {len(qdrant_results)} vectors")
             return {"qdrant_point_ids": [r["qdrant_point_id"] for r in qdrant_results]}
@@ -452,7 +455,8 @@ class DocumentProcessingWorkflow:
         file_type: str,
         tenant_id: int,
         user_id: int,
-        visibility: Literal["private", "tenant"]
+        visibility: Literal["private", "tenant"],
+        content_hash: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Execute the full document processing workflow.
@@ -464,6 +468,7 @@ class DocumentProcessingWorkflow:
             tenant_id: Tenant ID
             user_id: User ID
             visibility: Document visibility level
+            content_hash: Digest of content, stored for duplicate detection
         
         Returns:
             {
@@ -482,6 +487,7 @@ class DocumentProcessingWorkflow:
             tenant_id=tenant_id,
             user_id=user_id,
             visibility=visibility,
+            content_hash=content_hash,
             extracted_text=None,
             document_id=None,
             chunk_ids=[],
@@ -495,7 +501,9 @@ class DocumentProcessingWorkflow:
         logger.info(f"[WORKFLOW] Starting document processing: {filename}")
         
         try:
-            final_state = self.graph.invoke(initial_state)
+            # ainvoke: async nodes run on the event loop, sync nodes in a
+            # worker thread, so the loop is not blocked by the pipeline
+            final_state = await self.graph.ainvoke(initial_state)
             
             logger.info(f"[WORKFLOW] Processing complete: status={final_state['status']}")
             
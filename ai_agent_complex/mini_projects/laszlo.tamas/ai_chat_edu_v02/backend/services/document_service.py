@@ -1,15 +1,19 @@
 """Document processing service."""
 
+import asyncio
 import logging
 from typing import Literal
-from PyPDF2 import PdfReader
-from io import BytesIO
-import chardet
+from pypdf import PdfReader
+from io import BytesIO, StringIO
+from charset_normalizer import from_bytes
 
 from database.document_repository import DocumentRepository
 
 logger = logging.getLogger(__name__)
 
+# Bytes inspected for encoding detection; enough for a reliable guess
+ENCODING_DETECTION_SAMPLE_BYTES = 64 * 1024
+
 
 class DocumentService:
     """Service for document upload and processing."""
@@ -45,8 +49,8 @@ class DocumentService:
         """
         logger.info(f"Processing document: {filename} ({file_type})")
         
-        # Extract text content based on file type
-        text_content = self._extract_content(content, file_type)
+        # Extract text content based on file type (CPU-bound: off the event loop)
+        text_content = await asyncio.to_thread(self._extract_content, content, file_type)
         
         if not text_content or not text_content.strip():
             raise ValueError("Document is empty or could not be read")
@@ -92,23 +96,36 @@ class DocumentService:
     
     def _extract_pdf(self, content: bytes) -> str:
         """Extract text from PDF bytes."""
-        pdf_file = BytesIO(content)
-        reader = PdfReader(pdf_file)
+        reader = PdfReader(BytesIO(content))
         
-        text_parts = []
+        # Write page text straight into one buffer (pages separated by "\n")
+        buffer = StringIO()
         for page in reader.pages:
             text = page.extract_text()
             if text:
-                text_parts.append(text)
+                if buffer.tell():
+                    buffer.write("\n")
+                buffer.write(text)
         
-        return "\n".join(text_parts)
+        return buffer.getvalue()
     
     def _extract_text(self, content: bytes) -> str:
         """Extract text from TXT/MD bytes using automatic encoding detection."""
-        # Use chardet to detect the actual encoding
-        detection = chardet.detect(content)
-        detected_encoding = detection.get('encoding')
-        confidence = detection.get('confidence', 0)
+        # Valid UTF-8 is decoded directly: strict decoding of the whole file
+        # cannot be fooled by a multi-byte sequence cut at the sample boundary
+        # (utf-8-sig also strips a leading BOM, if any)
+        try:
+            decoded = content.decode("utf-8-sig")
+            logger.info("Successfully decoded with utf-8")
+            return decoded
+        except UnicodeDecodeError:
+            pass
+        
+        # Detect the actual encoding (charset-normalizer) from a prefix sample;
+        # confidence is 1 - chaos (how "messy" the decoded sample looks)
+        best = from_bytes(content[:ENCODING_DETECTION_SAMPLE_BYTES]).best()
+        detected_encoding = best.encoding if best else None
+        confidence = 1.0 - best.chaos if best else 0.0
         
         logger.info(f"Detected encoding: {detected_encoding} (confidence: {confidence:.2f})")
         
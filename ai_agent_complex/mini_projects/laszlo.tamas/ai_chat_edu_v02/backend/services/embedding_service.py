@@ -1,9 +1,10 @@
 """Embedding generation service using OpenAI."""
 
+import asyncio
 import logging
 import os
-from typing import List, Dict
-from openai import OpenAI
+from typing import List, Dict, Optional
+from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +23,16 @@ class EmbeddingService:
         config = get_config_service()
         
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)  # Concurrent document batches
         self.model = config.get_embedding_model()  # Now reads from OPENAI_MODEL_EMBEDDING env
         self.batch_size = config.get_embedding_batch_size()
         self.dimensions = config.get_embedding_dimensions()
+        self.max_concurrency = config.get_embedding_max_concurrency()
         
         logger.info(
             f"EmbeddingService initialized: model={self.model}, "
-            f"batch_size={self.batch_size}, dimensions={self.dimensions}"
+            f"batch_size={self.batch_size}, dimensions={self.dimensions}, "
+            f"max_concurrency={self.max_concurrency}"
         )
     
     def generate_embedding(self, text: str) -> List[float]:
@@ -64,7 +68,7 @@ class EmbeddingService:
             logger.error(f"Embedding generation failed: {e}", exc_info=True)
             raise
     
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple texts in a single API call.
         
@@ -87,7 +91,7 @@ class EmbeddingService:
             raise ValueError("Texts cannot be empty")
         
         try:
-            response = self.client.embeddings.create(
+            response = await self.async_client.embeddings.create(
                 model=self.model,
                 input=texts,
                 encoding_format="float"
@@ -106,7 +110,7 @@ class EmbeddingService:
             logger.error(f"Batch embedding generation failed: {e}", exc_info=True)
             raise
     
-    def generate_embeddings_for_chunks(
+    async def generate_embeddings_for_chunks(
         self,
         chunks: List[Dict]
     ) -> List[Dict]:
@@ -126,43 +130,63 @@ class EmbeddingService:
         if not chunks:
             return []
         
-        results = []
         total_chunks = len(chunks)
+        batches = [
+            chunks[i:i + self.batch_size]
+            for i in range(0, total_chunks, self.batch_size)
+        ]
         
-        logger.info(f"Generating embeddings for {total_chunks} chunks")
+        logger.info(
+            f"Generating embeddings for {total_chunks} chunks "
+            f"in {len(batches)} batches"
+        )
         
-        # Process in batches
-        for i in range(0, total_chunks, self.batch_size):
-            batch = chunks[i:i + self.batch_size]
-            batch_texts = [chunk["content"] for chunk in batch]
-            batch_ids = [chunk["id"] for chunk in batch]
-            
-            try:
-                embeddings = self.generate_embeddings_batch(batch_texts)
-                
-                # Combine chunk IDs with embeddings
-                for chunk_id, embedding in zip(batch_ids, embeddings):
-                    results.append({
-                        "chunk_id": chunk_id,
-                        "embedding": embedding
-                    })
-                
-                logger.info(
-                    f"Batch {i // self.batch_size + 1}: "
-                    f"Processed {len(batch)} chunks "
-                    f"({len(results)}/{total_chunks} total)"
-                )
-            
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate embeddings for batch {i // self.batch_size + 1}: {e}"
-                )
-                # Skip failed chunks or raise - for now, skip
-                logger.warning(f"Skipping {len(batch)} chunks due to error")
+        # Batches are independent API calls; keep up to max_concurrency in flight
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(batch: List[Dict], batch_number: int) -> Optional[List[List[float]]]:
+            async with semaphore:
+                return await self._embed_chunk_batch(batch, batch_number)
+        
+        # gather() returns results in batch order
+        batch_embeddings = await asyncio.gather(
+            *(run(batch, number) for number, batch in enumerate(batches, start=1))
+        )
+        
+        # Combine chunk IDs with embeddings (in chunk order)
+        results = []
+        for batch, embeddings in zip(batches, batch_embeddings):
+            if embeddings is None:
                 continue
+            for chunk, embedding in zip(batch, embeddings):
+                results.append({
+                    "chunk_id": chunk["id"],
+                    "embedding": embedding
+                })
         
         logger.info(
             f"Embedding generation complete: {len(results)}/{total_chunks} successful"
         )
         
         return results
+    
+    async def _embed_chunk_batch(
+        self,
+        batch: List[Dict],
+        batch_number: int
+    ) -> Optional[List[List[float]]]:
+        """Embed one batch of chunks; returns None if the batch failed."""
+        try:
+            embeddings = await self.generate_embeddings_batch(
+                [chunk["content"] for chunk in batch]
+            )
+            logger.info(f"Batch {batch_number}: Processed {len(batch)} chunks")
+            return embeddings
+        
+        except Exception as e:
+            logger.error(
+                f"Failed to generate embeddings for batch {batch_number}: {e}"
+            )
+            # Skip failed chunks or raise - for now, skip
+            logger.warning(f"Skipping {len(batch)} chunks due to error")
+            return None
@@ -1,10 +1,12 @@
 """Qdrant vector database service."""
 
+import asyncio
 import logging
 import os
+import threading
 import uuid
-from typing import List, Dict
-from qdrant_client import QdrantClient
+from typing import List, Dict, Optional, Tuple
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,35 @@ COLLECTION_DOCUMENT_CHUNKS = f"{QDRANT_COLLECTION_PREFIX}_document_chunks"
 COLLECTION_LONG_TERM_MEMORIES = f"{QDRANT_COLLECTION_PREFIX}_longterm_chat_memory"
 COLLECTION_PRODUCT_KNOWLEDGE = f"{QDRANT_COLLECTION_PREFIX}_product_knowledge"
 
+QDRANT_URL = f"{'https' if QDRANT_USE_HTTPS else 'http'}://{QDRANT_HOST}:{QDRANT_PORT}"
+
+# One async client (and its HTTP connection pool) shared by every
+# QdrantService; closed from the app lifespan via close_qdrant_client()
+_async_client: Optional[AsyncQdrantClient] = None
+_async_client_lock = threading.Lock()
+
+
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """Create the shared AsyncQdrantClient on first use."""
+    global _async_client
+    if _async_client is None:
+        with _async_client_lock:
+            if _async_client is None:
+                _async_client = AsyncQdrantClient(
+                    url=QDRANT_URL,
+                    api_key=QDRANT_API_KEY
+                )
+    return _async_client
+
+
+async def close_qdrant_client() -> None:
+    """Close the shared async client (application shutdown)."""
+    global _async_client
+    with _async_client_lock:
+        client, _async_client = _async_client, None
+    if client is not None:
+        await client.close()
+
 
 class QdrantService:
     """Service for interacting with Qdrant vector database."""
@@ -43,18 +74,17 @@ class QdrantService:
         self.default_limit = config.get_top_k_documents()
         self.default_score_threshold = config.get_min_score_threshold()
         self.upload_batch_size = config.get_qdrant_upload_batch_size()
-        
-        # Build URL
-        protocol = "https" if QDRANT_USE_HTTPS else "http"
-        url = f"{protocol}://{QDRANT_HOST}:{QDRANT_PORT}"
+        self.upload_max_concurrency = config.get_qdrant_upload_max_concurrency()
         
         self.client = QdrantClient(
-            url=url,
+            url=QDRANT_URL,
             api_key=QDRANT_API_KEY
         )
+        # Used for concurrent document uploads from the async workflow
+        self.async_client = get_async_qdrant_client()
         
         logger.info(
-            f"QdrantService initialized: url={url}, "
+            f"QdrantService initialized: url={QDRANT_URL}, "
             f"prefix={QDRANT_COLLECTION_PREFIX}, "
             f"batch_size={self.upload_batch_size}"
         )
@@ -101,13 +131,16 @@ class QdrantService:
             logger.error(f"Failed to ensure collection {collection_name}: {e}")
             raise
     
-    def upsert_document_chunks(
+    async def upsert_document_chunks(
         self,
         chunks: List[Dict],
         batch_size: int = 50
     ) -> List[Dict]:
         """
-        Insert or update document chunks in Qdrant with batching.
+        Insert or update document chunks in Qdrant with concurrent batches.
+        
+        Up to upload_max_concurrency batch upserts are in flight at once; a
+        failed batch is retried once on its own before the upload fails.
         
         Args:
             chunks: List of dicts with:
@@ -129,63 +162,77 @@ class QdrantService:
             return []
         
         total_chunks = len(chunks)
-        logger.info(f"Upserting {total_chunks} chunks to Qdrant in batches of {batch_size}")
+        # Process in batches to avoid Qdrant payload size limit (32 MB)
+        batches = [
+            self._build_chunk_points(chunks[i:i + batch_size])
+            for i in range(0, total_chunks, batch_size)
+        ]
+        total_batches = len(batches)
+        logger.info(
+            f"Upserting {total_chunks} chunks to Qdrant in {total_batches} batches of {batch_size} "
+            f"(max {self.upload_max_concurrency} concurrent)"
+        )
         
-        all_results = []
+        semaphore = asyncio.Semaphore(self.upload_max_concurrency)
         
-        # Process in batches to avoid Qdrant payload size limit (32 MB)
-        for batch_start in range(0, total_chunks, batch_size):
-            batch_end = min(batch_start + batch_size, total_chunks)
-            batch = chunks[batch_start:batch_end]
-            
-            batch_num = (batch_start // batch_size) + 1
-            total_batches = (total_chunks + batch_size - 1) // batch_size
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} chunks)")
-            
-            points = []
-            batch_results = []
-            
-            for chunk in batch:
-                # Generate UUID for Qdrant point
-                point_id = str(uuid.uuid4())
-                
-                # Create point
-                point = PointStruct(
-                    id=point_id,
-                    vector=chunk["embedding"],
-                    payload={
-                        "chunk_id": chunk["chunk_id"],
-                        "tenant_id": chunk["tenant_id"],
-                        "document_id": chunk["document_id"],
-                        "user_id": chunk.get("user_id"),  # Document owner (None for tenant docs)
-                        "visibility": chunk.get("visibility", "tenant"),  # 'private' or 'tenant'
-                        "content_preview": chunk["content"][:200]  # First 200 chars
-                    }
-                )
-                
-                points.append(point)
-                batch_results.append({
-                    "chunk_id": chunk["chunk_id"],
-                    "qdrant_point_id": point_id
-                })
-            
-            try:
-                # Batch upsert
-                self.client.upsert(
+        async def upsert_batch(points: List[PointStruct]) -> None:
+            async with semaphore:
+                await self.async_client.upsert(
                     collection_name=COLLECTION_DOCUMENT_CHUNKS,
                     points=points
                 )
-                
-                logger.info(f"Successfully upserted batch {batch_num}/{total_batches} ({len(points)} points)")
-                all_results.extend(batch_results)
-                
+        
+        outcomes = await asyncio.gather(
+            *(upsert_batch(points) for points, _ in batches),
+            return_exceptions=True
+        )
+        
+        # Point IDs are fixed per batch, so a retry overwrites rather than duplicates
+        for batch_num, ((points, _), outcome) in enumerate(zip(batches, outcomes), start=1):
+            if not isinstance(outcome, Exception):
+                continue
+            logger.warning(f"Qdrant upsert failed for batch {batch_num}/{total_batches}, retrying: {outcome}")
+            try:
+                await upsert_batch(points)
             except Exception as e:
                 logger.error(f"Qdrant upsert failed for batch {batch_num}/{total_batches}: {e}", exc_info=True)
                 raise
         
+        all_results = [result for _, batch_results in batches for result in batch_results]
         logger.info(f"✅ All {total_chunks} chunks successfully uploaded to Qdrant")
         return all_results
     
+    def _build_chunk_points(self, batch: List[Dict]) -> Tuple[List[PointStruct], List[Dict]]:
+        """Build Qdrant points for one batch of chunks, plus their chunk_id -> point_id mapping."""
+        points = []
+        batch_results = []
+        
+        for chunk in batch:
+            # Generate UUID for Qdrant point
+            point_id = str(uuid.uuid4())
+            
+            # Create point
+            point = PointStruct(
+                id=point_id,
+                vector=chunk["embedding"],
+                payload={
+                    "chunk_id": chunk["chunk_id"],
+                    "tenant_id": chunk["tenant_id"],
+                    "document_id": chunk["document_id"],
+                    "user_id": chunk.get("user_id"),  # Document owner (None for tenant docs)
+                    "visibility": chunk.get("visibility", "tenant"),  # 'private' or 'tenant'
+                    "content_preview": chunk["content"][:200]  # First 200 chars
+                }
+            )
+            
+            points.append(point)
+            batch_results.append({
+                "chunk_id": chunk["chunk_id"],
+                "qdrant_point_id": point_id
+            })
+        
+        return points, batch_results
+    
     def search_document_chunks(
         self,
         query_vector: List[float],